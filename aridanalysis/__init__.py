@@ -1 +1,16 @@
 __version__ = '0.4.2'
+
+_FUNCTIONS = ['arid_eda', 'arid_linreg', 'arid_linreg_path', 'arid_logreg',
+              'arid_countreg', 'arid_bootstrap', 'LinregAccumulator']
+
+
+def __getattr__(name):
+    # PEP 562: only load the analysis module once a function is accessed
+    if name in _FUNCTIONS:
+        from . import aridanalysis
+        return getattr(aridanalysis, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + _FUNCTIONS)
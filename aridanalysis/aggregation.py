@@ -0,0 +1,234 @@
+import numpy as np
+import pandas as pd
+
+
+def nice_bin_edges(lo, hi, maxbins=10):
+    """
+    Compute evenly spaced bin edges with a "nice" step size, mirroring the
+    default behaviour of ``alt.Bin()``.
+
+    Parameters
+    ----------
+    lo : float
+        Smallest value that must be covered by the bins
+    hi : float
+        Largest value that must be covered by the bins
+    maxbins : int
+        The maximum number of bins to create
+
+    Returns
+    -------
+    numpy.ndarray
+        The bin edges, including both endpoints
+    """
+    if not np.isfinite(lo) or not np.isfinite(hi):
+        return np.array([0.0, 1.0])
+    if hi <= lo:
+        return np.array([lo - 0.5, lo + 0.5])
+
+    raw_step = (hi - lo) / maxbins
+    magnitude = 10 ** np.floor(np.log10(raw_step))
+    for multiple in [1, 2, 5, 10]:
+        step = multiple * magnitude
+        if step >= raw_step:
+            break
+
+    start = np.floor(lo / step) * step
+    stop = np.ceil(hi / step) * step
+    if stop <= start:
+        stop = start + step
+    nbins = int(round((stop - start) / step))
+    return start + step * np.arange(nbins + 1)
+
+
+def histogram_frame(values, maxbins=10, edges=None):
+    """
+    Bin a numeric array into counts so that only the aggregated bars need to
+    be embedded in a chart specification.
+
+    Parameters
+    ----------
+    values : array-like
+        The numeric values to bin. Missing values are ignored.
+    maxbins : int
+        The maximum number of bins when ``edges`` is not supplied
+    edges : array-like (optional)
+        Precomputed bin edges
+
+    Returns
+    -------
+    pandas.DataFrame
+        A dataframe with ``bin_start``, ``bin_end`` and ``count`` columns
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    if edges is None:
+        if len(values) == 0:
+            edges = nice_bin_edges(0.0, 1.0, maxbins)
+        else:
+            edges = nice_bin_edges(values.min(), values.max(), maxbins)
+    edges = np.asarray(edges, dtype=np.float64)
+
+    counts, _ = np.histogram(values, bins=edges)
+    return pd.DataFrame({'bin_start': edges[:-1],
+                         'bin_end': edges[1:],
+                         'count': counts})
+
+
+def kde_bandwidth(n, std, iqr):
+    """
+    Estimate a Gaussian kernel bandwidth using the same normal reference rule
+    as the Vega density transform.
+
+    Parameters
+    ----------
+    n : int or numpy.ndarray
+        The number of observations
+    std : float or numpy.ndarray
+        The sample standard deviation
+    iqr : float or numpy.ndarray
+        The interquartile range
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The estimated bandwidth
+    """
+    spread = np.minimum(std, np.asarray(iqr) / 1.34)
+    spread = np.where(spread > 0, spread, std)
+    return 1.06 * spread * np.power(np.maximum(n, 1), -0.2)
+
+
+def density_from_counts(centers, counts, grid, bandwidth):
+    """
+    Evaluate a Gaussian kernel density estimate from binned counts.
+
+    Parameters
+    ----------
+    centers : numpy.ndarray
+        The centers of the fine bins, shape (m,)
+    counts : numpy.ndarray
+        The counts in each fine bin, shape (m,)
+    grid : numpy.ndarray
+        The points at which the density is evaluated, shape (s,)
+    bandwidth : float
+        The kernel bandwidth
+
+    Returns
+    -------
+    numpy.ndarray
+        The density evaluated at each grid point, shape (s,)
+    """
+    total = counts.sum()
+    if total == 0 or not bandwidth > 0:
+        return np.zeros(len(grid))
+    z = (grid[:, None] - centers[None, :]) / bandwidth
+    kernel = np.exp(-0.5 * z * z)
+    return kernel @ counts / (total * bandwidth * np.sqrt(2 * np.pi))
+
+
+def binned_density(centers, counts, std, grid):
+    """
+    Evaluate a Gaussian kernel density estimate for one group of binned data,
+    estimating the bandwidth from the counts and the exact standard deviation.
+
+    Parameters
+    ----------
+    centers : numpy.ndarray
+        The evenly spaced centers of the fine bins, shape (m,)
+    counts : numpy.ndarray
+        The counts in each fine bin, shape (m,)
+    std : float
+        The sample standard deviation of the group
+    grid : numpy.ndarray
+        The points at which the density is evaluated, shape (s,)
+
+    Returns
+    -------
+    numpy.ndarray
+        The density evaluated at each grid point, shape (s,)
+    """
+    n = counts.sum()
+    width = centers[1] - centers[0] if len(centers) > 1 else 1.0
+
+    # Quartiles are read off the fine-bin cumulative counts
+    cum = np.cumsum(counts) / max(n, 1)
+    q1 = centers[np.argmax(cum >= 0.25)]
+    q3 = centers[np.argmax(cum >= 0.75)]
+    bandwidth = max(kde_bandwidth(n, std, q3 - q1), width)
+    return density_from_counts(centers, counts, grid, bandwidth)
+
+
+def density_frame(values, groups, feature, response, steps=200,
+                  resolution=1024):
+    """
+    Compute per-group Gaussian kernel density curves with vectorized binning
+    instead of leaving ``transform_density`` to the renderer.
+
+    Each group's observations are first counted into ``resolution`` fine bins
+    spanning the shared extent, and the density is then evaluated on
+    ``steps`` grid points from those counts. The cost is linear in the number
+    of rows and the output size only depends on ``steps`` and the number of
+    groups.
+
+    Parameters
+    ----------
+    values : array-like
+        The numeric feature values
+    groups : array-like
+        The group label for each value
+    feature : str
+        Name of the output column holding the grid points
+    response : str
+        Name of the output column holding the group labels
+    steps : int
+        The number of points at which each density curve is evaluated
+    resolution : int
+        The number of fine bins used to approximate each group's data
+
+    Returns
+    -------
+    pandas.DataFrame
+        A long dataframe with ``response``, ``feature`` and ``density``
+        columns, ``steps`` rows per group
+    """
+    values = np.asarray(values, dtype=np.float64)
+    codes, labels = pd.factorize(pd.Series(groups), sort=True)
+    keep = ~np.isnan(values) & (codes >= 0)
+    values = values[keep]
+    codes = codes[keep]
+
+    if len(values) == 0:
+        return pd.DataFrame({response: [], feature: [], 'density': []})
+
+    lo, hi = values.min(), values.max()
+    if hi <= lo:
+        lo, hi = lo - 0.5, hi + 0.5
+    width = (hi - lo) / resolution
+    centers = lo + width * (np.arange(resolution) + 0.5)
+    bins = np.minimum(((values - lo) / width).astype(np.int64),
+                      resolution - 1)
+
+    ngroups = len(labels)
+    counts = np.bincount(codes * resolution + bins,
+                         minlength=ngroups * resolution)
+    counts = counts.reshape(ngroups, resolution).astype(np.float64)
+
+    n = np.bincount(codes, minlength=ngroups)
+    sums = np.bincount(codes, weights=values, minlength=ngroups)
+    sq_sums = np.bincount(codes, weights=values * values, minlength=ngroups)
+    mean = sums / np.maximum(n, 1)
+    var = (sq_sums - n * mean * mean) / np.maximum(n - 1, 1)
+    std = np.sqrt(np.maximum(var, 0))
+
+    grid = np.linspace(lo, hi, steps)
+    density = np.vstack([
+        binned_density(centers, counts[g], std[g], grid)
+        for g in range(ngroups)
+    ])
+
+    return pd.DataFrame({
+        response: np.repeat(np.asarray(labels), steps),
+        feature: np.tile(grid, ngroups),
+        'density': density.ravel(),
+    })
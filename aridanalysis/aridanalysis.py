@@ -1,31 +1,27 @@
 import pandas as pd
 import pandas.api.types as ptypes
 import numpy as np
-import altair as alt
-from sklearn.linear_model import (
-    LinearRegression,
-    Lasso,
-    Ridge,
-    ElasticNet,
-    LogisticRegression,
-)
-import statsmodels.api as sm
-import statsmodels.formula.api as smf
-
-from sklearn.linear_model import PoissonRegressor
-from sklearn.compose import make_column_transformer
-from sklearn.preprocessing import OneHotEncoder
-from sklearn.pipeline import make_pipeline
-
-import sys
-import os
-myPath = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, myPath + '/../aridanalysis')
-import error_strings as errors # noqa E402   
-import warnings                # noqa E402
-
-
-def arid_eda(df, response, response_type, features=[]):
+
+# Plotting and modelling libraries are imported inside the functions that
+# use them so that importing the package stays fast and regression-only or
+# EDA-only workers never load the libraries they do not need.
+from . import error_strings as errors
+from . import aggregation as agg
+from . import correlation as corr
+from . import streaming
+from . import solvers
+from . import parallel
+from . import crossval
+from . import caching
+from . import results
+from . import instrumentation
+from . import schema
+
+
+@instrumentation.instrumented
+def arid_eda(df, response, response_type, features=[], aggregate=False,
+             corr_top_k=None, n_jobs=1, dtype=None, sample=None,
+             stratify=False, seed=None):
     """
     Function to create summary statistics and basic EDA plots. Given a data
     frame, this function outputs general exploratory analysis plots as well
@@ -33,14 +29,51 @@ def arid_eda(df, response, response_type, features=[]):
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        The input dataframe to analyze
+    df : pandas.DataFrame or iterable of pandas.DataFrame
+        The input dataframe to analyze. An iterator of dataframe chunks,
+        such as ``pd.read_csv(..., chunksize=n)``, is summarized in a single
+        pass with bounded memory: the summary table uses running moments and
+        approximate quantiles, the plots use fixed-bin accumulators and the
+        correlations are computed over a uniform sample of rows.
     response : str
         A column name of the response variable
     response_type: str
         Input either 'categorical' or 'continous to indicate response type
     features : list
         A list of the feature names to perform EDA on
+    aggregate : bool (optional)
+        If True, compute the density curves and histogram bins in Python and
+        embed only the aggregated points in the charts instead of the full
+        dataframe. Chart size then depends on the grid and bin counts rather
+        than the number of rows.
+    corr_top_k : int (optional)
+        If supplied, only the corr_top_k most strongly correlated feature
+        pairs are computed into the correlation plot instead of the full
+        feature by feature table
+    n_jobs : int (optional)
+        The number of threads used to compute the correlation matrix
+    dtype : str or numpy.dtype (optional)
+        The precision of the numeric features, "float32" or "float64". The
+        features of a dataframe are cast once and the summary table and
+        correlations are computed at that precision, which halves their
+        memory with "float32". Chunked input keeps its float64 running
+        summaries and computes the correlations at that precision. By
+        default the features keep their own dtypes and the correlations are
+        computed in float32.
+    sample : int (optional)
+        The maximum number of rows the plots are drawn from. Larger
+        dataframes are plotted from a reservoir sample drawn in one pass
+        over the rows, so the charts stay small and interactive at any
+        input size, while the summary table and correlations are still
+        computed over every row. The sampled fraction is shown in the
+        chart titles and stored in the chart's ``usermeta``. Chunked input
+        is always plotted from bounded accumulators and is not sampled.
+    stratify : bool (optional)
+        If True, stratify the sample by the classes of a categorical
+        response: classes smaller than an equal share of the sample are
+        kept whole, so the density of every class is drawn from enough rows
+    seed : int (optional)
+        Seed for the row sample
 
     Returns
     -------
@@ -65,117 +98,289 @@ def arid_eda(df, response, response_type, features=[]):
                                     ['petalWidth', 'sepalWidth','petalLength'])
 
     """
+    import altair as alt
+
     #########################################################################
 
-    assert type(df) == pd.core.frame.DataFrame, \
-        'Input data must be a Pandas DataFrame'
+    with instrumentation.span("arid_eda.validate"):
+        stream = not isinstance(df, pd.DataFrame) and hasattr(df, '__iter__')
+        if stream:  # validate the schema against the first chunk
+            first_chunk, df = streaming.peek(df)
+        else:
+            first_chunk = df
+
+        assert isinstance(first_chunk, pd.DataFrame), \
+            'Input data must be a Pandas DataFrame'
 
-    assert response in df.columns, \
-        'Response variable is not contained within dataframe'
+        assert response in first_chunk.columns, \
+            'Response variable is not contained within dataframe'
 
-    for feat in features:
-        assert feat in df.columns, \
-            f'{feat} is not contained within dataframe'
+        for feat in features:
+            assert feat in first_chunk.columns, \
+                f'{feat} is not contained within dataframe'
 
-    assert response not in features, \
-        'Response variable must be distinct from features'
+        assert response not in features, \
+            'Response variable must be distinct from features'
 
-    if df[response].dtype == np.dtype('O'):
-        assert response_type == 'categorical', \
-            'Current response variable is not continuous'
+        if first_chunk[response].dtype == np.dtype('O'):
+            assert response_type == 'categorical', \
+                'Current response variable is not continuous'
 
-    if df[response].dtype != np.dtype('O'):
-        assert response_type == 'numeric', \
-            'Current response variable is not categorical'
+        if first_chunk[response].dtype != np.dtype('O'):
+            assert response_type == 'continuous', \
+                'Current response variable is not categorical'
 
-    assert response_type in ['categorical', 'continuous'], \
-        'Response must be categorical or continuous'
+        assert response_type in ['categorical', 'continuous'], \
+            'Response must be categorical or continuous'
+
+        if corr_top_k is not None:
+            assert isinstance(corr_top_k, int) and corr_top_k > 0, \
+                'corr_top_k must be a positive integer'
+
+        assert dtype in schema.FLOAT_DTYPES, errors.INVALID_DTYPE_INPUT
+
+        if sample is not None:
+            assert isinstance(sample, int) and sample > 0, \
+                'sample must be a positive integer'
+
+        if stratify:
+            assert response_type == 'categorical', \
+                'Only a categorical response can stratify the sample'
 
     ###########################################################################
 
     chartlist = []
     corr_plot_width = 70*len(set(features))
     corr_plot_height = 70*len(set(features))
-    filter_df = df.loc[:, features]
-
-    if response_type == "categorical":
-        for feat in features:  # Creates density plots for each feature
-            chart = (
-                alt.Chart(df, title=(feat + " Distribution"))
-                .transform_density(
-                    feat, as_=[feat, "density"], groupby=[response]
-                )
-                .mark_area(interpolate="monotone", opacity=0.7)
-                .encode(y="density:Q", x=alt.X(feat), color=response)
+    agg_frames = None
+    plot_df = df
+    suffix = ""
+
+    with instrumentation.span("arid_eda.summary", columns=len(features),
+                              rows=None if stream else len(df)):
+        if stream:  # correlations are computed over a uniform row sample
+            summary = streaming.summarize_chunks(df, response, response_type,
+                                                 features)
+            filter_df = summary['sample'].sample
+            return_df = streaming.describe_summary(summary, features)
+            if response_type == "categorical":
+                agg_frames = streaming.density_frames(summary, features,
+                                                      response)
+            else:
+                agg_frames = streaming.histogram_frames(summary, features)
+        else:
+            filter_df = df.loc[:, features] if dtype is None else \
+                schema.cast_frame(df, features, dtype)
+            return_df = pd.DataFrame(filter_df.describe())
+
+    # Plot a bounded sample of the rows, in one pass over the frame
+    if sample is not None and not stream:
+        with instrumentation.span("arid_eda.sample", rows=len(df),
+                                  columns=len(features)) as stage:
+            plot_df = streaming.sample_frame(
+                df, list(dict.fromkeys([response] + features)), sample,
+                stratify=response if stratify else None, seed=seed
             )
-            chartlist.append(chart)
-
-    elif response_type == 'continuous':
-        for feat in features:  # Creates histograms for each feature
-            chart = (
-                alt.Chart(df, title=(feat + " Distribution"))
-                .mark_bar()
-                .encode(  # only works currently if response is continuous
-                    y="count()", x=alt.X(feat, bin=alt.Bin(), title=feat)
+            if len(plot_df) < len(df):
+                suffix = f" ({100 * len(plot_df) / len(df):.3g}% sample)"
+            stage.record(sample=len(plot_df))
+
+    if aggregate and not stream:
+        with instrumentation.span("arid_eda.aggregate", rows=len(plot_df),
+                                  columns=len(features)):
+            if response_type == "categorical":
+                agg_frames = {feat: agg.density_frame(plot_df[feat],
+                                                      plot_df[response],
+                                                      feat, response)
+                              for feat in features}
+            else:
+                agg_frames = {feat: agg.histogram_frame(plot_df[feat])
+                              for feat in features}
+
+    with instrumentation.span("arid_eda.charts", columns=len(features)):
+        titles = {feat: feat + " Distribution" + suffix for feat in features}
+        if response_type == "categorical" and agg_frames is not None:
+            for feat in features:  # Creates pre-computed density plots
+                chart = (
+                    alt.Chart(agg_frames[feat], title=titles[feat])
+                    .mark_area(interpolate="monotone", opacity=0.7)
+                    .encode(y="density:Q", x=alt.X(feat), color=response)
                 )
-                .properties(width=200, height=200)
-            )
-            chartlist.append(chart)
-
-#      for i in range(len(chartlist)):
-#         if i == 0:
-#             dist_output = chartlist[i]
-#         elif i == 1:
-#             dist_output = alt.hconcat(dist_output, chartlist[i])
-#         elif i % 2 == 1:
-#             dist_output = alt.vconcat(dist_output, chartlist[i])
-
-    row_list = []  # output feature distributions as a square
-    first_row = True
-    for i in range(len(chartlist)):
-        if i == 0:
-            current_row = chartlist[i]
-        elif i % 2 != 0:
-            current_row = alt.hconcat(current_row, chartlist[i])
-        elif i % 2 == 0:
-            row_list.append(current_row)
-            current_row = chartlist[i]
-
-    row_list.append(current_row)
-
-    for row in row_list:
-        if first_row:
-            dist_output = row
-            first_row = False
-        else:
-            dist_output = alt.vconcat(dist_output, row)
+                chartlist.append(chart)
+
+        elif response_type == 'continuous' and agg_frames is not None:
+            for feat in features:  # Creates pre-binned histograms
+                chart = (
+                    alt.Chart(agg_frames[feat], title=titles[feat])
+                    .mark_bar()
+                    .encode(
+                        y=alt.Y("count:Q", title="Count of Records"),
+                        x=alt.X("bin_start:Q", bin="binned", title=feat),
+                        x2="bin_end:Q"
+                    )
+                    .properties(width=200, height=200)
+                )
+                chartlist.append(chart)
+
+        elif response_type == "categorical":
+            for feat in features:  # Creates density plots for each feature
+                chart = (
+                    alt.Chart(plot_df, title=titles[feat])
+                    .transform_density(
+                        feat, as_=[feat, "density"], groupby=[response]
+                    )
+                    .mark_area(interpolate="monotone", opacity=0.7)
+                    .encode(y="density:Q", x=alt.X(feat), color=response)
+                )
+                chartlist.append(chart)
+
+        elif response_type == 'continuous':
+            for feat in features:  # Creates histograms for each feature
+                chart = (
+                    alt.Chart(plot_df, title=titles[feat])
+                    .mark_bar()
+                    .encode(  # only works currently if response is continuous
+                        y="count()", x=alt.X(feat, bin=alt.Bin(), title=feat)
+                    )
+                    .properties(width=200, height=200)
+                )
+                chartlist.append(chart)
+
+#          for i in range(len(chartlist)):
+#             if i == 0:
+#                 dist_output = chartlist[i]
+#             elif i == 1:
+#                 dist_output = alt.hconcat(dist_output, chartlist[i])
+#             elif i % 2 == 1:
+#                 dist_output = alt.vconcat(dist_output, chartlist[i])
+
+        row_list = []  # output feature distributions as a square
+        first_row = True
+        for i in range(len(chartlist)):
+            if i == 0:
+                current_row = chartlist[i]
+            elif i % 2 != 0:
+                current_row = alt.hconcat(current_row, chartlist[i])
+            elif i % 2 == 0:
+                row_list.append(current_row)
+                current_row = chartlist[i]
+
+        row_list.append(current_row)
+
+        for row in row_list:
+            if first_row:
+                dist_output = row
+                first_row = False
+            else:
+                dist_output = alt.vconcat(dist_output, row)
+
+    with instrumentation.span("arid_eda.correlation",
+                              columns=len(features)) as stage:
+        corr_df = corr.spearman_pairs(
+            filter_df.select_dtypes('number'), top_k=corr_top_k,
+            n_jobs=n_jobs, dtype=np.float32 if dtype is None else dtype
+        )
+        if corr_top_k is not None:  # mirror the pairs so the heatmap is square
+            mirror_df = corr_df.rename(columns={'level_0': 'level_1',
+                                                'level_1': 'level_0'})
+            corr_df = pd.concat([corr_df, mirror_df], ignore_index=True)
+            corr_plot_width = 70*corr_df['level_0'].nunique()
+            corr_plot_height = 70*corr_df['level_0'].nunique()
+        corr_df.loc[corr_df['corr'] == 1, 'corr'] = 0
+        corr_df['corr_label'] = corr_df['corr'].map('{:.2f}'.format)
+        corr_df['abs'] = corr_df['corr'].abs()
+        stage.record(pairs=len(corr_df))
+
+    with instrumentation.span("arid_eda.correlation_chart"):
+        base = alt.Chart(corr_df, title='Feature Correlation').encode(
+                x=alt.X('level_0', axis=alt.Axis(title='')),
+                y=alt.Y('level_1', axis=alt.Axis(title=''))
+            ).properties(width=corr_plot_width, height=corr_plot_height)
+
+        text = base.mark_text().encode(
+            text='corr_label',
+            color=alt.value('white')
+        )
 
-    corr_df = filter_df.corr('spearman').stack().reset_index(name='corr')
-    corr_df.loc[corr_df['corr'] == 1, 'corr'] = 0
-    corr_df['corr_label'] = corr_df['corr'].map('{:.2f}'.format)
-    corr_df['abs'] = corr_df['corr'].abs()
+        cor_sq = base.mark_rect().encode(
+            color=alt.Color('corr', scale=alt.Scale(scheme='blueorange'))
+        )
 
-    base = alt.Chart(corr_df, title='Feature Correlation').encode(
-            x=alt.X('level_0', axis=alt.Axis(title='')),
-            y=alt.Y('level_1', axis=alt.Axis(title=''))
-        ).properties(width=corr_plot_width, height=corr_plot_height)
+        corr_plot = cor_sq + text
 
-    text = base.mark_text().encode(
-        text='corr_label',
-        color=alt.value('white')
-    )
+    output = dist_output | corr_plot
+    if sample is not None and not stream:
+        output = output.properties(usermeta={"aridanalysis": {
+            "sample_rows": len(plot_df), "total_rows": len(df),
+            "sample_fraction": len(plot_df) / len(df),
+            "stratified": bool(stratify)
+        }})
+    return return_df, output
+
+
+def _check_cv(df, engine, cv, cv_groups):
+    """
+    Validate the cross-validation arguments of a regression function.
+    """
+    assert cv is None or engine != "statsmodels", errors.INVALID_CV_INPUT
+    assert cv_groups is None or cv_groups in df.columns.tolist(), \
+        errors.INVALID_CV_INPUT
 
-    cor_sq = base.mark_rect().encode(
-        color=alt.Color('corr', scale=alt.Scale(scheme='blueorange'))
-    )
 
-    corr_plot = cor_sq + text
-    return_df = pd.DataFrame(filter_df.describe())
+def _cross_validate(skl_model, X, y, cv, groups, n_jobs,
+                    weight_param="sample_weight", verbose=True):
+    """
+    Cross-validate an sklearn model, display the per-fold results and store
+    them in its ``cv_results_`` attribute.
+    """
+    scores = crossval.cross_validate(skl_model, X, y, cv, groups=groups,
+                                     n_jobs=n_jobs, weight_param=weight_param)
+    if verbose:
+        print(scores)
+    skl_model.cv_results_ = scores
 
-    return return_df, dist_output | corr_plot
 
+def _memoize(cache, function, df, columns, kwargs):
+    """
+    Return the cached result of a fitting function, fitting and storing it
+    on a miss.
 
-def arid_linreg(df, response, features=[], regularization=None, alpha=1):
+    Parameters
+    ----------
+    cache : bool or caching.ResultCache
+        The store to use. True uses the package's in-memory store.
+    function : str
+        The name of the fitting function, such as "arid_linreg"
+    df : pandas.DataFrame
+        The input dataframe
+    columns : list
+        The columns the fit depends on, or None for every column
+    kwargs : dict
+        The remaining arguments of the fitting function
+    """
+    assert cache is True or isinstance(cache, caching.ResultCache), \
+        errors.INVALID_CACHE_INPUT
+    store = caching.default_cache if cache is True else cache
+    # Selected columns that are absent are ignored by the fit as well
+    columns = df.columns.tolist() if columns is None else \
+        [name for name in dict.fromkeys(columns) if name in df.columns]
+
+    # Neither the number of workers nor the output changes the models
+    params = {name: value for name, value in kwargs.items()
+              if name not in ["n_jobs", "verbose"]}
+    key = caching.fingerprint(df, columns, dict(params, function=function))
+    result = store.get(key)
+    if result is None:
+        result = globals()[function](df, **kwargs)
+        store.put(key, result)
+    return result
+
+
+@instrumentation.instrumented
+@results.collects_warnings
+def arid_linreg(df, response, features=[], regularization=None, alpha=1,
+                engine="both", by=None, cv=None, cv_groups=None, n_jobs=None,
+                cache=None, verbose=True, slim=False, dtype=None):
     """
     Function that performs a linear regression on continuous response data,
     using both an sklearn and statsmodel model analogs. These models are
@@ -185,8 +390,11 @@ def arid_linreg(df, response, features=[], regularization=None, alpha=1):
     ----------
     data_frame : pandas.Dataframe
         The input dataframe to analyze
-    response : str
-        A column name of the response variable
+    response : str or list
+        A column name of the response variable, or a list of response
+        columns to regress on the same features. Multiple responses share
+        one feature selection, one copy of the design matrix and one
+        factorization of it.
     features : list (optional)
         A list of the chosen explanatory feature columns
     regularization : str (optional)
@@ -194,86 +402,507 @@ def arid_linreg(df, response, features=[], regularization=None, alpha=1):
         * L1 * L2 * L1L2
     alpha : float
         The regularization weight strength
+    engine : str (optional)
+        Which models to fit: 'sklearn', 'statsmodels' or 'both'. The model
+        that is not requested is skipped entirely and returned as None.
+    by : str (optional)
+        A column whose values define groups. A separate model is fitted for
+        every group, with the groups fanned out to a process pool.
+    cv : int, splitter or iterable (optional)
+        Cross-validate the sklearn model: the number of k-fold splits, an
+        sklearn splitter such as ``GroupKFold`` or ``TimeSeriesSplit``, or
+        an iterable of (train, test) indices. Folds run concurrently and
+        their scores and timings are printed and stored in the model's
+        ``cv_results_`` attribute.
+    cv_groups : str (optional)
+        A column of group labels passed to grouped splitters
+    n_jobs : int (optional)
+        The number of worker processes used with ``by``, or of threads used
+        with ``cv``. Defaults to the number of CPUs.
+    cache : bool or ResultCache (optional)
+        Memoize the fit. The result is looked up by a content hash of the
+        columns the fit uses and the other arguments, and a repeated call
+        returns the stored models without refitting or printing. True uses
+        the package's in-memory store, and a ``caching.ResultCache`` can
+        bound its memory and persist results to disk. Stored models are
+        shared between calls, so they should not be modified.
+    verbose : bool (optional)
+        If False, nothing is printed or formatted and warnings are only
+        recorded on the result. The coefficient table and summary can still
+        be built from the result when needed.
+    slim : bool (optional)
+        If True, the statsmodel drops its references to the training data
+        and keeps only its coefficients, covariance and the statistics
+        needed for inference and prediction, as with statsmodels'
+        ``remove_data``. The summary is rendered beforehand and kept on the
+        result, which makes the result much smaller in memory and pickled.
+    dtype : str or numpy.dtype (optional)
+        The precision of the design matrix, "float32" or "float64" (the
+        default). The features are cast once and the sklearn model is fitted
+        at that precision, which halves the memory of the design with
+        "float32". The statsmodel, the unregularized fit shared by both
+        engines and the fits of several responses upcast to float64, since
+        their inference needs it.
 
     Returns
     -------
+    RegressionResult
+        The fitted models, which unpack as the following pair, with the
+        resolved features, the warnings raised while fitting and lazily
+        built ``coef_table`` and ``summary()``:
     sklearn.linear_model
         A fitted sklearn model configured with the chosen input parameters
     statsmodels.regression.linear_model
         A fitted statsmodel configured with the chosen input parameters
+
+    When ``response`` is a list, a dict mapping each response to its
+    result is returned instead.
+
+    When ``by`` is given, a dict mapping each group to its (sklearn model,
+    statsmodel) pair is returned together with a dataframe of the
+    coefficients of every model, one row per group and engine.
+
     Examples
     --------
     >>> from aridanalysis import aridanalysis
     >>> aridanalysis.arid_linreg(df, income)
+    >>> aridanalysis.arid_linreg(df, [income, savings])
     """
+    import statsmodels.api as sm
+    from sklearn.linear_model import Lasso, Ridge, ElasticNet
+
     # Validate input arguments
-    assert isinstance(df, pd.DataFrame), errors.INVALID_DATAFRAME
-    assert not df.empty, errors.EMPTY_DATAFRAME
-    assert response in df.columns.tolist(), errors.RESPONSE_NOT_FOUND
-    assert ptypes.is_numeric_dtype(df[response].dtype), \
-        errors.INVALID_RESPONSE_DATATYPE
-    assert regularization in [None, "L1", "L2", "L1L2"], \
-        errors.INVALID_REGULARIZATION_INPUT
-    assert ptypes.is_numeric_dtype(type(alpha)), errors.INVALID_ALPHA_INPUT
+    with instrumentation.span("arid_linreg.validate"):
+        responses = response if isinstance(response, list) else [response]
+        assert isinstance(df, pd.DataFrame), errors.INVALID_DATAFRAME
+        assert not df.empty, errors.EMPTY_DATAFRAME
+        assert len(responses) > 0 and all(
+            name in df.columns.tolist() for name in responses
+        ), errors.RESPONSE_NOT_FOUND
+        assert all(
+            ptypes.is_numeric_dtype(df[name].dtype) for name in responses
+        ), errors.INVALID_RESPONSE_DATATYPE
+        assert regularization in [None, "L1", "L2", "L1L2"], \
+            errors.INVALID_REGULARIZATION_INPUT
+        assert ptypes.is_numeric_dtype(type(alpha)), errors.INVALID_ALPHA_INPUT
+        assert engine in ["sklearn", "statsmodels", "both"], \
+            errors.INVALID_ENGINE_INPUT
+        assert dtype in schema.FLOAT_DTYPES, errors.INVALID_DTYPE_INPUT
+        _check_cv(df, engine, cv, cv_groups)
+
+    # Return a stored fit of the same data and arguments
+    if cache is not None:
+        columns = None if len(features) == 0 else \
+            responses + features + [by, cv_groups]
+        return _memoize(cache, "arid_linreg", df, columns, dict(
+            response=response, features=features,
+            regularization=regularization, alpha=alpha, engine=engine,
+            by=by, cv=cv, cv_groups=cv_groups, n_jobs=n_jobs, verbose=verbose,
+            slim=slim, dtype=dtype
+        ))
+
+    # Fit one model per group in worker processes
+    if by is not None:
+        assert by in df.columns.tolist() and by not in responses and \
+            not isinstance(response, list), errors.INVALID_BY_INPUT
+        return parallel.fit_groups("arid_linreg", df, by, dict(
+            response=response, features=features,
+            regularization=regularization, alpha=alpha, engine=engine,
+            cv=cv, cv_groups=cv_groups, n_jobs=1, verbose=verbose, slim=slim,
+            dtype=dtype
+        ), n_jobs=n_jobs)
 
     # Isolate numeric features from dataframe
-    feature_df = df.drop(response, axis=1)
-    feature_list = feature_df.select_dtypes(['number']).columns
-
-    # Report features that have been discarded to the user
-    if len(feature_df.columns) != len(feature_list):
-        non_numeric_features = [
-            feature for feature in feature_df.columns if not (feature in feature_list) # noqaE501
-        ]
-        warnings.warn(
-            f"These features are non-numeric and will be discarded: {non_numeric_features}" # noqaE501
-        )
-
-    # Create a subset of user selected features if supplied
-    if len(features) > 0:
-        feature_list = set(features).intersection(feature_list)
-        # Report any user selected features that were not found
-        if len(feature_list) != len(features):
-            missing_features = [
-                feature for feature in features if not (feature in feature_list) # noqaE501
-            ]
-            warnings.warn(
-                f"These user-selected features are not present in data: {missing_features}" # noqaE501
-            )
+    with instrumentation.span("arid_linreg.features", rows=len(df),
+                              columns=df.shape[1]):
+        feature_list = schema.numeric_features(df, responses, features)
 
     # Assert that there are still features available to perform regression
     assert len(feature_list) > 0, errors.NO_VALID_FEATURES
-    print(f"Feature list: {feature_list}")
+    if verbose:
+        print(f"Feature list: {feature_list}")
 
     # Formally define our features and response
-    X = df[feature_list]
+    with instrumentation.span("arid_linreg.design", rows=len(df),
+                              columns=len(feature_list)):
+        # Column-major, as coordinate descent in sklearn needs
+        X = schema.float_frame(df, feature_list, order="F", dtype=dtype)
+        groups = None if cv_groups is None else df[cv_groups].to_numpy()
+    if isinstance(response, list):
+        return _linreg_multi(schema.float64_frame(X), df[responses],
+                             regularization, alpha, engine, cv, groups,
+                             n_jobs, verbose, slim)
     y = df[response]
 
     # Create and fit analagous models in sklearn and statsmodels
-    if regularization == "L1":
-        skl_model = Lasso(alpha, fit_intercept=False).fit(X, y)
-        sm_model = sm.OLS(y, X).fit_regularized(L1_wt=1, alpha=alpha)
-    elif regularization == "L2":
-        skl_model = Ridge(alpha, fit_intercept=False).fit(X, y)
+    fit_skl = engine != "statsmodels"
+    fit_sm = engine != "sklearn"
+    skl_model = sm_model = None
+    sizes = dict(rows=X.shape[0], columns=X.shape[1])
+    if regularization is None:
+        # Both models share a single factorization of X, in float64 as the
+        # statsmodel's inference needs
+        X_ols = X if engine == "sklearn" else schema.float64_frame(X)
+        with instrumentation.span("arid_linreg.ols_fit", **sizes):
+            skl_model, sm_model = solvers.fit_ols(X_ols, y, engine=engine)
+    if regularization is not None and fit_skl:
+        sklearn_models = {"L1": Lasso, "L2": Ridge, "L1L2": ElasticNet}
+        with instrumentation.span("arid_linreg.sklearn_fit", **sizes):
+            skl_model = sklearn_models[regularization](
+                alpha, fit_intercept=False
+            ).fit(X, y)
+    if regularization is not None and fit_sm:
         # No idea why statsmodels L2 alpha requires the division by 3, but it
         # was tested empirically and coefficients/predictions match...
-        sm_model = sm.OLS(y, X).fit_regularized(L1_wt=0, alpha=alpha/3)
-    elif regularization == "L1L2":
-        skl_model = ElasticNet(alpha, fit_intercept=False).fit(X, y)
-        sm_model = sm.OLS(y, X).fit_regularized(L1_wt=0.5,
-                                                alpha=alpha)
-    else:
-        skl_model = LinearRegression(fit_intercept=False).fit(X, y)
-        sm_model = sm.OLS(y, X).fit()
+        L1_wt, sm_alpha = {"L1": (1, alpha), "L2": (0, alpha/3),
+                           "L1L2": (0.5, alpha)}[regularization]
+        with instrumentation.span("arid_linreg.statsmodels_fit", **sizes):
+            sm_model = sm.OLS(y, schema.float64_frame(X)).fit_regularized(
+                L1_wt=L1_wt, alpha=sm_alpha
+            )
+
+    # Cross-validate the sklearn model on the same design matrix
+    if cv is not None:
+        with instrumentation.span("arid_linreg.cross_validate", **sizes):
+            _cross_validate(skl_model, X.to_numpy(), y.to_numpy(), cv,
+                            groups, n_jobs, verbose=verbose)
 
     # Display model coefficients to user
-    print(pd.DataFrame({'statsmodel coefficients': sm_model.params,
-                        'sklearn coefficients': skl_model.coef_}, index=feature_list)) # noqa E501
+    if verbose:
+        with instrumentation.span("arid_linreg.report"):
+            coefficients = {}
+            if sm_model is not None:
+                coefficients['statsmodel coefficients'] = np.asarray(
+                    sm_model.params
+                )
+            if skl_model is not None:
+                coefficients['sklearn coefficients'] = skl_model.coef_
+            print(pd.DataFrame(coefficients, index=feature_list))
+
+    result = results.RegressionResult(skl_model, sm_model, feature_list)
+    if slim:
+        with instrumentation.span("arid_linreg.slim"):
+            result.slim()
+    return result
+
+
+def _linreg_multi(X, Y, regularization, alpha, engine, cv=None, groups=None,
+                  n_jobs=None, verbose=True, slim=False):
+    """
+    Fit arid_linreg's model analogs for every column of Y against one shared
+    design matrix and display their coefficients.
+    """
+    # Keep the statsmodels L2 alpha scaling used for a single response
+    sm_alpha = alpha / 3 if regularization == "L2" else alpha
+    with instrumentation.span("arid_linreg.multi_fit", rows=X.shape[0],
+                              columns=X.shape[1], responses=Y.shape[1]):
+        pairs = solvers.fit_multi_response(X, Y, regularization, alpha,
+                                           sm_alpha=sm_alpha, engine=engine)
+    models = {
+        name: results.RegressionResult(skl_model, sm_model,
+                                       X.columns.tolist())
+        for name, (skl_model, sm_model) in zip(Y.columns.tolist(), pairs)
+    }
+    if cv is not None:
+        for name, (skl_model, _) in models.items():
+            _cross_validate(skl_model, X.to_numpy(), Y[name].to_numpy(), cv,
+                            groups, n_jobs, verbose=verbose)
+
+    if verbose:
+        coefficients = {}
+        for name, (skl_model, sm_model) in models.items():
+            if sm_model is not None:
+                coefficients[(name, 'statsmodel coefficients')] = np.asarray(
+                    sm_model.params
+                )
+            if skl_model is not None:
+                coefficients[(name, 'sklearn coefficients')] = skl_model.coef_
+        print(pd.DataFrame(coefficients, index=X.columns))
+
+    if slim:
+        for result in models.values():
+            result.slim()
+    return models
+
+
+@instrumentation.instrumented
+def arid_linreg_path(df, response, alphas, features=[], regularization="L1",
+                     engine="both", verbose=True):
+    """
+    Function that computes the coefficient paths of a regularized linear
+    regression over a grid of regularization strengths, for both the sklearn
+    and statsmodel model analogs.
+
+    The expensive work is shared across the whole grid: a single SVD for
+    "L2", and a single Gram matrix with warm-started coordinate descent for
+    "L1" and "L1L2". Each row of the returned paths matches the coefficients
+    arid_linreg would return for that alpha.
+
+    Parameters
+    ----------
+    df : pandas.Dataframe
+        The input dataframe to analyze
+    response : str
+        A column name of the response variable
+    alphas : list
+        The regularization weight strengths to evaluate
+    features : list (optional)
+        A list of the chosen explanatory feature columns
+    regularization : str (optional)
+        What level of regularization to use in the model values:
+        * L1 * L2 * L1L2
+    engine : str (optional)
+        Which paths to return: 'sklearn', 'statsmodels' or 'both'. The path
+        that is not requested is returned as None.
+    verbose : bool (optional)
+        If False, the feature list is not printed.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The sklearn coefficients, one row per alpha and one column per feature
+    pandas.DataFrame
+        The statsmodel coefficients, one row per alpha and one column per
+        feature
+
+    Examples
+    --------
+    >>> from aridanalysis import aridanalysis
+    >>> aridanalysis.arid_linreg_path(df, income, [0.01, 0.1, 1, 10])
+    """
+    # Validate input arguments
+    assert isinstance(df, pd.DataFrame), errors.INVALID_DATAFRAME
+    assert not df.empty, errors.EMPTY_DATAFRAME
+    assert response in df.columns.tolist(), errors.RESPONSE_NOT_FOUND
+    assert ptypes.is_numeric_dtype(df[response].dtype), \
+        errors.INVALID_RESPONSE_DATATYPE
+    assert regularization in ["L1", "L2", "L1L2"], \
+        errors.INVALID_REGULARIZATION_INPUT
+    assert len(alphas) > 0 and all(
+        ptypes.is_numeric_dtype(type(alpha)) for alpha in alphas
+    ), errors.INVALID_ALPHA_INPUT
+    assert engine in ["sklearn", "statsmodels", "both"], \
+        errors.INVALID_ENGINE_INPUT
+
+    feature_list = schema.numeric_features(df, response, features)
+    assert len(feature_list) > 0, errors.NO_VALID_FEATURES
+    if verbose:
+        print(f"Feature list: {feature_list}")
 
-    return skl_model, sm_model
+    X = schema.float_frame(df, feature_list, order="F")
+    y = df[response]
+    alphas = np.asarray(alphas, dtype=np.float64)
+
+    # Keep the statsmodels L2 alpha scaling used by arid_linreg
+    sm_alphas = alphas / 3 if regularization == "L2" else alphas
+    skl_coefs, sm_coefs = solvers.regularization_path(
+        X, y, alphas, regularization, sm_alphas=sm_alphas
+    )
 
+    index = pd.Index(alphas, name='alpha')
+    skl_path = sm_path = None
+    if engine != "statsmodels":
+        skl_path = pd.DataFrame(skl_coefs, index=index, columns=feature_list)
+    if engine != "sklearn":
+        sm_path = pd.DataFrame(sm_coefs, index=index, columns=feature_list)
 
-def arid_logreg(df, response, features=[], type="binomial"):
+    return skl_path, sm_path
+
+
+class LinregAccumulator:
+    """
+    Accumulate the sufficient statistics of a linear regression over
+    dataframe chunks and fit the sklearn and statsmodel model analogs from
+    them.
+
+    OLS and ridge fits only depend on X'X, X'y, y'y and the number of rows,
+    so memory stays O(p^2) however many rows are ingested. Accumulators
+    filled in separate processes, for example one per partition of a
+    dataset, can be combined with ``merge``. Features are resolved on the
+    first chunk with the same rules as arid_linreg.
+
+    Parameters
+    ----------
+    response : str
+        A column name of the response variable
+    features : list (optional)
+        A list of the chosen explanatory feature columns
+    regularization : str (optional)
+        What level of regularization to use in the model values:
+        * None * L2
+    alpha : float
+        The regularization weight strength
+
+    Examples
+    --------
+    >>> from aridanalysis import aridanalysis
+    >>> acc = aridanalysis.LinregAccumulator("income")
+    >>> for chunk in pd.read_csv("data.csv", chunksize=100000):
+    ...     acc.partial_fit(chunk)
+    >>> skl_model, sm_model = acc.finish()
+    """
+
+    def __init__(self, response, features=[], regularization=None, alpha=1):
+        assert regularization in [None, "L2"], \
+            errors.INVALID_REGULARIZATION_INPUT
+        assert ptypes.is_numeric_dtype(type(alpha)), errors.INVALID_ALPHA_INPUT
+        self.response = response
+        self.features = features
+        self.regularization = regularization
+        self.alpha = alpha
+        self.feature_list = None
+        self.n = 0
+        self.xtx = None
+        self.xty = None
+        self.yty = 0.0
+        self.xsum = None
+        self.ysum = 0.0
+
+    def partial_fit(self, df):
+        """
+        Add the rows of one dataframe chunk to the accumulated statistics.
+        The chunk must not have missing values in the features or the
+        response, and the statistics are left unchanged if it does.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            A chunk of the input data
+
+        Returns
+        -------
+        LinregAccumulator
+            The accumulator itself
+        """
+        assert isinstance(df, pd.DataFrame), errors.INVALID_DATAFRAME
+        assert self.response in df.columns.tolist(), errors.RESPONSE_NOT_FOUND
+        assert ptypes.is_numeric_dtype(df[self.response].dtype), \
+            errors.INVALID_RESPONSE_DATATYPE
+
+        if self.feature_list is None:
+            assert not df.empty, errors.EMPTY_DATAFRAME
+            feature_list = schema.numeric_features(df, self.response,
+                                                   self.features)
+            assert len(feature_list) > 0, errors.NO_VALID_FEATURES
+            self._start(feature_list)
+        assert set(self.feature_list).issubset(df.columns), \
+            errors.FEATURE_NOT_FOUND
+
+        X = df[self.feature_list].to_numpy(dtype=np.float64, na_value=np.nan)
+        y = df[self.response].to_numpy(dtype=np.float64, na_value=np.nan)
+        # A single missing value would turn every accumulated sum into NaN
+        assert not (np.isnan(X).any() or np.isnan(y).any()), \
+            errors.MISSING_VALUES
+        self.n += len(y)
+        self.xtx += X.T @ X
+        self.xty += X.T @ y
+        self.yty += float(y @ y)
+        self.xsum += X.sum(axis=0)
+        self.ysum += float(y.sum())
+        return self
+
+    def merge(self, other):
+        """
+        Add the statistics of another accumulator, for example one filled in
+        a different process, to this one.
+
+        Parameters
+        ----------
+        other : LinregAccumulator
+            An accumulator over the same response and features
+
+        Returns
+        -------
+        LinregAccumulator
+            The accumulator itself
+        """
+        assert isinstance(other, LinregAccumulator), \
+            errors.INCOMPATIBLE_ACCUMULATOR
+        assert other.response == self.response, \
+            errors.INCOMPATIBLE_ACCUMULATOR
+        if other.feature_list is None:
+            return self
+        if self.feature_list is None:
+            self._start(other.feature_list)
+        assert other.feature_list == self.feature_list, \
+            errors.INCOMPATIBLE_ACCUMULATOR
+
+        self.n += other.n
+        self.xtx += other.xtx
+        self.xty += other.xty
+        self.yty += other.yty
+        self.xsum += other.xsum
+        self.ysum += other.ysum
+        return self
+
+    def finish(self, engine="both", verbose=True):
+        """
+        Fit the sklearn and statsmodel model analogs from the accumulated
+        statistics.
+
+        The statsmodel is fitted on a small surrogate design with the same
+        sufficient statistics, so its parameters, standard errors,
+        R-squared, F-test and information criteria match a fit on the full
+        data. Diagnostics that need the individual residuals, such as the
+        Durbin-Watson and omnibus tests in its summary, are not meaningful.
+
+        Parameters
+        ----------
+        engine : str (optional)
+            Which models to fit: 'sklearn', 'statsmodels' or 'both'. The
+            model that is not requested is returned as None.
+        verbose : bool (optional)
+            If False, the feature list and coefficient table are not
+            printed.
+
+        Returns
+        -------
+        sklearn.linear_model
+            A fitted sklearn model configured with the chosen input
+            parameters
+        statsmodels.regression.linear_model
+            A fitted statsmodel configured with the chosen input parameters
+        """
+        assert engine in ["sklearn", "statsmodels", "both"], \
+            errors.INVALID_ENGINE_INPUT
+        assert self.n > 0, errors.EMPTY_DATAFRAME
+
+        if verbose:
+            print(f"Feature list: {self.feature_list}")
+        skl_model, sm_model = solvers.fit_from_moments(
+            self.xtx, self.xty, self.yty, self.xsum, self.ysum, self.n,
+            self.feature_list, regularization=self.regularization,
+            alpha=self.alpha, engine=engine
+        )
+
+        if verbose:
+            coefficients = {}
+            if sm_model is not None:
+                coefficients['statsmodel coefficients'] = np.asarray(
+                    sm_model.params
+                )
+            if skl_model is not None:
+                coefficients['sklearn coefficients'] = skl_model.coef_
+            print(pd.DataFrame(coefficients, index=self.feature_list))
+
+        return skl_model, sm_model
+
+    def _start(self, feature_list):
+        """
+        Allocate empty statistics for the resolved features.
+        """
+        p = len(feature_list)
+        self.feature_list = list(feature_list)
+        self.xtx = np.zeros((p, p))
+        self.xty = np.zeros(p)
+        self.xsum = np.zeros(p)
+
+
+@instrumentation.instrumented
+@results.collects_warnings
+def arid_logreg(df, response, features=[], type="binomial", engine="both",
+                compress=False, by=None, cv=None, cv_groups=None,
+                n_jobs=None, cache=None, verbose=True, slim=False):
     """Function to fit a binomial or multinomial logistic regression.
 
     Function that performs a binomial or multinomial logistic regression
@@ -291,15 +920,63 @@ def arid_logreg(df, response, features=[], type="binomial"):
         A list of the column names as explanatory variables
     type : str
         Classification type. Either "binomial" or "multinomial"
+    engine : str
+        Which models to fit: 'sklearn', 'statsmodels' or 'both'. The model
+        that is not requested is skipped entirely and returned as None.
+    compress : bool (optional)
+        If True, collapse identical (features, response) rows into distinct
+        patterns with counts and fit both models with frequency weights.
+        The coefficients and standard errors are unchanged, and fitting
+        time and memory scale with the number of distinct patterns. The
+        statsmodel's row-level results refer to the patterns.
+    by : str (optional)
+        A column whose values define groups. A separate model is fitted for
+        every group, with the groups fanned out to a process pool.
+    cv : int, splitter or iterable (optional)
+        Cross-validate the sklearn model: the number of k-fold splits, an
+        sklearn splitter such as ``GroupKFold`` or ``TimeSeriesSplit``, or
+        an iterable of (train, test) indices. Folds run concurrently and
+        their scores and timings are printed and stored in the model's
+        ``cv_results_`` attribute.
+    cv_groups : str (optional)
+        A column of group labels passed to grouped splitters
+    n_jobs : int (optional)
+        The number of worker processes used with ``by``, or of threads used
+        with ``cv``. Defaults to the number of CPUs.
+    cache : bool or ResultCache (optional)
+        Memoize the fit. The result is looked up by a content hash of the
+        columns the fit uses and the other arguments, and a repeated call
+        returns the stored models without refitting or printing. True uses
+        the package's in-memory store, and a ``caching.ResultCache`` can
+        bound its memory and persist results to disk. Stored models are
+        shared between calls, so they should not be modified.
+    verbose : bool (optional)
+        If False, nothing is printed or formatted and warnings are only
+        recorded on the result. The coefficient table and summary can still
+        be built from the result when needed.
+    slim : bool (optional)
+        If True, the statsmodel drops its references to the training data
+        and keeps only its coefficients, covariance and the statistics
+        needed for inference and prediction, as with statsmodels'
+        ``remove_data``. The summary is rendered beforehand and kept on the
+        result, which makes the result much smaller in memory and pickled.
 
     Returns
     -------
+    RegressionResult
+        The fitted models, which unpack as the following pair, with the
+        resolved features, the warnings raised while fitting and lazily
+        built ``coef_table`` and ``summary()``:
     sklearn.linear_model
         A fitted logistic regression sklearn model configured with
         the chosen input parameters
     statsmodels.discrete.discrete_model
         A fitted Logit statsmodel configured with the chosen input parameters
 
+    When ``by`` is given, a dict mapping each group to its (sklearn model,
+    statsmodel) pair is returned together with a dataframe of the
+    coefficients of every model, one row per group and engine.
+
     Examples
     --------
     >>> aridanalysis.arid_logreg(df,
@@ -307,53 +984,178 @@ def arid_logreg(df, response, features=[], type="binomial"):
                                 ['feat1', 'feat2', 'feat3'],
                                 type="binomial")
     """
+    import statsmodels.api as sm
+    from sklearn.linear_model import LogisticRegression
+
     # Validate input arguments
-    assert isinstance(df, pd.DataFrame), errors.INVALID_DATAFRAME
-    assert not df.empty, errors.EMPTY_DATAFRAME
-    assert response in df.columns.tolist(), errors.RESPONSE_NOT_FOUND
-    assert type in ["binomial", "multinomial"], errors.INVALID_TYPE_INPUT
+    with instrumentation.span("arid_logreg.validate"):
+        assert isinstance(df, pd.DataFrame), errors.INVALID_DATAFRAME
+        assert not df.empty, errors.EMPTY_DATAFRAME
+        assert response in df.columns.tolist(), errors.RESPONSE_NOT_FOUND
+        assert type in ["binomial", "multinomial"], errors.INVALID_TYPE_INPUT
+        assert engine in ["sklearn", "statsmodels", "both"], \
+            errors.INVALID_ENGINE_INPUT
+        _check_cv(df, engine, cv, cv_groups)
+
+    # Return a stored fit of the same data and arguments
+    if cache is not None:
+        columns = None if len(features) == 0 else \
+            [response] + features + [by, cv_groups]
+        return _memoize(cache, "arid_logreg", df, columns, dict(
+            response=response, features=features, type=type, engine=engine,
+            compress=compress, by=by, cv=cv, cv_groups=cv_groups,
+            n_jobs=n_jobs, verbose=verbose, slim=slim
+        ))
+
+    # Fit one model per group in worker processes
+    if by is not None:
+        assert by in df.columns.tolist() and by != response, \
+            errors.INVALID_BY_INPUT
+        return parallel.fit_groups("arid_logreg", df, by, dict(
+            response=response, features=features, type=type, engine=engine,
+            compress=compress, cv=cv, cv_groups=cv_groups, n_jobs=1,
+            verbose=verbose, slim=slim
+        ), n_jobs=n_jobs)
 
     # Get features list from df
-    feature_df = df.drop(response, axis=1)
-    feature_list = feature_df.select_dtypes(['number']).columns
-
-    # Report features that have been discarded to the user
-    if len(feature_df.columns) != len(feature_list):
-        non_numeric_features = [feature for feature in feature_df.columns if not (feature in feature_list)] # noqaE501
-        warnings.warn(f"These features are non-numeric and will be discarded: {non_numeric_features}") # noqaE501
-
-    # Create a subset of user selected features if supplied
-    if len(features) > 0:
-        feature_list = set(features).intersection(feature_list)
-        # Report any user selected features that were not found
-        if len(feature_list) != len(features):
-            missing_features = [feature for feature in features if not (feature in feature_list)] # noqaE501
-            warnings.warn(f"These user-selected features are not present in data: {missing_features}") # noqaE501
+    with instrumentation.span("arid_logreg.features", rows=len(df),
+                              columns=df.shape[1]):
+        feature_list = schema.numeric_features(df, response, features)
 
     # Assert that there are still features available to perform classification
     assert len(feature_list) > 0, errors.NO_VALID_FEATURES
 
-    # Formally define our features and response
-    X = df[feature_list]
-    y = df[response]
+    # Formally define our features and response, as one float block that
+    # both libraries use without copying
+    with instrumentation.span("arid_logreg.design", rows=len(df),
+                              columns=len(feature_list)):
+        X = schema.float_frame(df, feature_list)
+        y = df[response]
+
+    # Optionally collapse duplicate rows into frequency-weighted patterns
+    X_fit, y_fit, weights = X, y, None
+    logit, mnlogit, sm_kwds = sm.Logit, sm.MNLogit, {}
+    if compress:
+        from . import compression
+
+        with instrumentation.span("arid_logreg.compress", rows=len(X),
+                                  columns=X.shape[1]) as stage:
+            X_fit, y_fit, weights = compression.compress_rows(X, y)
+            stage.record(patterns=len(y_fit))
+        logit = compression.WeightedLogit
+        mnlogit = compression.WeightedMNLogit
+        sm_kwds = {"freq_weights": weights}
+        if verbose:
+            print(f"Compressed {len(y)} rows into {len(y_fit)} distinct patterns") # noqaE501
 
     # Create and fit analagous models in sklearn and statsmodels
-    if type == "binomial":
-        skl_model = LogisticRegression(penalty='none', fit_intercept = False, multi_class='ovr').fit(X, y) # noqaE501
-        sm_model = sm.Logit(y, X).fit(method="bfgs")
-
-    else:
-        skl_model = LogisticRegression(penalty='none', fit_intercept = False, multi_class='multinomial').fit(X, y) # noqaE501
-        sm_model = sm.MNLogit(y, X).fit()
+    skl_model = sm_model = None
+    sizes = dict(rows=X_fit.shape[0], columns=X_fit.shape[1])
+    multi_class = "ovr" if type == "binomial" else "multinomial"
+    if engine != "statsmodels":
+        with instrumentation.span("arid_logreg.sklearn_fit", **sizes):
+            skl_model = LogisticRegression(penalty='none', fit_intercept = False, multi_class=multi_class).fit(X_fit, y_fit, sample_weight=weights) # noqaE501
+    if engine != "sklearn":
+        with instrumentation.span("arid_logreg.statsmodels_fit", **sizes):
+            if type == "binomial":
+                sm_model = logit(y_fit, X_fit, **sm_kwds).fit(method="bfgs",
+                                                              disp=verbose)
+            else:
+                sm_model = mnlogit(y_fit, X_fit, **sm_kwds).fit(disp=verbose)
+
+    # Cross-validate the sklearn model on one array of the features
+    if cv is not None:
+        groups = None if cv_groups is None else df[cv_groups].to_numpy()
+        with instrumentation.span("arid_logreg.cross_validate",
+                                  rows=len(X), columns=X.shape[1]):
+            _cross_validate(skl_model, X.to_numpy(dtype=np.float64),
+                            y.to_numpy(), cv, groups, n_jobs, verbose=verbose)
+
+    result = results.RegressionResult(skl_model, sm_model, feature_list)
 
     # Display model coefficients to user
-    print(pd.DataFrame(skl_model.coef_, columns=feature_list))
-    print(sm_model.summary())
+    if verbose:
+        with instrumentation.span("arid_logreg.report"):
+            if skl_model is not None:
+                print(pd.DataFrame(skl_model.coef_, columns=feature_list))
+            if sm_model is not None:
+                print(result.summary())
+
+    if slim:
+        with instrumentation.span("arid_logreg.slim"):
+            result.slim()
+    return result
+
+
+def _aggregate_counts(data_frame, response, features):
+    """
+    Sum the response over rows that share every feature value.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per covariate pattern with the features and summed response
+    numpy.ndarray
+        The number of rows in each pattern
+    """
+    table = data_frame.groupby(features, observed=True, sort=False)[
+        response].agg(["sum", "size"])
+    counts = table.pop("size").to_numpy(dtype=np.float64)
+    return table.rename(columns={"sum": response}).reset_index(), counts
 
-    return skl_model, sm_model
+
+def _fit_counts(pipeline, X, y, counts):
+    """
+    Fit a count regression pipeline, on mean counts weighted by the number
+    of rows when the rows have been aggregated.
+    """
+    if counts is None:
+        return pipeline.fit(X, y)
+    return pipeline.fit(X, y / counts, poissonregressor__sample_weight=counts)
 
 
-def arid_countreg(data_frame, response, con_features=[], cat_features=[], model="additive", alpha=1): # noqaE501
+def _fit_sparse_counts(fit_df, response, con_features, cat_features, alpha,
+                       engine, counts):
+    """
+    Fit arid_countreg's models on one sparse treatment-coded design.
+
+    The design is built once and shared: the sklearn regressor is fitted on
+    it without its intercept column and wrapped in a pipeline with the
+    fitted design builder, and the inferential model is solved directly on
+    it by sparse IRLS.
+    """
+    from sklearn.linear_model import PoissonRegressor
+    from sklearn.pipeline import Pipeline
+
+    from . import design
+
+    features = con_features + cat_features
+    fit_df = fit_df.dropna(subset=features + [response])
+    builder = design.SparseDesign(con_features, cat_features).fit(fit_df)
+    X = builder.transform(fit_df)
+    y = fit_df[response].to_numpy(dtype=np.float64)
+
+    sk_model = glm_count = None
+    if engine != "statsmodels":
+        regressor = PoissonRegressor(alpha=alpha, fit_intercept=True)
+        if counts is None:
+            regressor.fit(X[:, 1:], y)
+        else:
+            regressor.fit(X[:, 1:], y / counts, sample_weight=counts)
+        sk_model = Pipeline([("sparsedesign", builder.without_intercept()),
+                             ("poissonregressor", regressor)])
+    if engine != "sklearn":
+        glm_count = solvers.poisson_irls_sparse(
+            X, y, builder.feature_names_,
+            offset=None if counts is None else np.log(counts),
+            design=builder
+        )
+    return sk_model, glm_count
+
+
+@instrumentation.instrumented
+@results.collects_warnings
+def arid_countreg(data_frame, response, con_features=[], cat_features=[], model="additive", alpha=1, engine="both", aggregate=False, sparse=False, by=None, cv=None, cv_groups=None, n_jobs=None, cache=None, verbose=True, slim=False): # noqaE501
     """
     Function that performs a count regression on a numerical discete response
     data, using both an sklearn and statsmodel model analogs (prediction and
@@ -379,14 +1181,75 @@ def arid_countreg(data_frame, response, con_features=[], cat_features=[], model=
       Model type. Either "additive" or "interactive"
     alpha: float
       Constant the controls regularization strength in predictive model
+    engine: str
+      Which models to fit: 'sklearn', 'statsmodels' or 'both'. The model
+      that is not requested is skipped entirely and returned as None.
+    aggregate : bool
+      If True, rows that share every feature value are collapsed into one
+      row whose response is their summed count. The statsmodel is fitted
+      with the number of rows as its exposure and the sklearn model on the
+      mean counts weighted by the number of rows, which leaves both sets of
+      coefficients unchanged. The statsmodel's log-likelihood and deviance
+      then differ from the row-level fit by a constant. Rows with missing
+      features are dropped.
+    sparse : bool
+      If True, the additive model is fitted on a treatment-coded design
+      built once as a sparse CSR matrix, so that memory scales with the
+      number of nonzeros and categoricals with many levels stay cheap. The
+      sklearn model is a pipeline of the design builder and a
+      PoissonRegressor that uses the continuous features as well. The
+      statsmodel is replaced by a ``SparsePoissonResults`` fitted by sparse
+      IRLS, with statsmodels' coefficient names and a summary table. Both
+      paths take the first level of a categorical that has rows as its
+      reference, so they name and estimate the same coefficients.
+    by : str
+      A column whose values define groups. A separate model is fitted for
+      every group, with the groups fanned out to a process pool.
+    cv : int, splitter or iterable
+      Cross-validate the sklearn model: the number of k-fold splits, an
+      sklearn splitter such as ``GroupKFold`` or ``TimeSeriesSplit``, or an
+      iterable of (train, test) indices. Folds run concurrently and their
+      scores and timings are printed and stored in the model's
+      ``cv_results_`` attribute.
+    cv_groups : str
+      A column of group labels passed to grouped splitters
+    n_jobs : int
+      The number of worker processes used with ``by``, or of threads used
+      with ``cv``. Defaults to the number of CPUs.
+    cache : bool or ResultCache
+      Memoize the fit. The result is looked up by a content hash of the
+      columns the fit uses and the other arguments, and a repeated call
+      returns the stored models without refitting or printing. True uses
+      the package's in-memory store, and a ``caching.ResultCache`` can
+      bound its memory and persist results to disk. Stored models are
+      shared between calls, so they should not be modified.
+    verbose : bool
+      If False, nothing is printed or formatted and warnings are only
+      recorded on the result. The summary can still be built from the
+      result when needed.
+    slim : bool
+      If True, the statsmodel drops its references to the training data
+      and keeps only its coefficients, covariance and the statistics
+      needed for inference and prediction, as with statsmodels'
+      ``remove_data``. The summary is rendered beforehand and kept on the
+      result, and the training dataframe is replaced by a frame of one row
+      per level from which the formula's design is rebuilt on unpickling.
 
     Returns
     -------
+    RegressionResult
+        The fitted models, which unpack as the following pair, with the
+        resolved features, the warnings raised while fitting and lazily
+        built ``coef_table`` and ``summary()``:
     sklearn.linear_model
         A fitted sklearn model configured with the chosen input parameters
     statsmodels.regression.linear_model
         A fitted statsmodel configured with the chosen input parameters
 
+    When ``by`` is given, a dict mapping each group to its (sklearn model,
+    statsmodel) pair is returned together with a dataframe of the
+    coefficients of every model, one row per group and engine.
+
     Examples
     --------
     >>> from aridanalysis import aridanalysis
@@ -395,38 +1258,92 @@ def arid_countreg(data_frame, response, con_features=[], cat_features=[], model=
                                   features=[feat1, feat5],
                                   "additive")
     """
+    import statsmodels.api as sm
+    from sklearn.compose import make_column_transformer
+    from sklearn.linear_model import PoissonRegressor
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import OneHotEncoder
+
+    from . import design
+
     assert isinstance(con_features, list), "ERROR: INVALID LIST INTPUT PASSED"
     assert isinstance(cat_features, list), "ERROR: INVALID LIST INTPUT PASSED"
 
+    # Return a stored fit of the same data and arguments
+    if cache is not None:
+        assert isinstance(data_frame, pd.DataFrame), errors.INVALID_DATAFRAME
+        columns = None if len(con_features) == 0 or len(cat_features) == 0 \
+            else [response] + con_features + cat_features + [by, cv_groups]
+        return _memoize(cache, "arid_countreg", data_frame, columns, dict(
+            response=response, con_features=con_features,
+            cat_features=cat_features, model=model, alpha=alpha,
+            engine=engine, aggregate=aggregate, sparse=sparse, by=by, cv=cv,
+            cv_groups=cv_groups, n_jobs=n_jobs, verbose=verbose, slim=slim
+        ))
+
+    # Fit one model per group in worker processes
+    if by is not None:
+        assert isinstance(data_frame, pd.DataFrame), errors.INVALID_DATAFRAME
+        assert by in data_frame.columns.tolist() and by != response, \
+            errors.INVALID_BY_INPUT
+        return parallel.fit_groups("arid_countreg", data_frame, by, dict(
+            response=response, con_features=con_features,
+            cat_features=cat_features, model=model, alpha=alpha,
+            engine=engine, aggregate=aggregate, sparse=sparse, cv=cv,
+            cv_groups=cv_groups, n_jobs=1, verbose=verbose, slim=slim
+        ), n_jobs=n_jobs)
+
     # Deal with the features column
-    if len(con_features) == 0:
-        con_features = (
-            data_frame.drop(columns=[response]).select_dtypes("number")
-            .columns.tolist()
-        )
-    if len(cat_features) == 0:
-        cat_features = (
-            data_frame.drop(columns=[response])
-            .select_dtypes(["category", "object"])
-            .columns.tolist()
+    with instrumentation.span("arid_countreg.features"):
+        con_features, cat_features = schema.countreg_features(
+            data_frame, response, con_features, cat_features
         )
 
-    assert isinstance(data_frame, pd.DataFrame), errors.INVALID_DATAFRAME
-    assert not data_frame.empty, errors.EMPTY_DATAFRAME
-    assert response in data_frame.columns.tolist(), errors.RESPONSE_NOT_FOUND
-    assert all(item in data_frame.columns.tolist() for item in con_features), \
-        "ERROR: CONTINUOUS VARIABLE(S) NOT IN DATAFRAME"
-    assert all(item in data_frame.columns.tolist() for item in cat_features), \
-        "ERROR: CATEGORICAL VARIABLE(S) NOT IN DATAFRAME"
-    assert ptypes.is_integer_dtype(data_frame[response].dtype), \
-        "ERROR: INVALID RESPONSE DATATYPE FOR COUNT REGRESSION: MUST BE TYPE INT" # noqaE501
-    assert model in ["additive", "interactive"], "ERROR: INVALID MODEL PASSED"
-    assert ptypes.is_numeric_dtype(type(alpha)), errors.INVALID_ALPHA_INPUT
-
-    # Scikit Learn Model
-    if len(cat_features) != 0:
-        X_sk = data_frame[con_features + cat_features]
-        y_sk = data_frame[response]
+    with instrumentation.span("arid_countreg.validate"):
+        assert isinstance(data_frame, pd.DataFrame), errors.INVALID_DATAFRAME
+        assert not data_frame.empty, errors.EMPTY_DATAFRAME
+        assert response in data_frame.columns.tolist(), \
+            errors.RESPONSE_NOT_FOUND
+        assert all(item in data_frame.columns.tolist()
+                   for item in con_features), \
+            "ERROR: CONTINUOUS VARIABLE(S) NOT IN DATAFRAME"
+        assert all(item in data_frame.columns.tolist()
+                   for item in cat_features), \
+            "ERROR: CATEGORICAL VARIABLE(S) NOT IN DATAFRAME"
+        assert ptypes.is_integer_dtype(data_frame[response].dtype), \
+            "ERROR: INVALID RESPONSE DATATYPE FOR COUNT REGRESSION: MUST BE TYPE INT" # noqaE501
+        assert model in ["additive", "interactive"], \
+            "ERROR: INVALID MODEL PASSED"
+        assert not sparse or model == "additive", \
+            "ERROR: SPARSE DESIGN ONLY SUPPORTS THE ADDITIVE MODEL"
+        assert ptypes.is_numeric_dtype(type(alpha)), \
+            errors.INVALID_ALPHA_INPUT
+        assert engine in ["sklearn", "statsmodels", "both"], \
+            errors.INVALID_ENGINE_INPUT
+        _check_cv(data_frame, engine, cv, cv_groups)
+
+    sk_model = glm_count = None
+
+    # Optionally collapse rows that share every feature into summed counts
+    fit_df, counts = data_frame, None
+    if aggregate:
+        with instrumentation.span("arid_countreg.aggregate",
+                                  rows=len(data_frame)) as stage:
+            fit_df, counts = _aggregate_counts(data_frame, response,
+                                               con_features + cat_features)
+            stage.record(patterns=len(fit_df))
+        if verbose:
+            print(f"Aggregated {len(data_frame)} rows into {len(fit_df)} covariate patterns") # noqaE501
+
+    # Scikit Learn Model, or both models from one sparse design
+    sizes = dict(rows=len(fit_df), columns=len(con_features + cat_features))
+    if sparse:
+        with instrumentation.span("arid_countreg.sparse_fit", **sizes):
+            sk_model, glm_count = _fit_sparse_counts(
+                fit_df, response, con_features, cat_features, alpha, engine,
+                counts
+            )
+    elif engine != "statsmodels" and len(cat_features) != 0:
         preprocessor = make_column_transformer(
             (OneHotEncoder(handle_unknown="ignore"), cat_features)
         )
@@ -437,72 +1354,161 @@ def arid_countreg(data_frame, response, con_features=[], cat_features=[], model=
                 fit_intercept=True,
             ),
         )
-        sk_model = pipeline.fit(X_sk, y_sk)
-    else:
-        X_sk = data_frame[con_features]
-        y_sk = data_frame[response]
+        with instrumentation.span("arid_countreg.sklearn_fit", **sizes):
+            sk_model = _fit_counts(pipeline,
+                                   fit_df[con_features + cat_features],
+                                   fit_df[response], counts)
+    elif engine != "statsmodels":
         pipeline = make_pipeline(
             PoissonRegressor(alpha=0, fit_intercept=True, max_iter=100)
         )
-        sk_model = pipeline.fit(X_sk, y_sk)
+        with instrumentation.span("arid_countreg.sklearn_fit", **sizes):
+            sk_model = _fit_counts(pipeline,
+                                   schema.float_frame(fit_df, con_features),
+                                   fit_df[response], counts)
+
+    # Cross-validate the pipeline, masking training rows through the
+    # regressor's sample weights
+    if cv is not None:
+        groups = None if cv_groups is None \
+            else data_frame[cv_groups].to_numpy()
+        X_sk = data_frame[con_features + cat_features]
+        y_sk = data_frame[response]
+        with instrumentation.span("arid_countreg.cross_validate",
+                                  rows=len(X_sk), columns=X_sk.shape[1]):
+            _cross_validate(sk_model, X_sk, y_sk.to_numpy(), cv, groups,
+                            n_jobs,
+                            weight_param="poissonregressor__sample_weight",
+                            verbose=verbose)
+
+    # Inferential model
+    if engine != "sklearn" and not sparse:
+        with instrumentation.span("arid_countreg.design", **sizes) as stage:
+            spec = design.countreg_design(fit_df, response, con_features,
+                                          cat_features, model)
+            glm = spec.glm(fit_df, sm.families.Poisson(), exposure=counts)
+            stage.record(design_columns=len(spec.column_names))
+        with instrumentation.span("arid_countreg.statsmodels_fit",
+                                  rows=len(fit_df),
+                                  columns=len(spec.column_names)):
+            glm_count = glm.fit()
+
+    result = results.RegressionResult(sk_model, glm_count,
+                                      con_features + cat_features)
+    if verbose and glm_count is not None:
+        with instrumentation.span("arid_countreg.report"):
+            print(result.summary())
+
+    if slim:
+        # The formula model keeps the prototype frame of its design
+        # instead of the training data
+        with instrumentation.span("arid_countreg.slim"):
+            result.slim(frame=None if sparse or glm_count is None
+                        else spec.prototype)
+    return result
+
+
+@instrumentation.instrumented
+def arid_bootstrap(df, response, model="linreg", features=[], cat_features=[],
+                   countreg_model="additive", n_boot=1000, level=0.95,
+                   interval="percentile", seed=None, n_jobs=None):
+    """
+    Function that computes bootstrap confidence intervals for the
+    coefficients of the inferential model fitted by arid_linreg (OLS),
+    arid_logreg (binomial) or arid_countreg.
 
-    # Aditive inferential model
-    if model == "additive":
-        cat_features = ["C(" + i + ")" for i in cat_features]
-        con_list = "".join(
-            [f"{i}" if i is con_features[0] else f" + {i}" for i in con_features] # noqaE501
-        )
-        cat_list = "".join(
-            [f"{i}" if i is cat_features[0] else f" + {i}" for i in cat_features] # noqaE501
+    The design matrix is built once with the same feature selection as the
+    corresponding function. The replicates are then refitted directly with a
+    batched least-squares / IRLS solver, many resamples at a time, on a
+    process pool. Results are reproducible for a given seed whatever the
+    number of workers.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The input dataframe to analyze
+    response : str
+        A column name of the response variable
+    model : str (optional)
+        Which model to bootstrap: "linreg", "logreg" or "countreg"
+    features : list (optional)
+        The explanatory feature columns, or the continuous features for
+        "countreg"
+    cat_features : list (optional)
+        The categorical features for "countreg"
+    countreg_model : str (optional)
+        The "countreg" model type. Either "additive" or "interactive"
+    n_boot : int (optional)
+        The number of bootstrap replicates
+    level : float (optional)
+        The confidence level of the intervals
+    interval : str (optional)
+        The interval type: "percentile" or "bca" (bias-corrected and
+        accelerated)
+    seed : int (optional)
+        Seed of the random resamples
+    n_jobs : int (optional)
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A dataframe indexed by coefficient with the full-data
+        ``coefficient``, the bootstrap ``std_error`` and the ``lower`` and
+        ``upper`` interval bounds
+
+    Examples
+    --------
+    >>> from aridanalysis import aridanalysis
+    >>> aridanalysis.arid_bootstrap(df, "income", n_boot=2000, seed=0)
+    """
+    from . import bootstrap
+
+    # Validate input arguments
+    assert isinstance(df, pd.DataFrame), errors.INVALID_DATAFRAME
+    assert not df.empty, errors.EMPTY_DATAFRAME
+    assert response in df.columns.tolist(), errors.RESPONSE_NOT_FOUND
+    assert model in ["linreg", "logreg", "countreg"], \
+        errors.INVALID_TYPE_INPUT
+    assert isinstance(n_boot, int) and n_boot > 1, \
+        errors.INVALID_BOOTSTRAP_INPUT
+    assert 0 < level < 1, errors.INVALID_BOOTSTRAP_INPUT
+    assert interval in ["percentile", "bca"], errors.INVALID_BOOTSTRAP_INPUT
+
+    # Build the design matrix of the corresponding inferential model
+    if model == "countreg":
+        from . import design
+
+        assert ptypes.is_integer_dtype(df[response].dtype), \
+            errors.INVALID_RESPONSE_DATATYPE
+        assert countreg_model in ["additive", "interactive"], \
+            errors.INVALID_TYPE_INPUT
+        con_features, cat_features = schema.countreg_features(
+            df, response, features, cat_features
         )
-        if len(cat_list) > 0:
-            formula = f"{response} ~ {con_list} + {cat_list}"
-        else:
-            formula = f"{response} ~ {con_list}"
-        glm_count = smf.glm(
-            formula=formula, data=data_frame, family=sm.families.Poisson()
-        ).fit()
-        print(glm_count.summary())
+        spec = design.countreg_design(df, response, con_features,
+                                      cat_features, countreg_model)
+        y, X, _ = spec.matrices(df)
+        y = y.iloc[:, 0]
+        family = "poisson"
     else:
-        cat_features = ["C(" + i + ")" for i in cat_features]
-        con_list = "".join(
-            [f"{i}" if i is con_features[0] else f" + {i}" for i in con_features] # noqaE501
-        )
-        cat_list = "".join(
-            [f"{i}" if i is cat_features[0] else f" + {i}" for i in cat_features] # noqaE501
-        )
-        interact_list = "".join(
-            [
-                f"{i} * {j}"
-                if j is cat_features[0] and i is con_features[0]
-                else f" + {i} * {j}"
-                for i in con_features
-                for j in cat_features
-            ]
-        )
-        equal = set()
-        cont_interaction = ""
-        for i in con_features[0:]:
-            for j in con_features[1:]:
-                if i is con_features[0] and j is con_features[1]:
-                    cont_interaction = f"{i} * {j}"
-                    equal.update([(i, j)])
-                    if len(equal) > 0:
-                        continue
-                if i != j and (j, i) not in equal:
-                    equal.update([(i, j)])
-                    cont_interaction += f" + {i} * {j}"
-        if len(cat_features) > 0 and len(cont_interaction) > 0:
-            formula = f"{response} ~ {con_list} + {cat_list} + {interact_list} + {cont_interaction}" # noqaE501
-        elif len(cat_features) == 0 and len(cont_interaction) > 0:
-            formula = f"{response} ~ {con_list} + {cont_interaction}"
-        elif len(cat_features) > 0 and len(cont_interaction) == 0:
-            formula = f"{response} ~ {con_list} + {cat_list} + {interact_list}"
-        else:
-            formula = f"{response} ~ {con_list}"
-        glm_count = smf.glm(formula=formula,
-                            data=data_frame,
-                            family=sm.families.Poisson()).fit()
-        print(glm_count.summary())
-
-    return (sk_model, glm_count)
+        feature_list = schema.numeric_features(df, response, features)
+        assert len(feature_list) > 0, errors.NO_VALID_FEATURES
+        X = schema.float_frame(df, feature_list)
+        y = df[response]
+        family = "gaussian"
+        if model == "logreg":
+            assert y.nunique() == 2, errors.INVALID_RESPONSE_DATATYPE
+            # The larger class is the event, as in sklearn
+            y = (y == np.sort(y.unique())[1]).astype(np.float64)
+            family = "binomial"
+
+    estimate, replicates = bootstrap.bootstrap_params(
+        X, y, family, n_boot=n_boot, seed=seed, n_jobs=n_jobs
+    )
+    jackknife = None
+    if interval == "bca":
+        jackknife = bootstrap.jackknife_params(X, y, family, estimate)
+    return bootstrap.interval_table(list(X.columns), estimate, replicates,
+                                    level=level, interval=interval,
+                                    jackknife=jackknife)
@@ -0,0 +1,205 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import solvers
+from .parallel import limit_threads
+
+
+# Upper bound on the bytes of the (replicates, rows, features) intermediate
+# formed by one batch of fits
+BATCH_BYTES = 2 ** 26
+
+
+def batch_size(n, p):
+    """
+    The number of fits that are solved together for an n x p design.
+    """
+    return max(1, BATCH_BYTES // (8 * n * (p + 2)))
+
+
+def resample_weights(rng, n, size):
+    """
+    Draw ``size`` nonparametric bootstrap resamples of n rows, returned as
+    the number of times each row was drawn, shape (size, n).
+    """
+    draws = rng.integers(0, n, size=(size, n))
+    draws += (np.arange(size) * n)[:, None]
+    counts = np.bincount(draws.ravel(), minlength=size * n)
+    return counts.reshape(size, n).astype(np.float64)
+
+
+def jackknife_weights(n, groups):
+    """
+    Weights of a grouped delete-d jackknife that leaves out each of
+    ``groups`` contiguous blocks of rows in turn, shape (groups, n).
+    """
+    labels = np.arange(n) * groups // n
+    return (labels[None, :] != np.arange(groups)[:, None]).astype(np.float64)
+
+
+# The design and settings of the current worker process, set by _init_worker
+_shared = {}
+
+
+def _init_worker(X, y, family, start, threads):
+    """
+    Receive the design once per worker process and cap its BLAS threads.
+    """
+    _shared.update(X=X, y=y, family=family, start=start,
+                   limits=limit_threads(threads))
+
+
+def _replicates(task):
+    """
+    Fit one chunk of bootstrap replicates from its own seed.
+    """
+    seed, size = task
+    X, y = _shared["X"], _shared["y"]
+    weights = resample_weights(np.random.default_rng(seed), len(y), size)
+    return solvers.glm_irls_batch(X, y, weights, _shared["family"],
+                                  start=_shared["start"])
+
+
+def bootstrap_params(X, y, family, n_boot=1000, seed=None, n_jobs=None):
+    """
+    Refit a model on nonparametric bootstrap resamples of its rows.
+
+    Replicates are split into fixed-size chunks that each draw their
+    resamples from a child of one ``numpy.random.SeedSequence``, so the
+    replicates only depend on ``seed`` and not on the number of workers.
+    Each chunk is solved as one batch and the chunks are spread over a
+    process pool.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        The design matrix, shape (n, p)
+    y : numpy.ndarray
+        The response, shape (n,)
+    family : str
+        One of "gaussian", "binomial" or "poisson"
+    n_boot : int
+        The number of bootstrap replicates
+    seed : int (optional)
+        Seed of the random resamples
+    n_jobs : int (optional)
+        The number of worker processes. Defaults to the number of CPUs, and
+        1 fits every replicate in the current process.
+
+    Returns
+    -------
+    numpy.ndarray
+        The full-data coefficients, shape (p,)
+    numpy.ndarray
+        The coefficients of each replicate, shape (n_boot, p), with NaN rows
+        for replicates that did not converge
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n, p = X.shape
+    estimate = solvers.glm_irls_batch(X, y, np.ones((1, n)), family)[0]
+
+    size = batch_size(n, p)
+    sizes = [min(size, n_boot - start) for start in range(0, n_boot, size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = list(zip(seeds, sizes))
+
+    cpus = os.cpu_count() or 1
+    n_jobs = cpus if n_jobs is None else max(int(n_jobs), 1)
+    n_jobs = min(n_jobs, len(tasks))
+    threads = max(cpus // n_jobs, 1)
+    if n_jobs <= 1:
+        with limit_threads(threads):
+            _shared.update(X=X, y=y, family=family, start=estimate)
+            try:
+                chunks = [_replicates(task) for task in tasks]
+            finally:
+                _shared.clear()
+    else:
+        initargs = (X, y, family, estimate, threads)
+        with ProcessPoolExecutor(max_workers=n_jobs,
+                                 initializer=_init_worker,
+                                 initargs=initargs) as executor:
+            chunks = list(executor.map(_replicates, tasks))
+
+    return estimate, np.vstack(chunks)
+
+
+def jackknife_params(X, y, family, estimate, groups=200):
+    """
+    Refit a model with each of up to ``groups`` blocks of rows left out,
+    as needed for the BCa acceleration.
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n, p = X.shape
+    weights = jackknife_weights(n, min(n, groups))
+    size = batch_size(n, p)
+    return np.vstack([
+        solvers.glm_irls_batch(X, y, weights[start:start + size], family,
+                               start=estimate)
+        for start in range(0, len(weights), size)
+    ])
+
+
+def interval_table(names, estimate, replicates, level=0.95,
+                   interval="percentile", jackknife=None):
+    """
+    Summarize bootstrap replicates as a table of confidence intervals.
+
+    Parameters
+    ----------
+    names : list
+        The coefficient names
+    estimate : numpy.ndarray
+        The full-data coefficients, shape (p,)
+    replicates : numpy.ndarray
+        The bootstrap coefficients, shape (B, p)
+    level : float
+        The confidence level of the intervals
+    interval : str
+        Either "percentile" or "bca"
+    jackknife : numpy.ndarray (optional)
+        Leave-out coefficients used for the BCa acceleration, shape (G, p)
+
+    Returns
+    -------
+    pandas.DataFrame
+        A dataframe indexed by coefficient with ``coefficient``,
+        ``std_error``, ``lower`` and ``upper`` columns
+    """
+    from scipy.stats import norm
+
+    replicates = replicates[np.isfinite(replicates).all(axis=1)]
+    tail = (1 - level) / 2
+    probs = np.tile([tail, 1 - tail], (len(estimate), 1))
+
+    if interval == "bca":
+        below = (replicates < estimate).mean(axis=0)
+        below = np.clip(below, 1 / (len(replicates) + 1),
+                        len(replicates) / (len(replicates) + 1))
+        z0 = norm.ppf(below)
+
+        jackknife = jackknife[np.isfinite(jackknife).all(axis=1)]
+        d = jackknife.mean(axis=0) - jackknife
+        denom = 6 * np.power((d * d).sum(axis=0), 1.5)
+        accel = np.divide((d ** 3).sum(axis=0), denom,
+                          out=np.zeros(len(estimate)), where=denom > 0)
+
+        z = norm.ppf(probs)
+        shifted = z0[:, None] + z
+        probs = norm.cdf(z0[:, None] + shifted / (1 - accel[:, None] *
+                                                  shifted))
+
+    bounds = np.array([
+        np.quantile(replicates[:, j], probs[j]) for j in range(len(estimate))
+    ]).reshape(len(estimate), 2)
+    return pd.DataFrame({
+        "coefficient": estimate,
+        "std_error": replicates.std(axis=0, ddof=1),
+        "lower": bounds[:, 0],
+        "upper": bounds[:, 1],
+    }, index=pd.Index(names))
@@ -0,0 +1,184 @@
+from collections import OrderedDict
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+def _hash_values(digest, values):
+    """
+    Feed a column or index into a digest: the raw buffer of plain numeric
+    data, and ``pandas.util.hash_pandas_object`` of anything else.
+    """
+    if isinstance(values, pd.RangeIndex):
+        digest.update(repr(values).encode())
+        return
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufcmM":
+        array = np.ascontiguousarray(values.to_numpy())
+    else:
+        array = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    digest.update(array.view(np.uint8))
+
+
+def _versions():
+    """
+    The versions of this package and of the libraries that fit its models.
+    """
+    import sklearn
+    import statsmodels
+
+    from . import __version__
+
+    return (__version__, np.__version__, pd.__version__, sklearn.__version__,
+            statsmodels.__version__)
+
+
+def fingerprint(df, columns, params):
+    """
+    Hash the content of selected dataframe columns together with the
+    arguments of a fit and the versions of the fitting code.
+
+    Only the selected columns and the index are read, and numeric columns
+    are hashed straight from their buffers. The versions keep a disk store
+    from returning results of an older release after an upgrade.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The input dataframe
+    columns : list
+        The columns the fit depends on
+    params : dict
+        The remaining arguments of the fit
+
+    Returns
+    -------
+    str
+        A hexadecimal digest
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(repr(_versions()).encode())
+    _hash_values(digest, df.index)
+    for name in columns:
+        column = df[name]
+        digest.update(repr((name, str(column.dtype))).encode())
+        _hash_values(digest, column)
+    digest.update(repr(sorted(params.items())).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    A memoization store for fitted models.
+
+    Results are held in memory in least-recently-used order and evicted
+    once their pickled size exceeds ``max_bytes``. With a ``directory``
+    they are also written to a content-addressed store on disk, one file
+    per key, so that they survive the process and are shared between
+    processes that use the same directory.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The memory budget of the in-memory store, in bytes
+    directory : str (optional)
+        A directory for the on-disk store
+
+    Attributes
+    ----------
+    hits : int
+        The number of lookups that found a result
+    misses : int
+        The number of lookups that did not
+    """
+
+    def __init__(self, max_bytes=2 ** 28, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or (
+            self.directory is not None and os.path.exists(self._path(key))
+        )
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key):
+        """
+        Return the result stored under a key, or None.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key), "rb") as file:
+                payload = file.read()
+            value = pickle.loads(payload)
+            self._remember(key, value, len(payload))
+            with self._lock:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """
+        Store a result under a key. Results that cannot be pickled are not
+        stored.
+        """
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self._remember(key, value, len(payload))
+
+        if self.directory is not None:
+            # Write under a temporary name so readers never see a partial
+            # file
+            handle, temporary = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(handle, "wb") as file:
+                file.write(payload)
+            os.replace(temporary, self._path(key))
+
+    def _remember(self, key, value, size):
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def clear(self):
+        """
+        Empty the in-memory store. The on-disk store is left untouched.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+# The store used when a fitting function is called with cache=True
+default_cache = ResultCache()
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+from statsmodels.discrete.discrete_model import Logit, MNLogit
+
+
+def compress_rows(X, y):
+    """
+    Collapse duplicate (X, y) rows into distinct patterns and their counts.
+
+    Every column is factorized and the codes are combined into a single
+    integer key per row, so the grouping is one sort of an integer array
+    whatever the number of columns.
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        The features
+    y : pandas.Series
+        The response
+
+    Returns
+    -------
+    pandas.DataFrame
+        The distinct feature rows, in order of first appearance
+    pandas.Series
+        The response of each distinct row
+    numpy.ndarray
+        The number of rows sharing each pattern
+    """
+    key = np.zeros(len(y), dtype=np.int64)
+    cardinality = 1
+    for column in [y] + [X[name] for name in X.columns]:
+        codes, uniques = pd.factorize(column)
+        width = len(uniques) + 1
+        # Renumber the combined key before it could overflow
+        if cardinality * width >= 2 ** 62:
+            key, uniques = pd.factorize(key)
+            cardinality = len(uniques)
+        key = key * width + (codes + 1)
+        cardinality *= width
+
+    _, first, counts = np.unique(key, return_index=True, return_counts=True)
+    order = np.argsort(first, kind="stable")
+    first, counts = first[order], counts[order]
+    return X.iloc[first], y.iloc[first], counts.astype(np.float64)
+
+
+def _null_loglike(counts):
+    """
+    Log-likelihood of the constant-only model given the class counts.
+    """
+    counts = counts[counts > 0]
+    return float((counts * np.log(counts / counts.sum())).sum())
+
+
+class _FrequencyWeights:
+    """
+    Shared setup of the frequency-weighted discrete models.
+    """
+
+    def _set_weights(self, freq_weights):
+        n_rows = self.exog.shape[0]
+        if freq_weights is None:
+            freq_weights = np.ones(n_rows)
+        self.freq_weights = np.asarray(freq_weights, dtype=np.float64)
+        self._init_keys.append("freq_weights")
+        # Degrees of freedom count the original rows, not the patterns
+        self.df_resid += self.freq_weights.sum() - n_rows
+
+    def fit(self, *args, **kwargs):
+        results = super().fit(*args, **kwargs)
+        # The constant-only likelihood has a closed form, and statsmodels
+        # would otherwise build the null model from the number of patterns
+        inner = results._results
+        inner._cache["llnull"] = _null_loglike(self._class_counts())
+        inner.nobs = float(self.freq_weights.sum())
+        return results
+
+
+class WeightedLogit(_FrequencyWeights, Logit):
+    """
+    A statsmodels ``Logit`` whose observations carry frequency weights, so
+    that each row stands for ``freq_weights`` identical observations.
+
+    Parameters, standard errors and the likelihood-based statistics match a
+    ``Logit`` fitted on the expanded data. Row-level results, such as fitted
+    values and residuals, refer to the weighted rows.
+    """
+
+    def __init__(self, endog, exog, freq_weights=None, **kwargs):
+        super().__init__(endog, exog, **kwargs)
+        self._set_weights(freq_weights)
+
+    def _class_counts(self):
+        positive = (self.freq_weights * self.endog).sum()
+        return np.array([self.freq_weights.sum() - positive, positive])
+
+    def loglikeobs(self, params):
+        return self.freq_weights * super().loglikeobs(params)
+
+    def loglike(self, params):
+        return self.loglikeobs(params).sum()
+
+    def score_obs(self, params):
+        return self.freq_weights[:, None] * super().score_obs(params)
+
+    def score(self, params):
+        resid = self.endog - self.cdf(self.exog @ params)
+        return (self.freq_weights * resid) @ self.exog
+
+    def hessian(self, params):
+        prob = self.cdf(self.exog @ params)
+        weight = self.freq_weights * prob * (1 - prob)
+        return -(self.exog * weight[:, None]).T @ self.exog
+
+
+class WeightedMNLogit(_FrequencyWeights, MNLogit):
+    """
+    A statsmodels ``MNLogit`` whose observations carry frequency weights, so
+    that each row stands for ``freq_weights`` identical observations.
+
+    Parameters, standard errors and the likelihood-based statistics match an
+    ``MNLogit`` fitted on the expanded data. Row-level results, such as
+    fitted values and residuals, refer to the weighted rows.
+    """
+
+    def __init__(self, endog, exog, freq_weights=None, **kwargs):
+        super().__init__(endog, exog, **kwargs)
+        self._set_weights(freq_weights)
+
+    def _class_counts(self):
+        return self.freq_weights @ self.wendog
+
+    def loglikeobs(self, params):
+        # statsmodels returns one column per outcome here
+        return self.freq_weights[:, None] * super().loglikeobs(params)
+
+    def loglike(self, params):
+        return self.loglikeobs(params).sum()
+
+    def score_obs(self, params):
+        return self.freq_weights[:, None] * super().score_obs(params)
+
+    def score(self, params):
+        params = params.reshape(self.K, -1, order="F")
+        resid = self.wendog[:, 1:] - self.cdf(self.exog @ params)[:, 1:]
+        return ((self.freq_weights[:, None] * resid).T @ self.exog).flatten()
+
+    def loglike_and_score(self, params):
+        return self.loglike(params), self.score(params)
+
+    def hessian(self, params):
+        params = params.reshape(self.K, -1, order="F")
+        prob = self.cdf(self.exog @ params)[:, 1:]
+        J, K = self.J, self.K
+        H = np.empty((J - 1, K, J - 1, K))
+        for i in range(J - 1):
+            for j in range(J - 1):
+                weight = prob[:, i] * ((i == j) - prob[:, j])
+                weight = self.freq_weights * weight
+                H[i, :, j, :] = -(self.exog * weight[:, None]).T @ self.exog
+        return H.reshape((J - 1) * K, (J - 1) * K)
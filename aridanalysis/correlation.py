@@ -0,0 +1,267 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def _prepare_ranks(df, dtype):
+    """
+    Rank every complete column of ``df`` exactly once and lay the ranks out
+    for the blocked products.
+
+    Ranks are centered and scaled to unit norm, which turns the correlations
+    between complete columns into a single ``Z.T @ Z`` product and keeps the
+    products well conditioned in reduced precision. Columns with missing
+    values are left as zeros and flagged, since their correlations depend on
+    the rows each pair has in common.
+
+    Columns are ranked and centered one at a time in float64 and written
+    into an array of ``dtype``, so a float32 layout never holds the ranks of
+    the whole frame in float64.
+    """
+    n, p = df.shape
+    ranks = np.zeros((n, p), dtype=dtype, order='F')
+    missing = df.isna().any().to_numpy()
+    valid = np.zeros(p, dtype=bool)
+    for j in np.flatnonzero(~missing):
+        column = df.iloc[:, j].rank(method='average').to_numpy(
+            dtype=np.float64
+        )
+        column -= column.mean()
+        norm = np.sqrt(column @ column)
+        if norm > 0:
+            ranks[:, j] = column / norm
+            valid[j] = True
+    return {'z': ranks, 'valid': valid, 'missing': missing, 'df': df}
+
+
+def _subset_ranks(ranks, keep):
+    """
+    Turn the ranks of complete columns over all rows into their ranks over
+    the rows in ``keep`` without sorting again.
+
+    A kept value moves down by the number of dropped values below it plus
+    half of the dropped values tied with it, which preserves average ranks.
+    Average ranks are multiples of one half, so both counts are read from a
+    histogram of the doubled ranks of the dropped rows.
+    """
+    out = ranks[keep]
+    if keep.all():
+        return out
+    slots = (2 * ranks).astype(np.int64, order='F')
+    for k in range(ranks.shape[1]):
+        column = slots[:, k]
+        dropped = np.bincount(column[~keep], minlength=2 * len(ranks) + 1)
+        below = np.cumsum(dropped) - dropped
+        kept = column[keep]
+        out[:, k] -= below[kept] + dropped[kept] / 2
+    return out
+
+
+def _pearson(x, y):
+    """
+    Correlate the vector ``x`` with every column of ``y``.
+    """
+    x = x - x.mean() if len(x) else x
+    y = y - y.mean(axis=0) if len(y) else y
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (x @ y) / np.sqrt((x @ x) * (y * y).sum(axis=0))
+
+
+def _ranked(df, columns):
+    """
+    Return the ranks over all rows of some columns, ranked one at a time
+    like ``_prepare_ranks`` does.
+    """
+    ranks = np.empty((len(df), len(columns)), order='F')
+    for k, j in enumerate(columns):
+        ranks[:, k] = df.iloc[:, j].rank(method='average').to_numpy(
+            dtype=np.float64
+        )
+    return ranks
+
+
+def _pairwise(df, j, columns, missing, ranked):
+    """
+    Correlate column ``j`` with the ``columns`` of ``df``, re-ranking every
+    pair over the rows where both are present as ``df.corr('spearman')``
+    does.
+
+    The columns without missing values come with their ``ranked`` ranks
+    over all rows, which are shifted onto the rows observed in column
+    ``j``. Pairs of two columns with missing values are ranked one at a
+    time.
+    """
+    target = df.iloc[:, j].to_numpy(dtype=np.float64)
+    observed = ~np.isnan(target)
+    out = np.full(len(columns), np.nan)
+
+    complete = ~missing[columns]
+    if complete.any():
+        ranks = _subset_ranks(ranked, observed)
+        x = pd.Series(target[observed]).rank(method='average').to_numpy()
+        out[complete] = _pearson(x, ranks)
+
+    for k in np.flatnonzero(~complete):
+        other = df.iloc[:, columns[k]].to_numpy(dtype=np.float64)
+        both = observed & ~np.isnan(other)
+        x = pd.Series(target[both]).rank(method='average').to_numpy()
+        y = pd.Series(other[both]).rank(method='average').to_numpy()
+        out[k] = _pearson(x, y[:, None])[0]
+    return out
+
+
+def _block(prepared, rows, cols):
+    """
+    Compute one block of the Spearman correlation matrix.
+    """
+    z = prepared['z']
+    block = (z[:, rows].T @ z[:, cols]).astype(np.float64)
+    valid = prepared['valid']
+    block[~valid[rows], :] = np.nan
+    block[:, ~valid[cols]] = np.nan
+
+    # Pairs with missing values are recomputed over their complete rows
+    missing, df = prepared['missing'], prepared['df']
+    row_index = np.arange(rows.start, rows.stop)
+    col_index = np.arange(cols.start, cols.stop)
+    if missing[rows].any():
+        ranked = _ranked(df, col_index[~missing[cols]])
+        for i in np.flatnonzero(missing[rows]):
+            block[i, :] = _pairwise(df, row_index[i], col_index, missing,
+                                    ranked)
+    if missing[cols].any():
+        complete_rows = ~missing[rows]
+        ranked = _ranked(df, row_index[complete_rows])
+        for j in np.flatnonzero(missing[cols]):
+            block[complete_rows, j] = _pairwise(
+                df, col_index[j], row_index[complete_rows], missing, ranked
+            )
+    return np.clip(block, -1, 1)
+
+
+def _iter_blocks(prepared, p, block_size, n_jobs):
+    """
+    Yield ``(row_slice, col_slice, block)`` for the upper triangle of blocks,
+    computing at most ``2 * n_jobs`` blocks ahead of the consumer.
+    """
+    starts = range(0, p, block_size)
+    tasks = [
+        (slice(i, min(i + block_size, p)), slice(j, min(j + block_size, p)))
+        for i in starts for j in starts if j >= i
+    ]
+    if n_jobs is None or n_jobs <= 1 or len(tasks) <= 1:
+        for rows, cols in tasks:
+            yield rows, cols, _block(prepared, rows, cols)
+        return
+
+    window = 2 * n_jobs
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        for start in range(0, len(tasks), window):
+            batch = tasks[start:start + window]
+            futures = [executor.submit(_block, prepared, rows, cols)
+                       for rows, cols in batch]
+            for (rows, cols), future in zip(batch, futures):
+                yield rows, cols, future.result()
+
+
+def spearman_matrix(df, block_size=512, n_jobs=1, dtype=np.float32):
+    """
+    Compute a Spearman rank correlation matrix for a wide numeric frame.
+
+    Every column is ranked once and the correlations are then obtained as
+    blocked matrix products of the ranks, optionally computed concurrently on
+    a thread pool. Missing values are handled pairwise as in pandas: a pair
+    involving a column with missing values is re-ranked over the rows where
+    both are present, in float64. The result matches ``df.corr('spearman')``
+    up to the precision of ``dtype``.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe of numeric columns
+    block_size : int
+        The number of columns in each block of the product
+    n_jobs : int
+        The number of threads used to compute blocks
+    dtype : numpy.dtype
+        The floating point precision of the products
+
+    Returns
+    -------
+    pandas.DataFrame
+        The symmetric correlation matrix indexed by column name
+    """
+    p = df.shape[1]
+    prepared = _prepare_ranks(df, dtype)
+    out = np.empty((p, p))
+    for rows, cols, block in _iter_blocks(prepared, p, block_size, n_jobs):
+        out[rows, cols] = block
+        out[cols, rows] = block.T
+
+    diagonal = np.diagonal(out).copy()
+    np.fill_diagonal(out, np.where(np.isnan(diagonal), np.nan, 1.0))
+    return pd.DataFrame(out, index=df.columns, columns=df.columns)
+
+
+def spearman_pairs(df, top_k=None, block_size=512, n_jobs=1,
+                   dtype=np.float32):
+    """
+    Compute Spearman rank correlations as a long table of feature pairs.
+
+    Without ``top_k`` this returns the same table as
+    ``df.corr('spearman').stack().reset_index(name='corr')``. With ``top_k``
+    only the ``top_k`` distinct pairs with the strongest absolute correlation
+    are kept while the blocks are being computed, so the full p x p matrix is
+    never held in memory.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe of numeric columns
+    top_k : int (optional)
+        The number of strongest off-diagonal pairs to return
+    block_size : int
+        The number of columns in each block of the product
+    n_jobs : int
+        The number of threads used to compute blocks
+    dtype : numpy.dtype
+        The floating point precision of the products
+
+    Returns
+    -------
+    pandas.DataFrame
+        A dataframe with ``level_0``, ``level_1`` and ``corr`` columns
+    """
+    columns = np.asarray(df.columns)
+
+    if top_k is None:
+        matrix = spearman_matrix(df, block_size, n_jobs, dtype)
+        return matrix.stack().reset_index(name='corr')
+
+    p = df.shape[1]
+    prepared = _prepare_ranks(df, dtype)
+    best_i = np.empty(0, dtype=np.int64)
+    best_j = np.empty(0, dtype=np.int64)
+    best_corr = np.empty(0)
+
+    for rows, cols, block in _iter_blocks(prepared, p, block_size, n_jobs):
+        ii, jj = np.nonzero(np.isfinite(block))
+        ii += rows.start
+        jj += cols.start
+        upper = ii < jj
+        ii, jj = ii[upper], jj[upper]
+        values = block[ii - rows.start, jj - cols.start]
+
+        best_i = np.concatenate([best_i, ii])
+        best_j = np.concatenate([best_j, jj])
+        best_corr = np.concatenate([best_corr, values])
+        if len(best_corr) > top_k:
+            keep = np.argpartition(-np.abs(best_corr), top_k - 1)[:top_k]
+            best_i, best_j = best_i[keep], best_j[keep]
+            best_corr = best_corr[keep]
+
+    order = np.argsort(-np.abs(best_corr), kind='stable')
+    return pd.DataFrame({'level_0': columns[best_i[order]],
+                         'level_1': columns[best_j[order]],
+                         'corr': best_corr[order]})
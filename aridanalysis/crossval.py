@@ -0,0 +1,146 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def resolve_splits(cv, n, groups=None):
+    """
+    Materialize the train and test indices of a cross-validation scheme.
+
+    Parameters
+    ----------
+    cv : int, splitter or iterable
+        The number of folds of a ``KFold``, an sklearn splitter such as
+        ``GroupKFold`` or ``TimeSeriesSplit``, or an iterable of
+        (train, test) index arrays
+    n : int
+        The number of rows
+    groups : numpy.ndarray (optional)
+        Group labels passed to the splitter
+
+    Returns
+    -------
+    list
+        (train, test) pairs of integer index arrays
+    """
+    if isinstance(cv, (int, np.integer)):
+        from sklearn.model_selection import KFold
+
+        cv = KFold(n_splits=int(cv))
+    if hasattr(cv, "split"):
+        cv = cv.split(np.empty((n, 0)), groups=groups)
+    return [(np.asarray(train), np.asarray(test)) for train, test in cv]
+
+
+def as_slice(index):
+    """
+    Return a slice equivalent to a sorted run of consecutive indices, or
+    None if the indices are not one.
+    """
+    if len(index) > 0 and index[-1] - index[0] + 1 == len(index) and \
+            (len(index) == 1 or (np.diff(index) == 1).all()):
+        return slice(int(index[0]), int(index[-1]) + 1)
+    return None
+
+
+def _rows(data, index):
+    """
+    Select rows of an array or dataframe, as a view when they are a slice.
+    """
+    rows = as_slice(index)
+    rows = index if rows is None else rows
+    return data.iloc[rows] if hasattr(data, "iloc") else data[rows]
+
+
+def _fit_fold(estimator, X, y, train, test, weight_param):
+    """
+    Fit and score one fold.
+
+    A training set that is a consecutive run of rows is passed as a view.
+    Any other training set is expressed as zero sample weights on the full
+    data, which fits the same model without copying the rows. The
+    transformers of a pipeline, such as an encoder of categorical levels,
+    are still fitted on the training rows only, so that they never learn
+    from the test rows.
+    """
+    from sklearn.base import clone
+
+    model = clone(estimator)
+    start = time.perf_counter()
+    weight = np.zeros(len(y))
+    weight[train] = 1
+    if as_slice(train) is not None:
+        model.fit(_rows(X, train), _rows(y, train))
+    elif hasattr(model, "steps") and len(model.steps) > 1:
+        transformers = model[:-1].fit(_rows(X, train), _rows(y, train))
+        model.steps[-1][1].fit(transformers.transform(X), y, **{
+            weight_param.split("__")[-1]: weight
+        })
+    else:
+        model.fit(X, y, **{weight_param: weight})
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score = model.score(_rows(X, test), _rows(y, test))
+    score_time = time.perf_counter() - start
+    return score, fit_time, score_time
+
+
+def cross_validate(estimator, X, y, cv, groups=None, n_jobs=None,
+                   weight_param="sample_weight"):
+    """
+    Cross-validate an unfitted copy of an sklearn estimator with its folds
+    running concurrently on a thread pool.
+
+    The folds share one array of features: test sets and consecutive
+    training sets are views into it, and other training sets are masked
+    with sample weights instead of being copied.
+
+    Parameters
+    ----------
+    estimator : sklearn estimator
+        The estimator to cross-validate. It is cloned for every fold.
+    X : numpy.ndarray or pandas.DataFrame
+        The features
+    y : numpy.ndarray or pandas.Series
+        The response
+    cv : int, splitter or iterable
+        The cross-validation scheme, as accepted by ``resolve_splits``
+    groups : numpy.ndarray (optional)
+        Group labels for grouped splitters
+    n_jobs : int (optional)
+        The number of threads. Defaults to one per fold, up to the number
+        of CPUs.
+    weight_param : str
+        The name of the sample weight argument of the estimator's ``fit``
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per fold with ``train_size``, ``test_size``, ``score``,
+        ``fit_time`` and ``score_time`` columns
+    """
+    splits = resolve_splits(cv, len(y), groups)
+    if n_jobs is None:
+        n_jobs = min(len(splits), os.cpu_count() or 1)
+
+    def run(split):
+        return _fit_fold(estimator, X, y, split[0], split[1], weight_param)
+
+    if n_jobs <= 1:
+        results = [run(split) for split in splits]
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(run, splits))
+
+    scores, fit_times, score_times = zip(*results)
+    return pd.DataFrame({
+        "train_size": [len(train) for train, _ in splits],
+        "test_size": [len(test) for _, test in splits],
+        "score": scores,
+        "fit_time": fit_times,
+        "score_time": score_times,
+    }, index=pd.RangeIndex(len(splits), name="fold"))
@@ -0,0 +1,459 @@
+import copy
+from functools import lru_cache
+import itertools
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+
+
+def category_levels(column):
+    """
+    Return the levels patsy's ``C()`` would use for a column: the declared
+    categories of a categorical column and the sorted distinct values of
+    any other column.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return pd.Index(column.cat.categories)
+    return pd.Index(np.sort(column.dropna().unique()))
+
+
+def reference_levels(column):
+    """
+    Return the ``category_levels`` of a column with its first observed level
+    moved to the front, where treatment coding takes it as the reference.
+
+    An unobserved reference level would make the intercept the sum of the
+    indicators, so the dense and the sparse designs of arid_countreg both
+    replace it with the first level that has rows.
+    """
+    levels = category_levels(column)
+    observed = np.flatnonzero(np.bincount(
+        levels.get_indexer(column.dropna()), minlength=1
+    ))
+    if len(observed) and observed[0] > 0:
+        first = observed[0]
+        levels = levels[[first] + [i for i in range(len(levels))
+                                   if i != first]]
+    return levels
+
+
+class SparseDesign(BaseEstimator, TransformerMixin):
+    """
+    Build a treatment-coded additive design matrix as a sparse CSR matrix.
+
+    The columns follow the order and names of the patsy formula
+    ``y ~ con_1 + ... + C(cat_1) + ...``: the intercept, then one indicator
+    per non-reference level of each categorical feature, then the
+    continuous features. Memory scales with the number of nonzeros, so
+    categoricals with tens of thousands of levels stay cheap. Levels that
+    were not seen by ``fit`` are encoded like the reference level, and the
+    reference is the first level that has rows.
+
+    Parameters
+    ----------
+    con_features : list
+        The continuous features
+    cat_features : list
+        The categorical features
+    intercept : bool
+        Whether the first column is an intercept
+    """
+
+    def __init__(self, con_features=(), cat_features=(), intercept=True):
+        self.con_features = con_features
+        self.cat_features = cat_features
+        self.intercept = intercept
+
+    def fit(self, X, y=None):
+        self.levels_ = {name: reference_levels(X[name])
+                        for name in self.cat_features}
+        names = ["Intercept"] if self.intercept else []
+        for name, levels in self.levels_.items():
+            names += [f"C({name})[T.{level}]" for level in levels[1:]]
+        self.feature_names_ = names + list(self.con_features)
+        return self
+
+    def without_intercept(self):
+        """
+        Return a fitted copy that leaves out the intercept column.
+        """
+        design = copy.copy(self)
+        design.intercept = False
+        design.feature_names_ = [name for name in self.feature_names_
+                                 if name != "Intercept"]
+        return design
+
+    def get_feature_names_out(self, input_features=None):
+        return np.asarray(self.feature_names_, dtype=object)
+
+    def transform(self, X):
+        n = len(X)
+        rows, cols, values = [], [], []
+        offset = 0
+        if self.intercept:
+            rows.append(np.arange(n))
+            cols.append(np.zeros(n, dtype=np.int64))
+            values.append(np.ones(n))
+            offset = 1
+
+        for name, levels in self.levels_.items():
+            codes = levels.get_indexer(X[name])
+            present = np.flatnonzero(codes > 0)
+            rows.append(present)
+            cols.append(offset + codes[present] - 1)
+            values.append(np.ones(len(present)))
+            offset += len(levels) - 1
+
+        for name in self.con_features:
+            column = X[name].to_numpy(dtype=np.float64)
+            present = np.flatnonzero(column != 0)
+            rows.append(present)
+            cols.append(np.full(len(present), offset))
+            values.append(column[present])
+            offset += 1
+
+        return sparse.csr_matrix(
+            (np.concatenate(values),
+             (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n, offset)
+        )
+
+
+def countreg_formula(response, con_features, cat_features, model):
+    """
+    Build the patsy formula of arid_countreg's inferential model.
+
+    Parameters
+    ----------
+    response : str
+        A column name of the response variable
+    con_features : list
+        The continuous explanatory variables
+    cat_features : list
+        The categorical explanatory variables
+    model : str
+        Model type. Either "additive" or "interactive"
+
+    Returns
+    -------
+    str
+        The model formula
+    """
+    cat_features = ["C(" + i + ")" for i in cat_features]
+    con_list = "".join(
+        [f"{i}" if i is con_features[0] else f" + {i}" for i in con_features] # noqaE501
+    )
+    cat_list = "".join(
+        [f"{i}" if i is cat_features[0] else f" + {i}" for i in cat_features] # noqaE501
+    )
+    if model == "additive":
+        if len(cat_list) > 0:
+            return f"{response} ~ {con_list} + {cat_list}"
+        return f"{response} ~ {con_list}"
+
+    interact_list = "".join(
+        [
+            f"{i} * {j}"
+            if j is cat_features[0] and i is con_features[0]
+            else f" + {i} * {j}"
+            for i in con_features
+            for j in cat_features
+        ]
+    )
+    equal = set()
+    cont_interaction = ""
+    for i in con_features[0:]:
+        for j in con_features[1:]:
+            if i is con_features[0] and j is con_features[1]:
+                cont_interaction = f"{i} * {j}"
+                equal.update([(i, j)])
+                if len(equal) > 0:
+                    continue
+            if i != j and (j, i) not in equal:
+                equal.update([(i, j)])
+                cont_interaction += f" + {i} * {j}"
+    if len(cat_features) > 0 and len(cont_interaction) > 0:
+        formula = f"{response} ~ {con_list} + {cat_list} + {interact_list} + {cont_interaction}" # noqaE501
+    elif len(cat_features) == 0 and len(cont_interaction) > 0:
+        formula = f"{response} ~ {con_list} + {cont_interaction}"
+    elif len(cat_features) > 0 and len(cont_interaction) == 0:
+        formula = f"{response} ~ {con_list} + {cat_list} + {interact_list}"
+    else:
+        formula = f"{response} ~ {con_list}"
+    return formula
+
+
+def model_desc(formula):
+    """
+    Build the patsy ``ModelDesc`` of a formula produced by
+    ``countreg_formula`` without going through patsy's parser, which
+    recurses once per term and overflows on wide interactive models.
+
+    The right-hand side is a sum of single factors and pairwise ``a * b``
+    products, which expand to ``a + b + a:b`` with repeated terms dropped,
+    exactly as patsy would.
+    """
+    import patsy
+
+    response, rhs = formula.split(" ~ ")
+    terms = [patsy.INTERCEPT]
+    for piece in rhs.split(" + "):
+        if not piece.strip():
+            # countreg_formula leaves empty pieces when a list is empty
+            continue
+        factors = [patsy.EvalFactor(code) for code in piece.split(" * ")]
+        expanded = [patsy.Term([factor]) for factor in factors]
+        if len(factors) > 1:
+            expanded.append(patsy.Term(factors))
+        terms += [term for term in expanded if term not in terms]
+    return patsy.ModelDesc([patsy.Term([patsy.EvalFactor(response)])], terms)
+
+
+class CountregDesign:
+    """
+    A compiled arid_countreg model specification.
+
+    The formula is built and parsed by patsy once, against a prototype
+    frame holding every categorical level, and the resulting ``DesignInfo``
+    pair is kept. Design matrices for new data are then evaluated directly
+    from it, so repeated fits and scoring skip formula construction and
+    parsing.
+
+    Parameters
+    ----------
+    response : str
+        A column name of the response variable
+    con_features : tuple
+        The continuous explanatory variables
+    cat_features : tuple
+        The categorical explanatory variables
+    model : str
+        Model type. Either "additive" or "interactive"
+    levels : tuple
+        (column, levels) pairs for every feature patsy treats as categorical
+
+    Attributes
+    ----------
+    formula : str
+        The model formula
+    prototype : pandas.DataFrame
+        A small frame holding every categorical level, from which patsy
+        rebuilds the same design
+    design_infos : tuple
+        The patsy ``DesignInfo`` of the response and of the design
+    column_names : list
+        The names of the design columns
+    term_slices : dict
+        The slice of design columns of each term
+    """
+
+    def __init__(self, response, con_features, cat_features, model, levels):
+        import patsy
+
+        self.formula = countreg_formula(response, list(con_features),
+                                        list(cat_features), model)
+        levels = dict(levels)
+        rows = max([len(values) for values in levels.values()] + [1])
+        prototype = {response: np.zeros(rows, dtype=np.int64)}
+        for name in con_features + cat_features:
+            if name in levels:
+                values = list(levels[name])
+                prototype[name] = pd.Categorical(
+                    [values[i % len(values)] for i in range(rows)]
+                    if values else [None] * rows, categories=values
+                )
+            else:
+                prototype[name] = np.zeros(rows)
+
+        self.prototype = pd.DataFrame(prototype)
+        y, X = patsy.dmatrices(model_desc(self.formula), self.prototype,
+                               eval_env=patsy.EvalEnvironment({}),
+                               return_type="dataframe")
+        self.design_infos = (y.design_info, X.design_info)
+        self.column_names = X.design_info.column_names
+        self.term_slices = X.design_info.term_name_slices
+        # The data column behind each factor, such as "g" for "C(g)"
+        self._columns = {response: response}
+        self._columns.update({name: name for name in con_features})
+        self._columns.update({f"C({name})": name for name in cat_features})
+
+    def _factor_values(self, data, factor):
+        """
+        Evaluate one factor as a float matrix: the column of a numerical
+        factor, or the contrast rows of a categorical factor's levels,
+        with the mask of rows where it is missing.
+        """
+        info = self.design_infos[1].factor_infos.get(factor) or \
+            self.design_infos[0].factor_infos[factor]
+        column = data[self._columns[factor.name()]]
+        if info.type == "numerical":
+            values = column.to_numpy(dtype=np.float64)
+            return values[:, None], np.isnan(values)
+        codes = pd.Index(info.categories).get_indexer(column)
+        missing = column.isna().to_numpy()
+        if np.any((codes < 0) & ~missing):
+            raise ValueError(
+                f"{factor.name()} has levels missing from the design"
+            )
+        return codes, missing
+
+    def _build(self, data):
+        """
+        Build the response and design matrix with NumPy.
+
+        Every factor is evaluated and coded once, and each term's columns
+        are filled into one preallocated column-major array as products of
+        its factors' columns, in patsy's column order.
+        """
+        y_info, x_info = self.design_infos
+        values, missing = {}, np.zeros(len(data), dtype=bool)
+        for factor in list(y_info.factor_infos) + list(x_info.factor_infos):
+            values[factor], factor_missing = self._factor_values(data,
+                                                                 factor)
+            missing |= factor_missing
+        keep = np.flatnonzero(~missing) if missing.any() else slice(None)
+        values = {factor: value[keep] for factor, value in values.items()}
+        n = len(data) - int(missing.sum())
+
+        # Column-major, so that every design column is contiguous
+        X = np.empty((n, len(x_info.column_names)), order="F")
+        coded = {}
+        for term, subterms in x_info.term_codings.items():
+            column = x_info.term_slices[term].start
+            for subterm in subterms:
+                factor_columns = []
+                for factor in subterm.factors:
+                    contrast = subterm.contrast_matrices.get(factor)
+                    key = (factor, None if contrast is None
+                           else tuple(contrast.column_suffixes))
+                    if key not in coded:
+                        block = values[factor] if contrast is None \
+                            else contrast.matrix[values[factor]]
+                        block = np.asfortranarray(block)
+                        coded[key] = [block[:, j] for j in
+                                      range(block.shape[1])]
+                    factor_columns.append(coded[key])
+
+                # patsy's left-most factor iterates fastest
+                for combination in itertools.product(*factor_columns[::-1]):
+                    out = X[:, column]
+                    if not combination:
+                        out[:] = 1
+                    elif len(combination) == 1:
+                        out[:] = combination[0]
+                    else:
+                        np.multiply(combination[0], combination[1], out=out)
+                        for other in combination[2:]:
+                            np.multiply(out, other, out=out)
+                    column += 1
+
+        index = data.index[keep]
+        (factor,) = y_info.factor_infos
+        y = pd.DataFrame(values[factor], index=index,
+                         columns=y_info.column_names)
+        X = pd.DataFrame(X, index=index, columns=x_info.column_names,
+                         copy=False)
+        return y, X, missing if missing.any() else None
+
+    def matrices(self, data, engine="numpy"):
+        """
+        Evaluate the response and design matrix for a dataframe, dropping
+        rows with missing values.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The data to evaluate
+        engine : str
+            "numpy" builds the matrices directly from the compiled term
+            codings, which is much faster for interactive models with many
+            terms. "patsy" evaluates them with patsy term by term.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The response
+        pandas.DataFrame
+            The design matrix
+        numpy.ndarray
+            A mask of the dropped rows, or None if no row was dropped
+        """
+        if engine == "numpy":
+            return self._build(data)
+
+        import patsy
+        from statsmodels.formula.formulatools import NAAction
+
+        na_action = NAAction()
+        y, X = patsy.build_design_matrices(self.design_infos, data,
+                                           NA_action=na_action,
+                                           return_type="dataframe")
+        missing = getattr(na_action, "missing_mask", None)
+        return y, X, missing if np.any(missing) else None
+
+    def glm(self, data, family, **kwargs):
+        """
+        Build a statsmodels GLM for a dataframe, equivalent to
+        ``smf.glm(formula, data, family=family, **kwargs)``.
+        """
+        import statsmodels.api as sm
+
+        y, X, missing = self.matrices(data)
+        model = sm.GLM(y, X, family=family, missing="drop",
+                       missing_idx=missing, formula=self.formula,
+                       design_info=self.design_infos[1], **kwargs)
+        # Attached as from_formula does, so the model can predict from
+        # dataframes and be pickled
+        model.formula = self.formula
+        model.data.frame = data
+        return model
+
+
+@lru_cache(maxsize=128)
+def compile_countreg(response, con_features, cat_features, model, levels):
+    """
+    Return the cached ``CountregDesign`` of a schema, compiling it on the
+    first request.
+    """
+    return CountregDesign(response, con_features, cat_features, model,
+                          levels)
+
+
+def countreg_design(data, response, con_features, cat_features, model):
+    """
+    Return the compiled design of arid_countreg's inferential model for a
+    dataframe.
+
+    Designs are held in an LRU cache keyed by the schema: the response,
+    the features, the model type and the levels of every feature patsy
+    treats as categorical. Refitting or scoring data with the same schema
+    reuses the compiled design. As in ``SparseDesign``, the reference of a
+    categorical is its first level that has rows.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The data the design will be evaluated on
+    response : str
+        A column name of the response variable
+    con_features : list
+        The continuous explanatory variables
+    cat_features : list
+        The categorical explanatory variables
+    model : str
+        Model type. Either "additive" or "interactive"
+
+    Returns
+    -------
+    CountregDesign
+        The compiled design
+    """
+    levels = tuple(
+        (name, tuple(reference_levels(data[name]).tolist()))
+        for name in con_features + cat_features
+        if name in cat_features or data[name].dtype.kind not in "iufc"
+    )
+    return compile_countreg(response, tuple(con_features),
+                            tuple(cat_features), model, levels)
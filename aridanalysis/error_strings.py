@@ -8,3 +8,12 @@ INVALID_ALPHA_INPUT          = "ERROR: INVALID ALPHA INPUT DATATYPE"
 NO_VALID_FEATURES            = "ERROR: NO VALID FEATURES AVAILABLE"
 INVALID_INPUT_LIST           = "ERROR: INPUT FEATURE ARGUMENT NOT A LIST"
 INVALID_TYPE_INPUT           = "ERROR: INVALID MODEL TYPE SPECIFIED"
+INVALID_ENGINE_INPUT         = "ERROR: INVALID ENGINE INPUT"
+FEATURE_NOT_FOUND            = "ERROR: FEATURE SELECTION NOT PRESENT IN DATAFRAME"
+INCOMPATIBLE_ACCUMULATOR     = "ERROR: ACCUMULATORS DO NOT SHARE RESPONSE AND FEATURES"
+INVALID_BY_INPUT             = "ERROR: INVALID GROUPING COLUMN INPUT"
+INVALID_BOOTSTRAP_INPUT      = "ERROR: INVALID BOOTSTRAP INPUT"
+INVALID_CV_INPUT             = "ERROR: INVALID CROSS-VALIDATION INPUT"
+INVALID_CACHE_INPUT          = "ERROR: INVALID CACHE INPUT"
+INVALID_DTYPE_INPUT          = "ERROR: INVALID FLOATING POINT DTYPE INPUT"
+MISSING_VALUES               = "ERROR: MISSING VALUES IN FEATURES OR RESPONSE"
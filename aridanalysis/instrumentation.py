@@ -0,0 +1,220 @@
+from collections import defaultdict
+from contextlib import contextmanager
+import functools
+import threading
+import time
+
+# The registered listeners, replaced rather than mutated so that emitting
+# spans never needs a lock
+_listeners = ()
+_lock = threading.Lock()
+
+
+class Span:
+    """
+    A timed stage of an entry point.
+
+    Spans are named after the entry point and the stage, such as
+    ``"arid_linreg.statsmodels_fit"``, and every registered listener is
+    called with the span once the stage finishes.
+
+    Attributes
+    ----------
+    name : str
+        The name of the stage
+    sizes : dict
+        The sizes of the data the stage worked on, such as its rows and
+        columns
+    duration : float
+        The wall time of the stage, in seconds
+    """
+
+    __slots__ = ("name", "sizes", "start", "duration")
+
+    def __init__(self, name, sizes):
+        self.name = name
+        self.sizes = sizes
+        self.start = self.duration = None
+
+    def __repr__(self):
+        return f"Span({self.name!r}, duration={self.duration}, sizes={self.sizes})" # noqaE501
+
+    def record(self, **sizes):
+        """
+        Add sizes that are only known once the stage has run.
+        """
+        self.sizes.update(sizes)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.duration = time.perf_counter() - self.start
+        for listener in _listeners:
+            listener(self)
+        return False
+
+
+class _NullSpan:
+    """
+    The span returned while nothing listens, which records nothing.
+    """
+
+    __slots__ = ()
+
+    def record(self, **sizes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, **sizes):
+    """
+    Time a stage as a context manager.
+
+    Without listeners a shared null span is returned, so an instrumented
+    stage costs one function call.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage
+    **sizes
+        The sizes of the data the stage works on
+
+    Examples
+    --------
+    >>> with span("arid_linreg.design", rows=len(df)) as stage:
+    ...     X = build(df)
+    ...     stage.record(columns=X.shape[1])
+    """
+    if not _listeners:
+        return _NULL_SPAN
+    return Span(name, sizes)
+
+
+def instrumented(function):
+    """
+    Time every call of an entry point as a span named after it.
+    """
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _listeners:
+            return function(*args, **kwargs)
+        with Span(name, {}):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def add_listener(listener):
+    """
+    Register a callable that receives every finished span.
+
+    Spans are emitted in the process and thread that ran the stage, so the
+    group fits that ``by=`` fans out to worker processes are not seen.
+    """
+    global _listeners
+    with _lock:
+        _listeners = _listeners + (listener,)
+
+
+def remove_listener(listener):
+    """
+    Unregister a listener added with ``add_listener``.
+    """
+    global _listeners
+    with _lock:
+        remaining = list(_listeners)
+        remaining.remove(listener)
+        _listeners = tuple(remaining)
+
+
+@contextmanager
+def listening(listener=None):
+    """
+    Register a listener for the duration of a block.
+
+    Parameters
+    ----------
+    listener : callable (optional)
+        The listener. Defaults to a new ``SpanStats``.
+
+    Yields
+    ------
+    callable
+        The registered listener
+
+    Examples
+    --------
+    >>> with listening() as stats:
+    ...     for df in frames:
+    ...         arid_linreg(df, "y", verbose=False)
+    >>> stats.report()
+    """
+    listener = SpanStats() if listener is None else listener
+    add_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+class SpanStats:
+    """
+    A listener that aggregates the durations of spans across many calls.
+
+    Attributes
+    ----------
+    durations : dict
+        The durations of every span, in seconds, by span name
+    """
+
+    def __init__(self):
+        self.durations = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def __call__(self, span):
+        with self._lock:
+            self.durations[span.name].append(span.duration)
+
+    def clear(self):
+        """
+        Forget the recorded durations.
+        """
+        with self._lock:
+            self.durations.clear()
+
+    def report(self):
+        """
+        Summarize the recorded durations.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per span name, in the order the spans were first seen,
+            with the number of calls and the total, median (p50) and 95th
+            percentile (p95) duration in seconds
+        """
+        import numpy as np
+        import pandas as pd
+
+        with self._lock:
+            durations = {name: np.asarray(values)
+                         for name, values in self.durations.items()}
+        return pd.DataFrame(
+            [[len(values), values.sum(), *np.percentile(values, [50, 95])]
+             for values in durations.values()],
+            index=pd.Index(list(durations), name="span"),
+            columns=["count", "total", "p50", "p95"],
+        )
@@ -0,0 +1,309 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+import io
+import os
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.7, where groups are sent to the workers
+    shared_memory = None
+
+import numpy as np
+import pandas as pd
+
+
+def _is_plain(values):
+    """
+    Whether a column can be shared as its raw numpy buffer.
+    """
+    return isinstance(values, np.ndarray) and values.dtype.kind in "biufcmM"
+
+
+def share_frame(df, order):
+    """
+    Copy the rows of a dataframe, in the given order, into one shared memory
+    segment so that worker processes can read them without pickling.
+
+    Numeric, boolean and datetime columns are stored as their raw buffers.
+    Every other column, including the categorical and string columns, is
+    stored as integer codes whose small table of unique values travels in
+    the returned layout instead.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The dataframe to share
+    order : numpy.ndarray
+        The row positions, in the order they are written
+
+    Returns
+    -------
+    multiprocessing.shared_memory.SharedMemory
+        The segment holding the column data. The caller owns it and must
+        close and unlink it.
+    list
+        The layout of each column: (name, dtype, offset, uniques), where
+        uniques is None for columns stored as raw buffers. A numeric or
+        datetime index is stored under the name None.
+    """
+    arrays = []
+    index = df.index.to_numpy()
+    if _is_plain(index):
+        arrays.append((None, index, None))
+    for name, column in df.items():
+        values = column.to_numpy()
+        if _is_plain(values):
+            arrays.append((name, values, None))
+        else:
+            codes, uniques = pd.factorize(column)
+            arrays.append((name, codes, pd.Series(uniques).array))
+
+    # Keep every column 8-byte aligned within the segment
+    offsets = []
+    size = 0
+    for _, values, _ in arrays:
+        offsets.append(size)
+        size += -(-values.dtype.itemsize * len(order) // 8) * 8
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+    layout = []
+    for (name, values, uniques), offset in zip(arrays, offsets):
+        target = np.ndarray(len(order), dtype=values.dtype, buffer=shm.buf,
+                            offset=offset)
+        np.take(values, order, out=target)
+        layout.append((name, values.dtype, offset, uniques))
+        del target
+    return shm, layout
+
+
+def read_frame(buffer, layout, n, start, stop):
+    """
+    Rebuild a copy of rows ``start:stop`` of a frame written by
+    ``share_frame``.
+    """
+    data = {}
+    index = None
+    for name, dtype, offset, uniques in layout:
+        view = np.ndarray(n, dtype=dtype, buffer=buffer, offset=offset)
+        values = view[start:stop].copy()
+        del view
+        if uniques is not None:
+            values = uniques.take(values, allow_fill=True)
+        if name is None:
+            index = pd.Index(values)
+        else:
+            data[name] = values
+    return pd.DataFrame(data, index=index)
+
+
+# The shared frame of the current worker process, set by _init_worker
+_shared = {}
+
+
+def _init_worker(name, layout, n):
+    """
+    Attach a worker process to the shared frame once, so that tasks only
+    carry the offsets of their group.
+    """
+    _shared.update(shm=shared_memory.SharedMemory(name=name), layout=layout,
+                   n=n)
+
+
+def limit_threads(threads):
+    """
+    Cap the BLAS threads of the current process with threadpoolctl, which
+    scikit-learn installs, and leave them as they are without it.
+
+    Returns
+    -------
+    context manager
+        Restores the previous limits on exit
+    """
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return nullcontext()
+    return threadpool_limits(limits=threads)
+
+
+def _fit(function, df, kwargs, threads):
+    """
+    Fit one group's models with capped BLAS threads and no printout.
+    """
+    from . import aridanalysis
+
+    # Keep each worker's BLAS from competing with the other workers, and
+    # keep the per-group printouts out of the parent's output
+    with limit_threads(threads), redirect_stdout(io.StringIO()):
+        return getattr(aridanalysis, function)(df, **kwargs)
+
+
+def _fit_group(task):
+    """
+    Fit one group's models inside a worker process.
+    """
+    start, stop, function, kwargs, threads = task
+    df = read_frame(_shared["shm"].buf, _shared["layout"], _shared["n"],
+                    start, stop)
+    return _fit(function, df, kwargs, threads)
+
+
+def _fit_frame(task):
+    """
+    Fit one group's models, sent whole to a worker process.
+    """
+    df, function, kwargs, threads = task
+    return _fit(function, df, kwargs, threads)
+
+
+def fit_groups(function, df, by, kwargs, n_jobs=None):
+    """
+    Fit one of the package's models separately for every group of a
+    dataframe, fanning the groups out to a process pool.
+
+    The frame is sorted by group once and written to shared memory, which
+    each worker attaches to when it starts, so a task only carries the
+    offsets of its group. Without shared memory (Python 3.7) every task
+    carries its group's rows instead. BLAS threads are capped so that the
+    workers together use about one thread per core.
+
+    Parameters
+    ----------
+    function : str
+        The name of the fitting function, such as "arid_linreg"
+    df : pandas.DataFrame
+        The input dataframe
+    by : str
+        The column whose values define the groups. It is not passed on to
+        the fits.
+    kwargs : dict
+        The remaining arguments of the fitting function
+    n_jobs : int (optional)
+        The number of worker processes. Defaults to the number of CPUs, and
+        1 fits the groups in the current process.
+
+    Returns
+    -------
+    dict
+        The fitted (sklearn model, statsmodel) pair for each group
+    pandas.DataFrame
+        The coefficients of every model, one row per group and engine
+    """
+    cpus = os.cpu_count() or 1
+    n_jobs = cpus if n_jobs is None else max(int(n_jobs), 1)
+
+    codes, labels = pd.factorize(df[by], sort=True)
+    keep = np.flatnonzero(codes >= 0)
+    order = keep[np.argsort(codes[keep], kind="stable")]
+    bounds = np.concatenate(
+        [[0], np.cumsum(np.bincount(codes[keep], minlength=len(labels)))]
+    )
+
+    n_jobs = min(n_jobs, len(labels))
+    threads = max(cpus // max(n_jobs, 1), 1)
+    features = df.drop(columns=[by])
+    if n_jobs <= 1:
+        fitted = [
+            _fit(function, features.take(order[bounds[g]:bounds[g + 1]]),
+                 kwargs, threads)
+            for g in range(len(labels))
+        ]
+    elif shared_memory is None:
+        tasks = [(features.take(order[bounds[g]:bounds[g + 1]]), function,
+                  kwargs, threads) for g in range(len(labels))]
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            fitted = list(executor.map(_fit_frame, tasks))
+    else:
+        shm, layout = share_frame(features, order)
+        tasks = [(bounds[g], bounds[g + 1], function, kwargs, threads)
+                 for g in range(len(labels))]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=_init_worker,
+                initargs=(shm.name, layout, len(order))
+            ) as executor:
+                fitted = list(executor.map(_fit_group, tasks))
+        finally:
+            shm.close()
+            shm.unlink()
+
+    models = dict(zip(labels.tolist(), fitted))
+    return models, coefficient_table(models, by)
+
+
+def _transformed_names(transformer):
+    """
+    Return the output feature names of a pipeline of transformers, or None
+    when they cannot be resolved.
+
+    scikit-learn < 1.0 has no ``get_feature_names_out``, and only the
+    ``get_feature_names`` of the last step is tried there.
+    """
+    if hasattr(transformer, "get_feature_names_out"):
+        return transformer.get_feature_names_out()
+    try:
+        return transformer.steps[-1][1].get_feature_names()
+    except (AttributeError, NotImplementedError):
+        return None
+
+
+def model_coefficients(model):
+    """
+    Return the coefficients of a fitted sklearn or statsmodels model as a
+    series indexed by term name.
+
+    Multiclass coefficients are labelled ``term[class]``.
+    """
+    if model is None:
+        return pd.Series(dtype=np.float64)
+
+    if hasattr(model, "params"):
+        params = model.params
+        if isinstance(params, pd.DataFrame):
+            params = params.stack()
+            params.index = [f"{term}[{cls}]" for term, cls in params.index]
+            return params
+        if not isinstance(params, pd.Series):
+            params = pd.Series(params, index=model.model.exog_names)
+        return params
+
+    names = None
+    if hasattr(model, "steps"):
+        if len(model.steps) > 1:
+            names = _transformed_names(model[:-1])
+        model = model[-1]
+    if names is None:
+        names = getattr(model, "feature_names_in_", None)
+    coef = np.atleast_2d(model.coef_)
+    if names is None:
+        names = [f"x{i}" for i in range(coef.shape[1])]
+    names = [str(name) for name in names]
+
+    intercept = np.atleast_1d(getattr(model, "intercept_", 0.0))
+    if getattr(model, "fit_intercept", False):
+        coef = np.column_stack([intercept, coef])
+        names = ["Intercept"] + names
+    if coef.shape[0] == 1:
+        return pd.Series(coef[0], index=names)
+    classes = getattr(model, "classes_", range(coef.shape[0]))
+    return pd.Series(coef.ravel(), index=[
+        f"{name}[{cls}]" for cls in classes for name in names
+    ])
+
+
+def coefficient_table(models, by):
+    """
+    Combine the coefficients of per-group (sklearn, statsmodel) pairs into
+    one table with a row per group and engine.
+    """
+    rows = {}
+    for group, (skl_model, sm_model) in models.items():
+        if skl_model is not None:
+            rows[(group, "sklearn")] = model_coefficients(skl_model)
+        if sm_model is not None:
+            rows[(group, "statsmodels")] = model_coefficients(sm_model)
+    if len(rows) == 0:
+        return pd.DataFrame()
+    table = pd.concat(rows, axis=1, sort=False).T
+    table.index.names = [by, "engine"]
+    return table
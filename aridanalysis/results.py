@@ -0,0 +1,189 @@
+import functools
+import inspect
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# The statistics kept on a statsmodel when its data is dropped
+_STATISTICS = ["bse", "tvalues", "pvalues", "llf", "aic", "bic"]
+
+
+class RegressionResult:
+    """
+    The fitted models of a regression, together with the features they use
+    and the warnings raised while fitting them.
+
+    The result unpacks and indexes like the (sklearn model, statsmodel)
+    pair the regressors return, so ``skl_model, sm_model = result`` keeps
+    working. The coefficient table and the statsmodels summary are only
+    built when they are first accessed.
+
+    Parameters
+    ----------
+    sklearn_model : sklearn estimator
+        The fitted sklearn model, or None
+    statsmodel : statsmodels results
+        The fitted statsmodel, or None
+    features : list
+        The resolved feature names
+    warnings : list (optional)
+        The warnings raised while fitting
+    """
+
+    __slots__ = ("sklearn_model", "statsmodel", "features", "warnings",
+                 "_coef_table", "_summary")
+
+    def __init__(self, sklearn_model, statsmodel, features, warnings=None):
+        self.sklearn_model = sklearn_model
+        self.statsmodel = statsmodel
+        self.features = features
+        self.warnings = warnings
+        self._coef_table = self._summary = None
+
+    def __iter__(self):
+        return iter((self.sklearn_model, self.statsmodel))
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        return (self.sklearn_model, self.statsmodel)[index]
+
+    def __repr__(self):
+        return (f"RegressionResult(sklearn_model={self.sklearn_model!r}, "
+                f"statsmodel={type(self.statsmodel).__name__}, "
+                f"features={self.features!r})")
+
+    @property
+    def coef_table(self):
+        """
+        The coefficients of both models, one column per engine.
+        """
+        if self._coef_table is None:
+            from .parallel import model_coefficients
+
+            columns = {}
+            if self.statsmodel is not None:
+                columns["statsmodels"] = model_coefficients(self.statsmodel)
+            if self.sklearn_model is not None:
+                columns["sklearn"] = model_coefficients(self.sklearn_model)
+            self._coef_table = pd.DataFrame(columns)
+        return self._coef_table
+
+    def summary(self):
+        """
+        Return the summary of the statsmodel, or None without one.
+        """
+        if self._summary is None and self.statsmodel is not None:
+            self._summary = self.statsmodel.summary()
+        return self._summary
+
+    def slim(self, frame=None):
+        """
+        Drop the references to the training data held by the statsmodel,
+        keeping its coefficients, covariance and the statistics used for
+        inference and prediction.
+
+        The summary is rendered beforehand and kept on the result, since
+        statsmodels can no longer build it without the data.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame (optional)
+            A small frame that replaces the training dataframe of a formula
+            model, from which the design is rebuilt when it is unpickled
+
+        Returns
+        -------
+        RegressionResult
+            The result itself
+        """
+        model = self.statsmodel
+        if model is None:
+            return self
+        inner = getattr(model, "model", None)
+        rows = None if inner is None else len(inner.endog)
+        try:
+            self.summary()
+        except NotImplementedError:
+            # Regularized fits have no summary
+            pass
+
+        if hasattr(model, "remove_data"):
+            # Some results, such as multinomial ones, also wipe statistics
+            # like their standard errors, which are restored afterwards
+            cache = getattr(getattr(model, "_results", model), "_cache", {})
+            for name in _STATISTICS:
+                getattr(model, name, None)
+            kept = {name: value for name, value in cache.items()
+                    if value is not None and
+                    (np.ndim(value) == 0 or len(value) != rows)}
+            model.remove_data()
+            for name, value in kept.items():
+                if cache.get(name) is None:
+                    cache[name] = value
+        else:
+            for name in inner._data_attr:
+                *path, attribute = name.split(".")
+                setattr(functools.reduce(getattr, path, inner), attribute,
+                        None)
+        if inner is not None:
+            # Row-level arrays that statsmodels leaves behind, such as the
+            # exposure of a GLM or the dummy response of a multinomial logit
+            for name, value in list(vars(inner).items()):
+                if isinstance(value, np.ndarray) and value.ndim > 0 and \
+                        len(value) == rows:
+                    setattr(inner, name, None)
+
+        data = getattr(inner, "data", None)
+        if frame is not None and data is not None:
+            # Formula models keep their original data to rebuild the design
+            # when unpickled, which the frame is enough for
+            data.frame = frame
+            data.orig_endog = data.orig_exog = None
+        return self
+
+
+def _results(value):
+    """
+    The RegressionResult objects returned by a regressor: the result
+    itself, or the values of a dict of results.
+    """
+    if isinstance(value, RegressionResult):
+        return [value]
+    if isinstance(value, dict):
+        return [item for item in value.values()
+                if isinstance(item, RegressionResult)]
+    return []
+
+
+def collects_warnings(function):
+    """
+    Record the warnings raised by a regressor on the results it returns.
+
+    The warnings are issued again once the call returns, unless it was
+    made with ``verbose=False``, so that batch jobs can inspect them on
+    the result instead of in their logs.
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        arguments = signature.bind(*args, **kwargs).arguments
+        caught = []
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                value = function(*args, **kwargs)
+            for result in _results(value):
+                if result.warnings is None:
+                    result.warnings = [item.message for item in caught]
+            return value
+        finally:
+            if arguments.get("verbose", True):
+                for item in caught:
+                    warnings.warn_explicit(item.message, item.category,
+                                           item.filename, item.lineno)
+
+    return wrapper
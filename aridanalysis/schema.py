@@ -0,0 +1,179 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# The values accepted by the dtype= option of the entry points, where None
+# keeps each computation at its default precision
+FLOAT_DTYPES = (None, "float32", "float64", np.float32, np.float64)
+
+
+def select_columns(df, include, exclude=()):
+    """
+    Return the names of the columns whose dtype matches ``include``, as
+    ``DataFrame.select_dtypes`` would, leaving out the excluded columns.
+
+    The selection runs on an empty slice of the dataframe, which carries its
+    dtypes but no rows, so no data is copied whatever the size of the frame.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The input dataframe
+    include : str or list
+        The dtypes to select, such as "number" or ["category", "object"]
+    exclude : list (optional)
+        Columns to leave out, such as the response
+
+    Returns
+    -------
+    list
+        The selected column names in dataframe order
+    """
+    excluded = set(exclude)
+    return [name for name in df.iloc[:0].select_dtypes(include).columns
+            if name not in excluded]
+
+
+def numeric_features(df, response, features):
+    """
+    Resolve the numeric explanatory features of a dataframe, warning about
+    the columns that are discarded.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The input dataframe
+    response : str or list
+        A column name of the response variable, or several of them
+    features : list
+        A list of user selected feature columns, empty to use all of them
+
+    Returns
+    -------
+    list
+        The selected numeric feature names in dataframe order
+    """
+    responses = set(response if isinstance(response, list) else [response])
+    feature_list = select_columns(df, "number", exclude=responses)
+
+    # Report features that have been discarded to the user
+    candidates = [name for name in df.columns if name not in responses]
+    if len(candidates) != len(feature_list):
+        numeric = set(feature_list)
+        non_numeric_features = [
+            feature for feature in candidates if feature not in numeric
+        ]
+        warnings.warn(
+            f"These features are non-numeric and will be discarded: {non_numeric_features}" # noqaE501
+        )
+
+    # Create a subset of user selected features if supplied
+    if len(features) > 0:
+        feature_list = [
+            feature for feature in feature_list if feature in set(features)
+        ]
+        # Report any user selected features that were not found
+        if len(feature_list) != len(features):
+            missing_features = [
+                feature for feature in features if not (feature in feature_list) # noqaE501
+            ]
+            warnings.warn(
+                f"These user-selected features are not present in data: {missing_features}" # noqaE501
+            )
+
+    return feature_list
+
+
+def countreg_features(df, response, con_features, cat_features):
+    """
+    Default arid_countreg's continuous features to every numeric column and
+    its categorical features to every category or object column.
+    """
+    if len(con_features) == 0:
+        con_features = select_columns(df, "number", exclude=[response])
+    if len(cat_features) == 0:
+        cat_features = select_columns(df, ["category", "object"],
+                                      exclude=[response])
+    return con_features, cat_features
+
+
+def float_frame(df, columns, order="C", dtype=None):
+    """
+    Build the feature block of a dataframe as a single contiguous float
+    array, wrapped in a dataframe that shares its memory.
+
+    The array is allocated once and filled column by column, so building it
+    takes about the memory of the block itself, where ``df[columns]``
+    followed by a conversion would hold two or three copies of it.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The input dataframe
+    columns : list
+        The feature columns
+    order : str (optional)
+        The memory layout of the array: "C" (row-major) or "F"
+        (column-major). The layout is kept by ``to_numpy()`` on the result.
+    dtype : numpy.dtype (optional)
+        The precision of the array, float64 by default. Each column is cast
+        as it is copied in, so a float32 block never goes through float64.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The features, backed by one float array
+    """
+    dtype = np.float64 if dtype is None else dtype
+    values = np.empty((len(df), len(columns)), dtype=dtype, order=order)
+    for j, name in enumerate(columns):
+        column = df[name]
+        if isinstance(column.dtype, np.dtype):
+            values[:, j] = column.to_numpy()
+        else:
+            # Nullable extension columns mark missing values with pd.NA
+            values[:, j] = column.to_numpy(dtype=values.dtype,
+                                           na_value=np.nan)
+    return pd.DataFrame(values, index=df.index, columns=columns, copy=False)
+
+
+def cast_frame(df, columns, dtype):
+    """
+    Select columns of a dataframe with its numeric columns cast to one
+    precision, as a single float block built by ``float_frame``. Other
+    columns are kept as they are.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The input dataframe
+    columns : list
+        The columns to select
+    dtype : numpy.dtype
+        The precision of the numeric columns
+
+    Returns
+    -------
+    pandas.DataFrame
+        The selected columns in the given order
+    """
+    numeric = set(select_columns(df, "number"))
+    frame = float_frame(df, [name for name in columns if name in numeric],
+                        order="F", dtype=dtype)
+    for position, name in enumerate(columns):
+        if name not in numeric:
+            frame.insert(position, name, df[name])
+    return frame
+
+
+def float64_frame(X):
+    """
+    Return a feature block from ``float_frame`` in float64, as the
+    statsmodels estimators and inference need, without copying a block that
+    already is.
+    """
+    if (X.dtypes == np.float64).all():
+        return X
+    order = "F" if X.to_numpy().flags.f_contiguous else "C"
+    return float_frame(X, X.columns.tolist(), order=order)
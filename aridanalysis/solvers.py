@@ -0,0 +1,784 @@
+import numpy as np
+import pandas as pd
+
+
+class OLSFactorization:
+    """
+    A single SVD of a design matrix that is shared between the sklearn and
+    statsmodels least-squares fits.
+
+    The decomposition provides the Moore-Penrose pseudoinverse, the singular
+    values, the rank and whether a constant lies in the column space of the
+    design, which are everything both libraries would otherwise recompute
+    from their own copy of X.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        The design matrix, shape (n, p)
+    rcond : float
+        Cutoff for small singular values, relative to the largest one. The
+        default matches statsmodels' ``pinv_extended``.
+    """
+
+    def __init__(self, X, rcond=1e-15):
+        X = np.asarray(X, dtype=np.float64)
+        n, p = X.shape
+        u, s, vt = np.linalg.svd(X, full_matrices=False)
+        cutoff = rcond * s.max() if len(s) else 0
+        inv_s = np.divide(1, s, out=np.zeros_like(s), where=s > cutoff)
+
+        self.singular_values = s
+        self.pinv = (vt.T * inv_s) @ u.T
+        self.normalized_cov_params = self.pinv @ self.pinv.T
+        self.rank = int(np.linalg.matrix_rank(np.diag(s)))
+
+        # A constant is in the column space when appending a ones column
+        # does not raise the rank, which is the check statsmodels performs
+        # on a copy of X. With 1 = u c + r, the matrix [1, X] equals
+        # [u, r / |r|] @ [[c, diag(s) vt], [|r|, 0]], so its singular values
+        # come from that small matrix rather than a second SVD of the data.
+        eps = np.finfo(np.float64).eps
+        ones = u.sum(axis=0)
+        rest = np.linalg.norm(np.ones(n) - u @ ones)
+        small = np.zeros((len(s) + 1, p + 1))
+        small[:-1, 0] = ones
+        small[:-1, 1:] = s[:, None] * vt
+        small[-1, 0] = rest
+        s_aug = np.linalg.svd(small, compute_uv=False)
+        rank = (s > s.max() * max(n, p) * eps).sum() if len(s) else 0
+        rank_aug = (s_aug > s_aug.max() * max(n, p + 1) * eps).sum()
+        self.has_constant = bool(rank == rank_aug)
+
+    def solve(self, y):
+        """
+        Return the minimum-norm least-squares coefficients for one or more
+        responses.
+        """
+        return self.pinv @ np.asarray(y, dtype=np.float64)
+
+
+class GramFactorization:
+    """
+    An eigendecomposition of the Gram matrix X'X, exposing the same
+    attributes as ``OLSFactorization`` for fits that only have the
+    sufficient statistics of a design rather than the design itself.
+
+    Parameters
+    ----------
+    xtx : numpy.ndarray
+        The Gram matrix X'X, shape (p, p)
+    xsum : numpy.ndarray
+        The column sums of X, shape (p,)
+    n : int
+        The number of rows in X
+    rcond : float (optional)
+        Cutoff for small eigenvalues, relative to the largest one. Forming
+        X'X squares the condition number of X, so the default is scaled to
+        the rounding error of the Gram matrix rather than of X.
+    """
+
+    def __init__(self, xtx, xsum, n, rcond=None):
+        xtx = np.asarray(xtx, dtype=np.float64)
+        p = xtx.shape[0]
+        if rcond is None:
+            rcond = 10 * max(p, 1) * np.finfo(np.float64).eps
+        w, v = np.linalg.eigh(xtx)
+        w, v = np.maximum(w[::-1], 0), v[:, ::-1]
+        keep = w > rcond * (w.max() if len(w) else 0)
+        w = np.where(keep, w, 0)
+        inv_w = np.divide(1, w, out=np.zeros_like(w), where=keep)
+
+        self.eigenvalues = w
+        self.eigenvectors = v
+        self.singular_values = np.sqrt(w)
+        self.pinv_gram = (v * inv_w) @ v.T
+        self.normalized_cov_params = self.pinv_gram
+        self.rank = int(keep.sum())
+
+        # The ones vector lies in the column space of X exactly when its
+        # projection keeps the full squared norm n, i.e. 1'X (X'X)^+ X'1 = n
+        xsum = np.asarray(xsum, dtype=np.float64)
+        explained = xsum @ self.pinv_gram @ xsum if n > 0 else 0.0
+        self.has_constant = bool(abs(n - explained) <= 1e-8 * max(n, 1))
+
+    def solve(self, xty):
+        """
+        Return the minimum-norm least-squares coefficients from X'y.
+        """
+        return self.pinv_gram @ np.asarray(xty, dtype=np.float64)
+
+    def surrogate(self, xty, yty):
+        """
+        Build a small design (Xs, ys) with the same X'X, X'y and residual
+        sum of squares as the full data.
+
+        With X'X = V diag(w) V', the rows of Xs are diag(sqrt(w)) V' and ys
+        the matching projection of X'y, followed by one zero row whose
+        response carries the residual sum of squares.
+        """
+        xty = np.asarray(xty, dtype=np.float64)
+        s, v = self.singular_values, self.eigenvectors
+        keep = self.eigenvalues > 0
+        inv_s = np.divide(1, s, out=np.zeros_like(s), where=keep)
+        projected = (v.T @ xty) * inv_s
+        rss = max(float(yty) - projected @ projected, 0.0)
+        exog = np.vstack([s[:, None] * v.T, np.zeros(len(s))])
+        endog = np.append(projected, np.sqrt(rss))
+        return exog, endog
+
+
+def sklearn_ols(coef, feature_names, factorization):
+    """
+    Build a fitted ``LinearRegression`` (without intercept) from known
+    coefficients.
+    """
+    from sklearn.linear_model import LinearRegression
+
+    model = LinearRegression(fit_intercept=False)
+    model.coef_ = np.asarray(coef)
+    model.intercept_ = 0.0
+    model.rank_ = factorization.rank
+    model.singular_ = factorization.singular_values
+    model.n_features_in_ = len(feature_names)
+    if all(isinstance(name, str) for name in feature_names):
+        model.feature_names_in_ = np.asarray(feature_names, dtype=object)
+    return model
+
+
+def statsmodels_ols(X, y, factorization):
+    """
+    Build a fitted statsmodels OLS result that reuses a precomputed
+    factorization instead of decomposing X again.
+    """
+    from statsmodels.regression.linear_model import OLS
+
+    model = OLS(y, X, hasconst=factorization.has_constant)
+    model.pinv_wexog = factorization.pinv
+    model.normalized_cov_params = factorization.normalized_cov_params
+    model.wexog_singular_values = factorization.singular_values
+    model.rank = factorization.rank
+    return model.fit()
+
+
+def sklearn_ridge(coef, feature_names, alpha):
+    """
+    Build a fitted ``Ridge`` (without intercept) from known coefficients.
+    """
+    from sklearn.linear_model import Ridge
+
+    model = Ridge(alpha, fit_intercept=False)
+    model.coef_ = np.asarray(coef)
+    model.intercept_ = 0.0
+    model.n_iter_ = None
+    model.n_features_in_ = len(feature_names)
+    if all(isinstance(name, str) for name in feature_names):
+        model.feature_names_in_ = np.asarray(feature_names, dtype=object)
+    return model
+
+
+def fit_from_moments(xtx, xty, yty, xsum, ysum, n, feature_names,
+                     regularization=None, alpha=1, engine="both"):
+    """
+    Fit analogous sklearn and statsmodels linear models from the sufficient
+    statistics of a design instead of the design itself.
+
+    The statsmodels model is fitted on a (p + 1)-row surrogate design with
+    the same X'X, X'y and residual sum of squares as the full data, and its
+    observation counts are then restored, so parameters, standard errors,
+    R-squared and the information criteria match a fit on all n rows.
+
+    Parameters
+    ----------
+    xtx : numpy.ndarray
+        The Gram matrix X'X, shape (p, p)
+    xty : numpy.ndarray
+        The cross products X'y, shape (p,)
+    yty : float
+        The sum of squared responses
+    xsum : numpy.ndarray
+        The column sums of X, shape (p,)
+    ysum : float
+        The sum of the responses
+    n : int
+        The number of observations
+    feature_names : list
+        The names of the columns of X
+    regularization : str (optional)
+        None for OLS or "L2" for ridge regression
+    alpha : float
+        The sklearn ridge penalty. statsmodels receives ``alpha / 3``.
+    engine : str
+        Which models to build: 'sklearn', 'statsmodels' or 'both'
+
+    Returns
+    -------
+    sklearn.linear_model.LinearRegression or sklearn.linear_model.Ridge
+        A fitted sklearn model, or None if not requested
+    statsmodels.regression.linear_model.RegressionResultsWrapper
+        A fitted statsmodel, or None if not requested
+    """
+    from statsmodels.regression.linear_model import OLS
+
+    xtx = np.asarray(xtx, dtype=np.float64)
+    xty = np.asarray(xty, dtype=np.float64)
+    factorization = GramFactorization(xtx, xsum, n)
+
+    skl_model = sm_model = None
+    if engine != "statsmodels":
+        if regularization == "L2":
+            coef = np.linalg.solve(xtx + alpha * np.eye(len(xty)), xty)
+            skl_model = sklearn_ridge(coef, feature_names, alpha)
+        else:
+            coef = factorization.solve(xty)
+            skl_model = sklearn_ols(coef, feature_names, factorization)
+
+    if engine != "sklearn":
+        exog, endog = factorization.surrogate(xty, yty)
+        exog = pd.DataFrame(exog, columns=feature_names)
+        model = OLS(endog, exog, hasconst=factorization.has_constant)
+        model.nobs = float(n)
+        model.df_resid = n - factorization.rank
+        if regularization == "L2":
+            sm_model = model.fit_regularized(L1_wt=0, alpha=alpha / 3)
+        else:
+            sm_model = model.fit()
+            # These are computed lazily from the surrogate rows, so they are
+            # primed with the values of the full data instead
+            cache = sm_model._results._cache
+            cache['nobs'] = float(n)
+            cache['uncentered_tss'] = float(yty)
+            cache['centered_tss'] = float(yty) - ysum * ysum / n
+    return skl_model, sm_model
+
+
+def fit_ols(X, y, factorization=None, engine="both"):
+    """
+    Fit analogous sklearn and statsmodels OLS models from one factorization.
+
+    When only the sklearn model is requested it is fitted directly, since
+    the pseudoinverse and covariance are only needed for inference.
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        The feature matrix
+    y : pandas.Series
+        The response
+    factorization : OLSFactorization (optional)
+        A precomputed factorization of X
+    engine : str
+        Which models to build: 'sklearn', 'statsmodels' or 'both'
+
+    Returns
+    -------
+    sklearn.linear_model.LinearRegression
+        A fitted sklearn model, or None if not requested
+    statsmodels.regression.linear_model.RegressionResultsWrapper
+        A fitted statsmodel, or None if not requested
+    """
+    from sklearn.linear_model import LinearRegression
+
+    if engine == "sklearn" and factorization is None:
+        return LinearRegression(fit_intercept=False).fit(X, y), None
+
+    if factorization is None:
+        factorization = OLSFactorization(X)
+    skl_model = sm_model = None
+    if engine != "statsmodels":
+        coef = factorization.solve(y)
+        skl_model = sklearn_ols(coef, list(X.columns), factorization)
+    if engine != "sklearn":
+        sm_model = statsmodels_ols(X, y, factorization)
+    return skl_model, sm_model
+
+
+def fit_multi_response(X, Y, regularization=None, alpha=1, sm_alpha=None,
+                       engine="both"):
+    """
+    Fit analogous sklearn and statsmodels linear models for several
+    responses that share one design matrix.
+
+    The design is decomposed once. OLS coefficients for every response come
+    from one product of the pseudoinverse with the response matrix and each
+    statsmodels result reuses the same factorization. Ridge coefficients
+    come from one SVD for all responses. The L1 penalties are still solved
+    per response, but share a single precomputed Gram matrix.
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        The feature matrix, shape (n, p)
+    Y : pandas.DataFrame
+        The responses, one column each, shape (n, k)
+    regularization : str (optional)
+        One of None, "L1", "L2" or "L1L2"
+    alpha : float
+        The sklearn regularization strength
+    sm_alpha : float (optional)
+        The statsmodels regularization strength, if it differs from alpha
+    engine : str
+        Which models to build: 'sklearn', 'statsmodels' or 'both'
+
+    Returns
+    -------
+    list
+        One (sklearn model, statsmodel) pair per column of Y, with None in
+        place of a model that was not requested
+    """
+    from statsmodels.regression.linear_model import OLS
+    from statsmodels.base.elastic_net import RegularizedResults
+
+    sm_alpha = alpha if sm_alpha is None else sm_alpha
+    feature_names = list(X.columns)
+    fit_skl = engine != "statsmodels"
+    fit_sm = engine != "sklearn"
+    Yv = Y.to_numpy(dtype=np.float64)
+    skl_models = [None] * Yv.shape[1]
+    sm_models = [None] * Yv.shape[1]
+
+    if regularization is None:
+        factorization = OLSFactorization(X)
+        coefs = factorization.solve(Yv)
+        for j, name in enumerate(Y.columns):
+            if fit_skl:
+                skl_models[j] = sklearn_ols(coefs[:, j], feature_names,
+                                            factorization)
+            if fit_sm:
+                sm_models[j] = statsmodels_ols(X, Y[name], factorization)
+
+    elif regularization == "L2":
+        u, s, vt = np.linalg.svd(X.to_numpy(dtype=np.float64),
+                                 full_matrices=False)
+        q = (u.T @ Yv) * s[:, None]
+        s2 = s * s
+        for j, name in enumerate(Y.columns):
+            if fit_skl:
+                coef = vt.T @ (q[:, j] / (s2 + alpha))
+                skl_models[j] = sklearn_ridge(coef, feature_names, alpha)
+            if fit_sm:
+                # statsmodels scales the ridge penalty by the number of rows
+                coef = vt.T @ (q[:, j] / (s2 + sm_alpha * X.shape[0]))
+                sm_models[j] = RegularizedResults(OLS(Y[name], X), coef)
+
+    else:
+        from sklearn.linear_model import Lasso, ElasticNet
+
+        estimator = Lasso if regularization == "L1" else ElasticNet
+        l1_wt = 1 if regularization == "L1" else 0.5
+        Xv = np.asarray(X, dtype=np.float64, order='F')
+        gram = Xv.T @ Xv
+        for j, name in enumerate(Y.columns):
+            if fit_skl:
+                skl_models[j] = estimator(alpha, fit_intercept=False,
+                                          precompute=gram).fit(X, Y[name])
+            if fit_sm:
+                sm_models[j] = OLS(Y[name], X).fit_regularized(
+                    L1_wt=l1_wt, alpha=sm_alpha
+                )
+
+    return list(zip(skl_models, sm_models))
+
+
+def glm_irls_batch(X, y, weights, family, start=None, max_iter=100,
+                   tol=1e-8):
+    """
+    Fit a canonical-link GLM for many observation weightings at once with
+    iteratively reweighted least squares.
+
+    Each row of ``weights`` defines one fit, such as one bootstrap replicate
+    whose weights count how often each observation was drawn. All fits of a
+    batch advance together, with their weighted Gram matrices formed by one
+    batched product per iteration.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        The design matrix, shape (n, p)
+    y : numpy.ndarray
+        The response, shape (n,)
+    weights : numpy.ndarray
+        The observation weights of each fit, shape (B, n)
+    family : str
+        One of "gaussian", "binomial" (logit link) or "poisson" (log link)
+    start : numpy.ndarray (optional)
+        Starting coefficients, shape (p,) or (B, p). By default the fits
+        start from the response, as statsmodels does.
+    max_iter : int
+        The maximum number of iterations
+    tol : float
+        Relative tolerance on the coefficient updates
+
+    Returns
+    -------
+    numpy.ndarray
+        The coefficients of each fit, shape (B, p), with NaN rows for fits
+        that did not converge
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    weights = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+    n_fits = weights.shape[0]
+
+    if start is not None:
+        eta = np.broadcast_to(np.asarray(start) @ X.T, weights.shape)
+    elif family == "binomial":
+        eta = np.broadcast_to(np.log((y + 0.5) / (1.5 - y)), weights.shape)
+    elif family == "poisson":
+        eta = np.broadcast_to(np.log((y + y.mean()) / 2), weights.shape)
+    else:
+        eta = np.broadcast_to(y, weights.shape)
+
+    params = np.full((n_fits, X.shape[1]), np.nan)
+    converged = np.zeros(n_fits, dtype=bool)
+    for _ in range(max_iter if family != "gaussian" else 1):
+        if family == "binomial":
+            mu = 1 / (1 + np.exp(-eta))
+            var = np.maximum(mu * (1 - mu), 1e-10)
+        elif family == "poisson":
+            mu = np.exp(np.minimum(eta, 700))
+            var = np.maximum(mu, 1e-10)
+        else:
+            mu = eta
+            var = np.ones_like(eta)
+
+        # One weighted least-squares step on the working response
+        wv = weights * var
+        z = eta + (y - mu) / var
+        gram = np.matmul((X[None, :, :] * wv[:, :, None]).transpose(0, 2, 1),
+                         X)
+        rhs = (wv * z) @ X
+        try:
+            updated = np.linalg.solve(gram, rhs[:, :, None])[:, :, 0]
+        except np.linalg.LinAlgError:
+            updated = np.matmul(np.linalg.pinv(gram), rhs[:, :, None])[
+                :, :, 0]
+
+        change = np.abs(updated - params).max(axis=1)
+        scale = 1 + np.abs(updated).max(axis=1)
+        converged = change <= tol * scale
+        params = updated
+        eta = params @ X.T
+        if converged.all():
+            break
+
+    if family == "gaussian":
+        converged = np.ones(n_fits, dtype=bool)
+    params[~(converged & np.isfinite(params).all(axis=1))] = np.nan
+    return params
+
+
+def _schur_partition(gram):
+    """
+    Split a sparse symmetric matrix into the rows that couple with many
+    others, like the intercept and the continuous features, and the
+    remaining block, which is typically (block) diagonal.
+
+    Returns the indices of the inner and outer rows, a solver for the inner
+    block and the dense inner-outer and outer-outer blocks.
+    """
+    from scipy import sparse
+    from scipy.sparse.linalg import splu
+
+    gram = sparse.csc_matrix(gram)
+    p = gram.shape[0]
+    coupled = gram.getnnz(axis=0) > max(np.sqrt(p), 32)
+    inner, outer = np.flatnonzero(~coupled), np.flatnonzero(coupled)
+
+    A = gram[inner][:, inner].tocsc()
+    B = gram[inner][:, outer].toarray()
+    C = gram[outer][:, outer].toarray()
+    if A.nnz == np.count_nonzero(A.diagonal()):
+        diagonal = A.diagonal()
+        solve_A = (lambda rhs: rhs / diagonal.reshape(
+            (-1,) + (1,) * (rhs.ndim - 1)))
+    else:
+        solve_A = splu(A).solve
+    return inner, outer, solve_A, A, B, C
+
+
+def sparse_solve(gram, rhs):
+    """
+    Solve a sparse symmetric positive definite system, such as the normal
+    equations of a GLM on a one-hot design, through the dense Schur
+    complement of its coupled rows.
+
+    A direct sparse factorization of such a matrix fills in the dense rows
+    of the intercept and the continuous features, which takes memory
+    quadratic in the number of levels.
+    """
+    inner, outer, solve_A, _, B, C = _schur_partition(gram)
+    if len(outer) == 0:
+        return solve_A(rhs)
+    W = solve_A(B) if len(inner) else B
+    solution = np.empty(len(rhs))
+    solution[outer] = np.linalg.solve(C - B.T @ W,
+                                      rhs[outer] - W.T @ rhs[inner])
+    if len(inner):
+        solution[inner] = solve_A(rhs[inner] - B @ solution[outer])
+    return solution
+
+
+def sparse_inverse_diagonal(gram):
+    """
+    Return the diagonal of the inverse of a sparse symmetric positive
+    definite matrix, such as the Hessian of a GLM on a one-hot design.
+
+    The rows that couple with many others, like the intercept and the
+    continuous features, are split off and handled through their dense
+    Schur complement. The remaining block is typically (block) diagonal, so
+    the diagonal of its inverse is cheap and the dense inverse is never
+    formed.
+    """
+    inner, outer, solve_A, A, B, C = _schur_partition(gram)
+    if A.nnz == np.count_nonzero(A.diagonal()):
+        inner_diag = 1 / A.diagonal()
+    else:
+        inner_diag = np.empty(len(inner))
+        block = max(1, 2 ** 22 // max(len(inner), 1))
+        for start in range(0, len(inner), block):
+            stop = min(start + block, len(inner))
+            unit = np.zeros((len(inner), stop - start))
+            unit[np.arange(start, stop), np.arange(stop - start)] = 1
+            inner_diag[start:stop] = solve_A(unit)[np.arange(start, stop),
+                                                   np.arange(stop - start)]
+
+    diagonal = np.empty(gram.shape[0])
+    W = solve_A(B) if len(inner) else B
+    schur_inv = np.linalg.inv(C - B.T @ W)
+    diagonal[outer] = np.diag(schur_inv)
+    diagonal[inner] = inner_diag + ((W @ schur_inv) * W).sum(axis=1)
+    return diagonal
+
+
+class SparsePoissonResults:
+    """
+    The results of a Poisson regression fitted on a sparse design by
+    ``poisson_irls_sparse``.
+
+    The attributes mirror the ones of a statsmodels ``GLMResults``. Standard
+    errors are computed from the sparse Hessian the first time they are
+    accessed, without ever forming the dense covariance matrix.
+    """
+
+    def __init__(self, params, mu, y, weights, gram, active, design=None):
+        self.params = params
+        self.fittedvalues = mu
+        self.nobs = float(weights.sum())
+        self.df_model = int(active.sum()) - 1
+        self.df_resid = self.nobs - active.sum()
+        self.design = design
+        self._gram = gram
+        self._active = active
+        self._bse = None
+
+        from scipy.special import gammaln, xlogy
+
+        loglike = xlogy(y, mu) - mu - gammaln(y + 1)
+        self.llf = float(weights @ loglike)
+        self.deviance = float(2 * weights @ (xlogy(y, y / mu) - (y - mu)))
+        self.aic = -2 * self.llf + 2 * (self.df_model + 1)
+
+    @property
+    def bse(self):
+        if self._bse is None:
+            bse = np.full(len(self.params), np.nan)
+            bse[self._active] = np.sqrt(sparse_inverse_diagonal(self._gram))
+            self._bse = pd.Series(bse, index=self.params.index)
+        return self._bse
+
+    @property
+    def tvalues(self):
+        return self.params / self.bse
+
+    @property
+    def pvalues(self):
+        from scipy.stats import norm
+
+        return 2 * norm.sf(np.abs(self.tvalues))
+
+    def conf_int(self, alpha=0.05):
+        from scipy.stats import norm
+
+        q = norm.ppf(1 - alpha / 2)
+        return pd.DataFrame({0: self.params - q * self.bse,
+                             1: self.params + q * self.bse})
+
+    def predict(self, exog, exposure=None):
+        """
+        Predict mean counts for a sparse design or, when the results hold
+        the design builder, for a dataframe of features.
+        """
+        if isinstance(exog, pd.DataFrame):
+            exog = self.design.transform(exog)
+        eta = exog @ self.params.fillna(0).to_numpy()
+        if exposure is not None:
+            eta = eta + np.log(exposure)
+        return np.exp(eta)
+
+    def remove_data(self):
+        """
+        Drop the fitted values and the Hessian, keeping the standard errors
+        computed from it, as statsmodels' ``remove_data`` does.
+        """
+        self.bse
+        self.fittedvalues = self._gram = None
+
+    def summary(self):
+        """
+        Return the coefficient table, laid out like the one of statsmodels'
+        summary.
+        """
+        conf_int = self.conf_int()
+        return pd.DataFrame({
+            "coef": self.params,
+            "std err": self.bse,
+            "z": self.tvalues,
+            "P>|z|": self.pvalues,
+            "[0.025": conf_int[0],
+            "0.975]": conf_int[1],
+        })
+
+
+def poisson_irls_sparse(X, y, feature_names, offset=None, weights=None,
+                        design=None, max_iter=100, tol=1e-8):
+    """
+    Fit a log-link Poisson regression on a sparse design matrix with
+    iteratively reweighted least squares.
+
+    Every iteration forms the weighted Gram matrix X'WX as a sparse product
+    and solves it with ``sparse_solve``, so memory scales with the number of
+    nonzeros of X and the number of dense columns rather than with its
+    dense size. Columns without
+    any nonzero, such as unobserved categories, get a NaN coefficient where
+    statsmodels' pseudoinverse would give them zero.
+
+    Parameters
+    ----------
+    X : scipy.sparse matrix
+        The design matrix, shape (n, p), including the intercept column
+    y : numpy.ndarray
+        The response counts, shape (n,)
+    feature_names : list
+        The names of the columns of X
+    offset : numpy.ndarray (optional)
+        An offset added to the linear predictor, such as a log exposure
+    weights : numpy.ndarray (optional)
+        Frequency weights of the rows
+    design : SparseDesign (optional)
+        The builder of X, kept to predict from dataframes
+    max_iter : int
+        The maximum number of iterations
+    tol : float
+        Absolute tolerance on the change of the deviance, as in statsmodels
+
+    Returns
+    -------
+    SparsePoissonResults
+        The fitted model
+    """
+    from scipy import sparse
+    from scipy.special import xlogy
+
+    X = sparse.csr_matrix(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    offset = np.zeros(len(y)) if offset is None else np.asarray(offset)
+    weights = np.ones(len(y)) if weights is None else np.asarray(weights)
+
+    active = X.getnnz(axis=0) > 0
+    fit_X = X if active.all() else X[:, np.flatnonzero(active)]
+    XT = fit_X.T.tocsr()
+
+    eta = np.log((y + y.mean()) / 2)
+    mu = np.exp(eta)
+    deviance = np.inf
+    for _ in range(max_iter):
+        # Clip the variance as statsmodels does, so that levels whose counts
+        # are all zero keep the Gram matrix nonsingular
+        clipped = np.maximum(mu, np.finfo(np.float64).eps)
+        var = weights * clipped
+        z = eta - offset + (y - mu) / clipped
+        gram = (XT @ sparse.diags(var) @ fit_X).tocsc()
+        params = sparse_solve(gram, XT @ (var * z))
+
+        eta = fit_X @ params + offset
+        mu = np.exp(np.minimum(eta, 700))
+        previous = deviance
+        deviance = 2 * weights @ (xlogy(y, y / mu) - (y - mu))
+        if abs(deviance - previous) <= tol:
+            break
+
+    var = weights * np.maximum(mu, np.finfo(np.float64).eps)
+    gram = (XT @ sparse.diags(var) @ fit_X).tocsc()
+    coef = np.full(X.shape[1], np.nan)
+    coef[active] = params
+    return SparsePoissonResults(
+        pd.Series(coef, index=feature_names), mu, y, weights, gram, active,
+        design
+    )
+
+
+def regularization_path(X, y, alphas, regularization, sm_alphas=None):
+    """
+    Compute sklearn and statsmodels coefficient paths over a grid of alphas
+    from one shared precomputation.
+
+    For "L2" a single SVD of X gives the closed-form ridge solution for every
+    alpha in both libraries. For "L1" and "L1L2" the Gram matrix is computed
+    once and coordinate descent is warm-started from the largest alpha to
+    the smallest. statsmodels' OLS elastic net minimizes the same objective
+    as sklearn's, so its path is read from the same solve after applying
+    statsmodels' zero tolerance.
+
+    Parameters
+    ----------
+    X : numpy.ndarray or pandas.DataFrame
+        The feature matrix, shape (n, p)
+    y : numpy.ndarray or pandas.Series
+        The response, shape (n,)
+    alphas : array-like
+        The sklearn regularization strengths
+    regularization : str
+        One of "L1", "L2" or "L1L2"
+    sm_alphas : array-like (optional)
+        The statsmodels regularization strengths, if they differ from alphas
+
+    Returns
+    -------
+    numpy.ndarray
+        The sklearn coefficients, shape (len(alphas), p)
+    numpy.ndarray
+        The statsmodels coefficients, shape (len(alphas), p)
+    """
+    X = np.asarray(X, dtype=np.float64, order='F')
+    y = np.asarray(y, dtype=np.float64)
+    alphas = np.asarray(alphas, dtype=np.float64)
+    sm_alphas = alphas if sm_alphas is None else \
+        np.asarray(sm_alphas, dtype=np.float64)
+
+    if regularization == "L2":
+        u, s, vt = np.linalg.svd(X, full_matrices=False)
+        q = (u.T @ y) * s
+        s2 = s * s
+        skl_coefs = (q / (s2 + alphas[:, None])) @ vt
+        # statsmodels scales the ridge penalty by the number of observations
+        sm_coefs = (q / (s2 + sm_alphas[:, None] * X.shape[0])) @ vt
+        return skl_coefs, sm_coefs
+
+    from sklearn.linear_model import enet_path
+
+    l1_ratio = 1.0 if regularization == "L1" else 0.5
+    gram = X.T @ X
+    xy = X.T @ y
+
+    def path(grid):
+        order = np.argsort(-grid, kind='stable')
+        _, coefs, _ = enet_path(X, y, l1_ratio=l1_ratio, alphas=grid[order],
+                                precompute=gram, Xy=xy, copy_X=False)
+        return coefs.T[np.argsort(order)]
+
+    skl_coefs = path(alphas)
+    sm_coefs = skl_coefs if np.array_equal(alphas, sm_alphas) \
+        else path(sm_alphas)
+    sm_coefs = np.where(np.abs(sm_coefs) < 1e-8, 0, sm_coefs)
+    return skl_coefs, sm_coefs
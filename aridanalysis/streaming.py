@@ -0,0 +1,595 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from . import aggregation as agg
+
+
+class MomentAccumulator:
+    """
+    Mergeable running count, mean, variance, minimum and maximum for a block
+    of numeric columns using Welford's algorithm with Chan's update rule.
+
+    Parameters
+    ----------
+    n_columns : int
+        The number of columns being summarized
+    """
+
+    def __init__(self, n_columns):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, values):
+        """
+        Add a chunk of observations, shape (n, n_columns). Missing and
+        infinite values are ignored.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[:, None]
+        mask = np.isfinite(values)
+        count = mask.sum(axis=0).astype(np.float64)
+        filled = np.where(mask, values, 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, filled.sum(axis=0) / count, 0)
+        m2 = (np.where(mask, values - mean, 0) ** 2).sum(axis=0)
+        self._combine(count, mean, m2,
+                      np.where(mask, values, np.inf).min(axis=0),
+                      np.where(mask, values, -np.inf).max(axis=0))
+        return self
+
+    def merge(self, other):
+        """
+        Fold the statistics of another accumulator into this one.
+        """
+        self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    def _combine(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean
+            share = np.where(total > 0, count / total, 0)
+            self.mean = self.mean + delta * share
+            self.m2 = self.m2 + m2 + delta * delta * self.count * share
+        self.count = total
+        self.min = np.minimum(self.min, minimum)
+        self.max = np.maximum(self.max, maximum)
+
+    @property
+    def std(self):
+        """
+        The sample standard deviation of each column.
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1,
+                            np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate quantile sketch for a single numeric column.
+
+    The sketch keeps at most ``2 * capacity`` weighted centroids. Whenever it
+    grows beyond that, adjacent centroids are merged into ``capacity``
+    groups of roughly equal weight, so the rank error of a quantile estimate
+    is about ``1 / capacity``. Until the first compression the quantiles are
+    exact.
+
+    Parameters
+    ----------
+    capacity : int
+        The number of centroids kept after each compression
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+
+    def update(self, values):
+        """
+        Add a chunk of observations. Missing and infinite values are ignored.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        self._add(values, np.ones(len(values)))
+        return self
+
+    def merge(self, other):
+        """
+        Fold the centroids of another sketch into this one.
+        """
+        self._add(other.means, other.weights)
+        return self
+
+    def _add(self, means, weights):
+        self.means = np.concatenate([self.means, means])
+        self.weights = np.concatenate([self.weights, weights])
+        if len(self.means) > 2 * self.capacity:
+            self._compress()
+
+    def _compress(self):
+        order = np.argsort(self.means, kind='stable')
+        means, weights = self.means[order], self.weights[order]
+        cum = np.cumsum(weights)
+        groups = np.minimum(
+            ((cum - weights / 2) / cum[-1] * self.capacity).astype(np.int64),
+            self.capacity - 1)
+        merged = np.bincount(groups, weights=weights,
+                             minlength=self.capacity)
+        sums = np.bincount(groups, weights=means * weights,
+                           minlength=self.capacity)
+        keep = merged > 0
+        self.means = sums[keep] / merged[keep]
+        self.weights = merged[keep]
+
+    def quantile(self, q):
+        """
+        Estimate one or more quantiles with linear interpolation between
+        centroids, matching ``pandas.Series.quantile`` on exact data.
+        """
+        if len(self.means) == 0:
+            return np.full(np.shape(q), np.nan)
+        order = np.argsort(self.means, kind='stable')
+        means, weights = self.means[order], self.weights[order]
+        mids = np.cumsum(weights) - weights / 2
+        target = np.asarray(q) * (weights.sum() - 1) + 0.5
+        return np.interp(target, mids, means)
+
+
+class HistogramAccumulator:
+    """
+    Mergeable fixed-bin histogram whose range grows as data arrives.
+
+    The accumulator always holds ``bins`` equal-width bins. When a value
+    falls outside the current range, the bin width is doubled by merging
+    adjacent pairs until the range covers it, so memory stays constant and at
+    least half of the bins span the observed data.
+
+    Parameters
+    ----------
+    bins : int
+        The number of bins to keep, rounded up to an even number
+    """
+
+    def __init__(self, bins=1024):
+        self.bins = bins + bins % 2
+        self.counts = np.zeros(self.bins)
+        self.start = None
+        self.width = None
+
+    @property
+    def stop(self):
+        return self.start + self.bins * self.width
+
+    @property
+    def centers(self):
+        """
+        The center of every bin.
+        """
+        return self.start + self.width * (np.arange(self.bins) + 0.5)
+
+    def _cover(self, lo, hi):
+        if self.start is None:
+            span = hi - lo
+            self.width = span / self.bins * (1 + 1e-9) if span > 0 \
+                else max(abs(lo), 1.0) * 1e-6
+            self.start = lo
+        while lo < self.start or hi >= self.stop:
+            pairs = self.counts.reshape(-1, 2).sum(axis=1)
+            self.counts = np.zeros(self.bins)
+            if lo < self.start:
+                self.counts[self.bins // 2:] = pairs
+                self.start -= self.bins * self.width
+            else:
+                self.counts[:self.bins // 2] = pairs
+            self.width *= 2
+
+    def update(self, values, weights=None):
+        """
+        Add a chunk of observations. Missing and infinite values are ignored.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        keep = np.isfinite(values)
+        values = values[keep]
+        if len(values) == 0:
+            return self
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)[keep]
+        self._cover(values.min(), values.max())
+        index = np.clip(((values - self.start) / self.width).astype(np.int64),
+                        0, self.bins - 1)
+        self.counts += np.bincount(index, weights=weights,
+                                   minlength=self.bins)
+        return self
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one by re-binning its bin centers.
+        """
+        if other.start is not None:
+            self.update(other.centers[other.counts > 0],
+                        other.counts[other.counts > 0])
+        return self
+
+    def histogram(self, edges):
+        """
+        Re-bin the accumulated counts into the supplied coarser edges.
+        """
+        counts, _ = np.histogram(self.centers, bins=edges,
+                                 weights=self.counts)
+        return counts
+
+
+class RowReservoir:
+    """
+    Uniform reservoir sample of rows over a stream of dataframe chunks.
+
+    Every row gets a random key and the ``size`` rows with the smallest keys
+    seen so far are kept, which is equivalent to reservoir sampling but
+    vectorized over each chunk.
+
+    Parameters
+    ----------
+    size : int
+        The maximum number of rows to keep
+    seed : int or numpy.random.Generator (optional)
+        Seed for the random keys, or a generator to draw them from
+    """
+
+    def __init__(self, size=10000, seed=None):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.sample = None
+        self.keys = np.empty(0)
+        self.seen = 0
+
+    def update(self, chunk):
+        """
+        Offer every row of a chunk to the reservoir.
+        """
+        keys = self.rng.random(len(chunk))
+        self.seen += len(chunk)
+        if self.sample is not None and len(self.keys) >= self.size:
+            candidate = keys < self.keys.max()
+            chunk, keys = chunk[candidate], keys[candidate]
+        if self.sample is None:
+            self.sample = chunk.iloc[:0]
+        sample = pd.concat([self.sample, chunk])
+        keys = np.concatenate([self.keys, keys])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size - 1)[:self.size]
+            sample, keys = sample.iloc[keep], keys[keep]
+        self.sample, self.keys = sample, keys
+        return self
+
+
+class StratifiedReservoir:
+    """
+    Reservoir sample of rows stratified by the classes of a column, over a
+    stream of dataframe chunks.
+
+    The budget is split between the classes when the sample is read:
+    classes smaller than an equal share are kept whole and the rest of the
+    budget is shared equally by the larger ones, so rare classes are not
+    crowded out of the sample. The rows of each class are a uniform sample
+    of that class. Rows with a missing value in the column form a class of
+    their own.
+
+    Every row gets a random key and each class keeps its rows with the
+    smallest keys, selected for all classes at once with one sort per
+    chunk. A class never keeps more rows than the largest share it could
+    still be given, which only shrinks as rows arrive, so the reservoir
+    holds about ``size`` rows plus one per class.
+
+    Parameters
+    ----------
+    size : int
+        The maximum number of rows in the sample
+    column : str
+        The column whose classes define the strata
+    seed : int (optional)
+        Seed for the random keys
+    """
+
+    def __init__(self, size, column, seed=None):
+        self.size = size
+        self.column = column
+        self.rng = np.random.default_rng(seed)
+        self.labels = {}
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.rows = None
+        self.codes = np.empty(0, dtype=np.int64)
+        self.keys = np.empty(0)
+        self.seen = 0
+
+    def _allocate(self):
+        """
+        Split the budget between the classes by water-filling over their
+        row counts. Returns the quota of every class and the largest quota.
+        """
+        quotas = np.zeros(len(self.counts), dtype=np.int64)
+        order = np.argsort(self.counts, kind='stable')
+        budget, remaining = self.size, len(order)
+        for position, code in enumerate(order):
+            share = budget // remaining
+            if self.counts[code] > share:
+                # Every larger class gets the share, the first few one more
+                large = order[position:]
+                quotas[large] = share
+                quotas[large[:budget - share * remaining]] += 1
+                return quotas, share + (budget > share * remaining)
+            quotas[code] = self.counts[code]
+            budget -= self.counts[code]
+            remaining -= 1
+        # Every class is kept whole, and together they fit in the budget
+        return quotas, self.size
+
+    def _ranks(self, codes, keys):
+        """
+        Return the order of rows sorted by class and key, and the rank of
+        every row's key within its class in that order.
+        """
+        order = np.lexsort((keys, codes))
+        sorted_codes = codes[order]
+        first = np.searchsorted(sorted_codes, sorted_codes, side='left')
+        return order, np.arange(len(order)) - first
+
+    def update(self, chunk):
+        """
+        Offer every row of a chunk to the reservoir of its class.
+        """
+        self.seen += len(chunk)
+        values, uniques = pd.factorize(chunk[self.column])
+        labels = list(uniques)
+        if (values < 0).any():
+            # Missing values are coded -1, the last label: a class of its own
+            labels.append(None)
+        mapping = np.array([self.labels.setdefault(label, len(self.labels))
+                            for label in labels], dtype=np.int64)
+        codes = mapping[values]
+        self.counts = np.concatenate([
+            self.counts, np.zeros(len(self.labels) - len(self.counts),
+                                  dtype=np.int64)
+        ]) + np.bincount(codes, minlength=len(self.labels))
+        _, level = self._allocate()
+
+        # Skip rows whose key cannot enter a class that is already full
+        keys = self.rng.random(len(chunk))
+        threshold = np.ones(len(self.labels))
+        if len(self.keys):
+            order, rank = self._ranks(self.codes, self.keys)
+            full = order[rank == level - 1]
+            threshold[self.codes[full]] = self.keys[full]
+        candidate = keys < threshold[codes]
+        chunk, codes, keys = chunk[candidate], codes[candidate], \
+            keys[candidate]
+
+        if self.rows is None:
+            self.rows = chunk.iloc[:0]
+        rows = pd.concat([self.rows, chunk])
+        codes = np.concatenate([self.codes, codes])
+        keys = np.concatenate([self.keys, keys])
+        order, rank = self._ranks(codes, keys)
+        keep = order[rank < level]
+        self.rows, self.codes, self.keys = rows.iloc[keep], codes[keep], \
+            keys[keep]
+        return self
+
+    def quotas(self):
+        """
+        Return the number of sampled rows of every class.
+        """
+        quotas, _ = self._allocate()
+        return {label: int(quotas[code])
+                for label, code in self.labels.items()}
+
+    @property
+    def sample(self):
+        """
+        The sampled rows of every class, or None before any rows are seen.
+        """
+        if self.rows is None:
+            return None
+        quotas, _ = self._allocate()
+        # The smallest keys of a class are a uniform sample of it
+        order, rank = self._ranks(self.codes, self.keys)
+        return self.rows.iloc[order[rank < quotas[self.codes[order]]]]
+
+
+def frame_chunks(df, columns, rows=2 ** 20):
+    """
+    Yield the given columns of a dataframe in chunks of rows, so that a
+    single pass over a large frame only copies one chunk at a time.
+    """
+    for start in range(0, len(df), rows):
+        yield df.iloc[start:start + rows][columns]
+
+
+def sample_frame(df, columns, size, stratify=None, seed=None):
+    """
+    Draw a reservoir sample of the rows of a dataframe in one pass over it.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The input dataframe
+    columns : list
+        The columns to keep in the sample
+    size : int
+        The maximum number of rows in the sample
+    stratify : str (optional)
+        A column whose classes the sample is stratified by, as in
+        ``StratifiedReservoir``. By default the sample is uniform.
+    seed : int (optional)
+        Seed for the random keys
+
+    Returns
+    -------
+    pandas.DataFrame
+        The sampled rows, or the whole selection when it has at most
+        ``size`` rows
+    """
+    if len(df) <= size:
+        return df[columns]
+    reservoir = RowReservoir(size, seed) if stratify is None else \
+        StratifiedReservoir(size, stratify, seed)
+    for chunk in frame_chunks(df, columns):
+        reservoir.update(chunk)
+    return reservoir.sample
+
+
+def summarize_chunks(chunks, response, response_type, features, bins=1024,
+                     sketch_capacity=1000, sample_size=10000, seed=None):
+    """
+    Summarize an iterator of dataframe chunks in a single pass.
+
+    Only per-column accumulators, per-class histograms and a bounded row
+    sample are kept between chunks, so peak memory is bounded by the chunk
+    size.
+
+    Parameters
+    ----------
+    chunks : iterable of pandas.DataFrame
+        The data to summarize, for example ``pd.read_csv(..., chunksize=n)``
+    response : str
+        A column name of the response variable
+    response_type : str
+        Either 'categorical' or 'continuous'
+    features : list
+        A list of the numeric feature names to summarize
+    bins : int
+        The number of fine histogram bins kept per feature (and per class)
+    sketch_capacity : int
+        The number of centroids kept by each quantile sketch
+    sample_size : int
+        The number of rows kept in the sample used for correlations
+    seed : int (optional)
+        Seed for the row sample
+
+    Returns
+    -------
+    dict
+        ``moments`` (MomentAccumulator), ``sketches`` (list of
+        QuantileSketch), ``histograms`` (dict of HistogramAccumulator keyed
+        by feature, or by feature and class for categorical responses),
+        ``class_moments`` (dict of MomentAccumulator keyed by class) and
+        ``sample`` (RowReservoir)
+    """
+    moments = MomentAccumulator(len(features))
+    sketches = [QuantileSketch(sketch_capacity) for _ in features]
+    histograms = {}
+    class_moments = {}
+    reservoir = RowReservoir(sample_size, seed)
+
+    for chunk in chunks:
+        values = chunk[features].to_numpy(dtype=np.float64)
+        moments.update(values)
+        for j, sketch in enumerate(sketches):
+            sketch.update(values[:, j])
+        reservoir.update(chunk[features])
+
+        if response_type == 'continuous':
+            for j, feat in enumerate(features):
+                histograms.setdefault(feat, HistogramAccumulator(bins))
+                histograms[feat].update(values[:, j])
+            continue
+
+        codes, labels = pd.factorize(chunk[response])
+        for code, label in enumerate(labels):
+            rows = values[codes == code]
+            class_moments.setdefault(label, MomentAccumulator(len(features)))
+            class_moments[label].update(rows)
+            for j, feat in enumerate(features):
+                key = (feat, label)
+                histograms.setdefault(key, HistogramAccumulator(bins))
+                histograms[key].update(rows[:, j])
+
+    return {'moments': moments, 'sketches': sketches,
+            'histograms': histograms, 'class_moments': class_moments,
+            'sample': reservoir}
+
+
+def describe_summary(summary, features):
+    """
+    Build a ``DataFrame.describe()`` style table from a chunk summary.
+    """
+    moments = summary['moments']
+    quartiles = np.array([sketch.quantile([0.25, 0.5, 0.75])
+                          for sketch in summary['sketches']]).reshape(-1, 3)
+    with np.errstate(invalid='ignore'):
+        minimum = np.where(moments.count > 0, moments.min, np.nan)
+        maximum = np.where(moments.count > 0, moments.max, np.nan)
+    table = np.vstack([moments.count,
+                       np.where(moments.count > 0, moments.mean, np.nan),
+                       moments.std, minimum, quartiles.T, maximum])
+    return pd.DataFrame(table, columns=features,
+                        index=['count', 'mean', 'std', 'min', '25%', '50%',
+                               '75%', 'max'])
+
+
+def histogram_frames(summary, features, maxbins=10):
+    """
+    Build a pre-binned histogram table for every feature of a continuous
+    response summary.
+    """
+    moments = summary['moments']
+    frames = {}
+    for j, feat in enumerate(features):
+        accumulator = summary['histograms'].get(feat)
+        if accumulator is None or moments.count[j] == 0:
+            frames[feat] = agg.histogram_frame([], maxbins)
+            continue
+        edges = agg.nice_bin_edges(moments.min[j], moments.max[j], maxbins)
+        frames[feat] = pd.DataFrame({'bin_start': edges[:-1],
+                                     'bin_end': edges[1:],
+                                     'count': accumulator.histogram(edges)})
+    return frames
+
+
+def density_frames(summary, features, response, steps=200):
+    """
+    Build per-class density curves for every feature of a categorical
+    response summary. A feature without any observed value gets an empty
+    table, as in ``histogram_frames``.
+    """
+    moments = summary['moments']
+    labels = sorted(summary['class_moments'])
+    frames = {}
+    for j, feat in enumerate(features):
+        if moments.count[j] == 0:
+            # The range of an all-missing feature is (inf, -inf)
+            frames[feat] = pd.DataFrame({response: [], feat: [],
+                                         'density': []})
+            continue
+        grid = np.linspace(moments.min[j], moments.max[j], steps)
+        density = [
+            agg.binned_density(summary['histograms'][(feat, label)].centers,
+                               summary['histograms'][(feat, label)].counts,
+                               summary['class_moments'][label].std[j], grid)
+            if summary['histograms'][(feat, label)].start is not None
+            else np.zeros(steps)
+            for label in labels
+        ]
+        frames[feat] = pd.DataFrame({
+            response: np.repeat(labels, steps),
+            feat: np.tile(grid, len(labels)),
+            'density': np.concatenate(density) if density else [],
+        })
+    return frames
+
+
+def peek(chunks):
+    """
+    Return the first chunk of an iterator together with an iterator that
+    still yields every chunk.
+    """
+    chunks = iter(chunks)
+    first = next(chunks)
+    return first, itertools.chain([first], chunks)
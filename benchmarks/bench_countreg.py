@@ -0,0 +1,71 @@
+"""
+Benchmarks for ``arid_countreg`` over the number of rows, the cardinality
+of a categorical feature and the number of interacting features.
+
+The methods follow the airspeed velocity (asv) conventions. The
+``track_*`` methods report the pickled size of the result and the number
+of columns of the inferential model's design.
+"""
+import pickle
+
+from aridanalysis import aridanalysis
+
+from . import data
+
+
+class CountregSuite:
+    params = ([10 ** 3, 10 ** 5, 10 ** 7], [10, 1000, 100000],
+              [False, True])
+    param_names = ["rows", "cardinality", "sparse"]
+    timeout = 600
+
+    def setup(self, rows, cardinality, sparse):
+        # The dense path materializes one design column per level
+        data.check_size(rows, 5 + (1 if sparse else cardinality))
+        self.df = data.make_frame(rows, 5, 1, cardinality)
+
+    def fit(self, sparse):
+        return aridanalysis.arid_countreg(self.df, "count", data.continuous(5),
+                                          data.categorical(1), sparse=sparse,
+                                          verbose=False)
+
+    def time_countreg(self, rows, cardinality, sparse):
+        self.fit(sparse)
+
+    def peakmem_countreg(self, rows, cardinality, sparse):
+        self.fit(sparse)
+
+    def track_result_bytes(self, rows, cardinality, sparse):
+        return len(pickle.dumps(self.fit(sparse)))
+
+    track_result_bytes.unit = "bytes"
+
+
+class CountregInteractionSuite:
+    params = ([10 ** 3, 10 ** 5, 10 ** 6], [2, 4, 8])
+    param_names = ["rows", "interacting"]
+    timeout = 600
+
+    def setup(self, rows, interacting):
+        # The interactive model has a term for every pair of features
+        data.check_size(rows, interacting ** 2)
+        self.df = data.make_frame(rows, interacting - 1, 1, 4)
+        self.features = data.continuous(interacting - 1)
+
+    def fit(self):
+        return aridanalysis.arid_countreg(self.df, "count", self.features,
+                                          data.categorical(1),
+                                          model="interactive",
+                                          engine="statsmodels",
+                                          verbose=False)
+
+    def time_countreg_interactive(self, rows, interacting):
+        self.fit()
+
+    def peakmem_countreg_interactive(self, rows, interacting):
+        self.fit()
+
+    def track_design_columns(self, rows, interacting):
+        return len(self.fit().statsmodel.params)
+
+    track_design_columns.unit = "columns"
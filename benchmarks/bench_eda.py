@@ -0,0 +1,81 @@
+"""
+Benchmarks for ``arid_eda`` over the number of rows and features, with
+embedded and aggregated chart data.
+
+The methods follow the airspeed velocity (asv) conventions, and the
+``track_*`` methods report the size of the serialized chart specification.
+"""
+import altair as alt
+
+from aridanalysis import aridanalysis
+
+from . import data
+
+
+class EdaSuite:
+    params = ([10 ** 3, 10 ** 5, 10 ** 7], [5, 50, 500], [False, True])
+    param_names = ["rows", "features", "aggregate"]
+    timeout = 600
+
+    def setup(self, rows, features, aggregate):
+        data.check_size(rows, features)
+        self.df = data.make_frame(rows, features)
+        self.features = data.continuous(features)
+
+    def eda(self, aggregate):
+        return aridanalysis.arid_eda(self.df, "y", "continuous",
+                                     self.features, aggregate=aggregate)
+
+    def time_eda(self, rows, features, aggregate):
+        self.eda(aggregate)
+
+    def peakmem_eda(self, rows, features, aggregate):
+        self.eda(aggregate)
+
+    def track_spec_bytes(self, rows, features, aggregate):
+        if not aggregate:
+            # Without aggregation the charts embed the whole frame
+            data.check_size(rows, features, data.MAX_EMBEDDED_CELLS)
+        _, chart = self.eda(aggregate)
+        with alt.data_transformers.enable("default", max_rows=None):
+            return len(chart.to_json())
+
+    track_spec_bytes.unit = "bytes"
+
+
+# Within altair's default limit of 5000 embedded rows
+SAMPLE = 5000
+
+
+class EdaSampleSuite:
+    """
+    ``arid_eda`` plotting a bounded sample of the rows, uniform or
+    stratified by a categorical response.
+    """
+    params = ([10 ** 5, 10 ** 7], [False, True])
+    param_names = ["rows", "stratify"]
+    timeout = 600
+
+    def setup(self, rows, stratify):
+        data.check_size(rows, 5)
+        self.df = data.make_frame(rows, 5).assign(
+            label=lambda df: "class " + df["label"].astype(str)
+        )
+        self.features = data.continuous(5)
+
+    def eda(self, stratify):
+        return aridanalysis.arid_eda(self.df, "label", "categorical",
+                                     self.features, sample=SAMPLE,
+                                     stratify=stratify, seed=0)
+
+    def time_eda(self, rows, stratify):
+        self.eda(stratify)
+
+    def peakmem_eda(self, rows, stratify):
+        self.eda(stratify)
+
+    def track_spec_bytes(self, rows, stratify):
+        _, chart = self.eda(stratify)
+        return len(chart.to_json())
+
+    track_spec_bytes.unit = "bytes"
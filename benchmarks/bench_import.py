@@ -0,0 +1,55 @@
+"""
+Startup-time benchmarks for ``import aridanalysis``.
+
+The suite follows the airspeed velocity (asv) conventions: every
+``timeraw_*`` method returns code that asv times in a fresh interpreter. It
+can also be run directly with ``python -m benchmarks.bench_import``.
+"""
+import statistics
+import subprocess
+import sys
+import timeit
+
+
+class ImportSuite:
+    def timeraw_import_package(self):
+        return "import aridanalysis"
+
+    def timeraw_import_module(self):
+        return "from aridanalysis import aridanalysis"
+
+    def timeraw_import_for_regression(self):
+        return """
+        from aridanalysis import aridanalysis
+        import statsmodels.api
+        import sklearn.linear_model
+        """
+
+    def timeraw_import_for_eda(self):
+        return """
+        from aridanalysis import aridanalysis
+        import altair
+        """
+
+
+def time_in_subprocess(code, repeat=5):
+    """
+    Return the median wall time of running code in a fresh interpreter,
+    minus the cost of starting the interpreter itself.
+    """
+    def run(source):
+        timer = timeit.default_timer()
+        subprocess.run([sys.executable, "-c", source], check=True)
+        return timeit.default_timer() - timer
+
+    baseline = statistics.median(run("pass") for _ in range(repeat))
+    return statistics.median(run(code) for _ in range(repeat)) - baseline
+
+
+if __name__ == "__main__":
+    suite = ImportSuite()
+    for name in sorted(dir(suite)):
+        if name.startswith("timeraw_"):
+            code = "\n".join(line.strip()
+                             for line in getattr(suite, name)().splitlines())
+            print(f"{name[8:]:<24}{time_in_subprocess(code):.3f}s")
@@ -0,0 +1,38 @@
+"""
+Overhead benchmarks for the stage spans of ``aridanalysis.instrumentation``.
+
+The methods follow the airspeed velocity (asv) conventions. Without
+listeners a span should cost about one function call.
+"""
+from aridanalysis import aridanalysis, instrumentation
+
+from . import data
+
+
+class SpanSuite:
+    def time_disabled_span(self):
+        with instrumentation.span("stage", rows=1):
+            pass
+
+    def time_listened_span(self):
+        with instrumentation.listening(lambda span: None):
+            with instrumentation.span("stage", rows=1):
+                pass
+
+
+class InstrumentedFitSuite:
+    params = [False, True]
+    param_names = ["listening"]
+
+    def setup(self, listening):
+        self.df = data.make_frame(10 ** 3, 5)
+        self.features = data.continuous(5)
+
+    def time_linreg(self, listening):
+        if listening:
+            with instrumentation.listening():
+                aridanalysis.arid_linreg(self.df, "y", self.features,
+                                         verbose=False)
+        else:
+            aridanalysis.arid_linreg(self.df, "y", self.features,
+                                     verbose=False)
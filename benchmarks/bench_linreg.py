@@ -0,0 +1,40 @@
+"""
+Benchmarks for ``arid_linreg`` over the number of rows and features.
+
+Every ``time_*`` and ``peakmem_*`` method fits both engines, and the
+``track_*`` methods report the pickled size of the result. They follow the
+airspeed velocity (asv) conventions.
+"""
+import pickle
+
+from aridanalysis import aridanalysis
+
+from . import data
+
+
+class LinregSuite:
+    params = ([10 ** 3, 10 ** 5, 10 ** 7], [5, 50, 5000],
+              [None, "L1"])
+    param_names = ["rows", "features", "regularization"]
+    timeout = 600
+
+    def setup(self, rows, features, regularization):
+        data.check_size(rows, features)
+        self.df = data.make_frame(rows, features)
+        self.features = data.continuous(features)
+
+    def fit(self, regularization):
+        return aridanalysis.arid_linreg(self.df, "y", self.features,
+                                        regularization=regularization,
+                                        verbose=False)
+
+    def time_linreg(self, rows, features, regularization):
+        self.fit(regularization)
+
+    def peakmem_linreg(self, rows, features, regularization):
+        self.fit(regularization)
+
+    def track_result_bytes(self, rows, features, regularization):
+        return len(pickle.dumps(self.fit(regularization)))
+
+    track_result_bytes.unit = "bytes"
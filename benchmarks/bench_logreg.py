@@ -0,0 +1,40 @@
+"""
+Benchmarks for ``arid_logreg`` over the number of rows and features, for
+binomial and multinomial responses.
+
+The methods follow the airspeed velocity (asv) conventions, and the
+``track_*`` methods report the pickled size of the result.
+"""
+import pickle
+
+from aridanalysis import aridanalysis
+
+from . import data
+
+
+class LogregSuite:
+    params = ([10 ** 3, 10 ** 5, 10 ** 7], [5, 50, 5000],
+              ["binomial", "multinomial"])
+    param_names = ["rows", "features", "type"]
+    timeout = 600
+
+    def setup(self, rows, features, type):
+        data.check_size(rows, features)
+        self.df = data.make_frame(rows, features)
+        self.features = data.continuous(features)
+
+    def fit(self, type):
+        response = "binary" if type == "binomial" else "label"
+        return aridanalysis.arid_logreg(self.df, response, self.features,
+                                        type=type, verbose=False)
+
+    def time_logreg(self, rows, features, type):
+        self.fit(type)
+
+    def peakmem_logreg(self, rows, features, type):
+        self.fit(type)
+
+    def track_result_bytes(self, rows, features, type):
+        return len(pickle.dumps(self.fit(type)))
+
+    track_result_bytes.unit = "bytes"
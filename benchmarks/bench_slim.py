@@ -0,0 +1,72 @@
+"""
+Memory benchmarks for the ``slim`` option of the regressors.
+
+The suite follows the airspeed velocity (asv) conventions: every
+``track_*`` method returns the size in bytes of one fitted model, with and
+without ``slim``. It can also be run directly with
+``python -m benchmarks.bench_slim``.
+"""
+import gc
+import pickle
+import tracemalloc
+
+from aridanalysis import aridanalysis
+
+from . import data
+
+
+FITS = {
+    "linreg": lambda df, slim: aridanalysis.arid_linreg(
+        df, "y", ["x0", "x1"], verbose=False, slim=slim
+    ),
+    "logreg": lambda df, slim: aridanalysis.arid_logreg(
+        df, "binary", ["x0", "x1"], verbose=False, slim=slim
+    ),
+    "countreg": lambda df, slim: aridanalysis.arid_countreg(
+        df, "count", ["x0"], ["c0"], verbose=False, slim=slim
+    ),
+}
+
+
+def retained_bytes(fit, df, slim, repeat=5):
+    """
+    Return the memory held by one fitted model: the memory still allocated
+    after fitting and keeping several of them, per model.
+    """
+    fit(df, slim)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    models = [fit(df, slim) for _ in range(repeat)]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del models
+    return retained / repeat
+
+
+class SlimSuite:
+    params = (sorted(FITS), [False, True])
+    param_names = ["model", "slim"]
+
+    def setup(self, model, slim):
+        self.df = data.make_frame(50_000, 2, 1, 8)
+
+    def track_pickle_bytes(self, model, slim):
+        return len(pickle.dumps(FITS[model](self.df, slim)))
+
+    def track_retained_bytes(self, model, slim):
+        return retained_bytes(FITS[model], self.df, slim)
+
+    track_pickle_bytes.unit = "bytes"
+    track_retained_bytes.unit = "bytes"
+
+
+if __name__ == "__main__":
+    df = data.make_frame(50_000, 2, 1, 8)
+    print(f"{'model':<10}{'memory':>12}{'slim':>12}{'pickle':>12}{'slim':>12}")
+    for name, fit in sorted(FITS.items()):
+        memory = [retained_bytes(fit, df, slim) for slim in [False, True]]
+        size = [len(pickle.dumps(fit(df, slim))) for slim in [False, True]]
+        print(f"{name:<10}" + "".join(f"{value / 1024:>10.0f}kB"
+                                      for value in memory + size))
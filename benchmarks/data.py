@@ -0,0 +1,95 @@
+"""
+Synthetic data generators for the benchmarks.
+
+The frames are deterministic for a seed, so every run and machine measures
+the same data. Continuous features are named ``x0, x1, ...`` and
+categorical features ``c0, c1, ...``; every frame carries a continuous
+response ``y``, a binary response ``binary``, a three-class response
+``label`` and a count response ``count``.
+
+Parameter combinations whose frame would exceed a cell budget are skipped,
+following the asv convention of raising ``NotImplementedError`` from
+``setup``. The budget defaults to 5e7 cells (about 400MB of floats) and
+can be raised with the ``ARID_BENCH_MAX_CELLS`` environment variable.
+"""
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+# The largest number of cells a benchmark frame or design may hold
+MAX_CELLS = int(float(os.environ.get("ARID_BENCH_MAX_CELLS", 5e7)))
+
+# The largest number of cells a chart may embed as raw data
+MAX_EMBEDDED_CELLS = 10 ** 6
+
+
+def check_size(rows, columns, max_cells=MAX_CELLS):
+    """
+    Skip a parameter combination whose data would exceed the cell budget.
+    """
+    if rows * columns > max_cells:
+        raise NotImplementedError(
+            f"{rows} x {columns} exceeds the budget of {max_cells} cells"
+        )
+
+
+def continuous(n):
+    """
+    Return the names of the first n continuous features.
+    """
+    return [f"x{i}" for i in range(n)]
+
+
+def categorical(n):
+    """
+    Return the names of the first n categorical features.
+    """
+    return [f"c{i}" for i in range(n)]
+
+
+@functools.lru_cache(maxsize=2)
+def make_frame(rows, n_continuous=5, n_categorical=0, cardinality=10,
+               seed=0):
+    """
+    Return a synthetic dataframe.
+
+    Parameters
+    ----------
+    rows : int
+        The number of rows
+    n_continuous : int
+        The number of standard normal features
+    n_categorical : int
+        The number of categorical features
+    cardinality : int
+        The number of levels of every categorical feature
+    seed : int
+        The seed of the random generator
+
+    Returns
+    -------
+    pandas.DataFrame
+        The frame, which is cached and must not be modified
+    """
+    rng = np.random.default_rng(seed)
+    frame = {}
+    signal = np.zeros(rows)
+    for name in continuous(n_continuous):
+        frame[name] = rng.standard_normal(rows)
+        signal += rng.normal(scale=1 / np.sqrt(n_continuous)) * frame[name]
+    for name in categorical(n_categorical):
+        codes = rng.integers(0, cardinality, rows)
+        effects = rng.normal(scale=0.3, size=cardinality)
+        frame[name] = pd.Categorical.from_codes(
+            codes, categories=[f"l{i}" for i in range(cardinality)]
+        )
+        signal += effects[codes] / np.sqrt(n_categorical)
+
+    noise = rng.standard_normal(rows)
+    frame["y"] = signal + noise
+    frame["binary"] = (signal + rng.logistic(size=rows) > 0).astype(np.int64)
+    frame["label"] = np.digitize(signal + noise, [-0.5, 0.5])
+    frame["count"] = rng.poisson(np.exp(0.5 + 0.3 * np.tanh(signal)))
+    return pd.DataFrame(frame)
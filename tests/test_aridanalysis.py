@@ -1,4 +1,6 @@
 from aridanalysis import aridanalysis as aa
+from aridanalysis import error_strings as errors
+from aridanalysis import caching
 import pytest
 import pandas as pd
 import numpy as np
@@ -8,13 +10,6 @@ import altair as alt
 import statsmodels
 # import warnings
 
-import sys
-import os
-
-myPath = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, myPath + "/../aridanalysis")
-import error_strings as errors # noqaE402
-
 
 @pytest.fixture
 def simple_frame():
@@ -104,6 +99,98 @@ def test_response_type_incorrect():
         )
 
 
+def test_arideda_aggregate_density():
+    """
+    Test pre-aggregated density curves integrate to one for each class
+    """
+    iris = data.iris()
+    _, out = aa.arid_eda(
+        iris, "species", "categorical", ["sepalLength"], aggregate=True
+    )
+    density_df = out.hconcat[0].data
+    assert len(density_df) == 200 * iris["species"].nunique()
+    for _, group in density_df.groupby("species"):
+        area = np.trapz(group["density"], group["sepalLength"])
+        assert area == pytest.approx(1, abs=0.1)
+
+
+def test_arideda_aggregate_large_frame():
+    """
+    Test aggregated charts stay small for frames above altair's row limit
+    """
+    rng = np.random.default_rng(0)
+    big_df = pd.DataFrame({"x1": rng.normal(size=20000),
+                           "x2": rng.exponential(size=20000),
+                           "y": rng.normal(size=20000)})
+    _, out = aa.arid_eda(big_df, "y", "continuous", ["x1", "x2"],
+                         aggregate=True)
+    hist_df = out.hconcat[0].data
+    assert hist_df["count"].sum() == 20000
+    assert len(hist_df) <= 20
+    assert isinstance(out.to_dict(), dict)
+
+
+def test_arideda_corr_top_k():
+    """
+    Test the correlation plot only contains the strongest feature pairs
+    """
+    features = ["sepalLength", "sepalWidth", "petalLength", "petalWidth"]
+    _, out = aa.arid_eda(data.iris(), "species", "categorical", features,
+                         corr_top_k=2)
+    corr_df = out.hconcat[-1].data
+    assert len(corr_df) == 4
+    assert set(corr_df["level_0"]) == set(corr_df["level_1"])
+
+
+def test_arideda_sample():
+    """
+    Test plots use a bounded sample while the summary stays exact
+    """
+    rng = np.random.default_rng(3)
+    big_df = pd.DataFrame({"x1": rng.normal(size=20000),
+                           "x2": rng.exponential(size=20000),
+                           "y": np.where(np.arange(20000) < 50, "rare",
+                                         "common")})
+    exact_df, _ = aa.arid_eda(big_df, "y", "categorical", ["x1", "x2"])
+    out_df, out = aa.arid_eda(big_df, "y", "categorical", ["x1", "x2"],
+                              sample=1000, stratify=True, seed=0)
+    pd.testing.assert_frame_equal(out_df, exact_df)
+    meta = out.to_dict()["usermeta"]["aridanalysis"]
+    assert meta["sample_rows"] == 1000 and meta["sample_fraction"] == 0.05
+    assert meta["stratified"]
+    chart = out.hconcat[0]
+    assert chart.title == "x1 Distribution (5% sample)"
+    # The density charts share the sample, which altair lifts to the top
+    assert (out.data["y"] == "rare").sum() == 50
+    assert len(out.data) == 1000
+
+    _, out = aa.arid_eda(big_df, "x1", "continuous", ["x2"], sample=1000,
+                         aggregate=True)
+    assert out.hconcat[0].data["count"].sum() == 1000
+    with pytest.raises(AssertionError):
+        aa.arid_eda(big_df, "x1", "continuous", ["x2"], sample=10,
+                    stratify=True)
+
+
+def test_arideda_float32():
+    """
+    Test a float32 summary and correlation only drift within its precision
+    """
+    features = ["sepalLength", "sepalWidth", "petalLength", "petalWidth"]
+    iris = data.iris()
+    exact_df, exact = aa.arid_eda(iris, "species", "categorical", features,
+                                  dtype="float64")
+    low_df, low = aa.arid_eda(iris, "species", "categorical", features,
+                              dtype="float32")
+    drift = (low_df - exact_df).abs() / exact_df.abs().clip(lower=1)
+    assert drift.to_numpy().max() < 1e-6
+    corr_drift = (low.hconcat[-1].data["corr"] -
+                  exact.hconcat[-1].data["corr"]).abs()
+    assert corr_drift.max() < 1e-6
+    with pytest.raises(AssertionError, match=errors.INVALID_DTYPE_INPUT):
+        aa.arid_eda(iris, "species", "categorical", features, dtype="int8")
+
+
 def test_linreg_input_errors(simple_frame):
     """
     Test linear regression input argument validation
@@ -321,6 +408,231 @@ def test_linreg_model_predictions(simple_frame):
     )
 
 
+def test_linreg_engine(simple_frame):
+    """
+    Test the engine option only fits the requested model
+    """
+    with pytest.raises(AssertionError, match=errors.INVALID_ENGINE_INPUT):
+        aa.arid_linreg(simple_frame, "y", engine="spark")
+    skl_model, sm_model = aa.arid_linreg(simple_frame, "y", engine="sklearn")
+    assert sm_model is None
+    assert len(skl_model.coef_) == 3
+    skl_model, sm_model = aa.arid_linreg(simple_frame, "y",
+                                         regularization="L2",
+                                         engine="statsmodels")
+    assert skl_model is None
+    assert len(sm_model.params) == 3
+
+
+@pytest.fixture
+def path_frame():
+    """
+    Create a regression dataframe large enough for a regularization path
+    """
+    rng = np.random.default_rng(11)
+    tdf = pd.DataFrame(rng.normal(size=(120, 4)),
+                       columns=["x1", "x2", "x3", "x4"])
+    tdf["y"] = tdf @ [2.0, -1.0, 0.5, 0.0] + rng.normal(size=120)
+    return tdf
+
+
+@pytest.mark.parametrize("regularization", ["L1", "L2", "L1L2"])
+def test_linreg_path_matches_single_fits(path_frame, regularization):
+    """
+    Test each row of the path matches the corresponding arid_linreg fit
+    """
+    alphas = [1.0, 0.01, 0.3]
+    skl_path, sm_path = aa.arid_linreg_path(path_frame, "y", alphas,
+                                            regularization=regularization)
+    assert list(skl_path.index) == alphas
+    assert list(sm_path.columns) == ["x1", "x2", "x3", "x4"]
+    for alpha in alphas:
+        skl_model, sm_model = aa.arid_linreg(path_frame, "y",
+                                             regularization=regularization,
+                                             alpha=alpha)
+        np.testing.assert_allclose(skl_path.loc[alpha], skl_model.coef_,
+                                   atol=1e-3)
+        np.testing.assert_allclose(sm_path.loc[alpha],
+                                   np.asarray(sm_model.params), atol=1e-3)
+
+
+def test_linreg_path_inputs(path_frame, capsys):
+    """
+    Test regularization path input validation, engine selection and
+    verbose=False
+    """
+    with pytest.raises(AssertionError, match=errors.INVALID_ALPHA_INPUT):
+        aa.arid_linreg_path(path_frame, "y", [])
+    with pytest.raises(AssertionError, match=errors.INVALID_ALPHA_INPUT):
+        aa.arid_linreg_path(path_frame, "y", [0.1, "b"])
+    with pytest.raises(AssertionError,
+                       match=errors.INVALID_REGULARIZATION_INPUT):
+        aa.arid_linreg_path(path_frame, "y", [0.1], regularization=None)
+    skl_path, sm_path = aa.arid_linreg_path(path_frame, "y", [0.1, 1],
+                                            engine="sklearn")
+    assert sm_path is None
+    assert skl_path.shape == (2, 4)
+    capsys.readouterr()
+    aa.arid_linreg_path(path_frame, "y", [0.1, 1], verbose=False)
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("regularization", [None, "L1", "L2", "L1L2"])
+def test_linreg_multi_response(path_frame, regularization):
+    """
+    Test a list of responses matches fitting each response separately
+    """
+    tdf = path_frame.assign(y2=path_frame["x3"] * 3 - path_frame["y"])
+    models = aa.arid_linreg(tdf, ["y", "y2"], regularization=regularization,
+                            alpha=0.5)
+    assert list(models) == ["y", "y2"]
+    for response, other in [("y", "y2"), ("y2", "y")]:
+        skl_model, sm_model = models[response]
+        expected_skl, expected_sm = aa.arid_linreg(
+            tdf.drop(columns=other), response,
+            regularization=regularization, alpha=0.5
+        )
+        assert type(skl_model) is type(expected_skl)
+        np.testing.assert_allclose(skl_model.coef_, expected_skl.coef_,
+                                   atol=1e-6)
+        np.testing.assert_allclose(np.asarray(sm_model.params),
+                                   np.asarray(expected_sm.params), atol=1e-6)
+        if regularization is None:
+            np.testing.assert_allclose(sm_model.bse, expected_sm.bse)
+
+
+def test_linreg_multi_response_inputs(path_frame):
+    """
+    Test response list validation and engine selection
+    """
+    with pytest.raises(AssertionError, match=errors.RESPONSE_NOT_FOUND):
+        aa.arid_linreg(path_frame, [])
+    with pytest.raises(AssertionError, match=errors.RESPONSE_NOT_FOUND):
+        aa.arid_linreg(path_frame, ["y", "missing"])
+    models = aa.arid_linreg(path_frame, ["y", "x4"], engine="sklearn")
+    assert models["x4"][1] is None
+    assert models["x4"][0].n_features_in_ == 3
+
+
+def test_linreg_by_group(path_frame):
+    """
+    Test per-group fits match fitting each group's slice directly
+    """
+    tdf = path_frame.assign(store=np.where(path_frame["x4"] > 0, "a", "b"))
+    models, table = aa.arid_linreg(tdf, "y", by="store", n_jobs=2)
+    assert list(models) == ["a", "b"]
+    expected_skl, expected_sm = aa.arid_linreg(
+        tdf[tdf["store"] == "b"].drop(columns="store"), "y"
+    )
+    np.testing.assert_allclose(models["b"][1].params, expected_sm.params)
+    np.testing.assert_allclose(table.loc[("b", "sklearn")],
+                               expected_skl.coef_)
+    with pytest.raises(AssertionError, match=errors.INVALID_BY_INPUT):
+        aa.arid_linreg(tdf, "y", by="y")
+    with pytest.raises(AssertionError, match=errors.INVALID_BY_INPUT):
+        aa.arid_linreg(tdf, "y", by="missing")
+
+
+def test_linreg_cross_validation(path_frame):
+    """
+    Test per-fold scores match sklearn's cross-validation of the same model
+    """
+    from sklearn.linear_model import Lasso
+    from sklearn.model_selection import GroupKFold, cross_val_score
+
+    skl_model, _ = aa.arid_linreg(path_frame, "y", regularization="L1",
+                                  alpha=0.1, cv=4)
+    expected = cross_val_score(Lasso(0.1, fit_intercept=False),
+                               path_frame.drop(columns="y"),
+                               path_frame["y"], cv=4)
+    np.testing.assert_allclose(skl_model.cv_results_["score"], expected)
+
+    tdf = path_frame.assign(site=np.arange(len(path_frame)) % 6)
+    skl_model, _ = aa.arid_linreg(tdf, "y", features=["x1", "x2"],
+                                  cv=GroupKFold(3), cv_groups="site")
+    assert len(skl_model.cv_results_) == 3
+    with pytest.raises(AssertionError, match=errors.INVALID_CV_INPUT):
+        aa.arid_linreg(path_frame, "y", cv=3, engine="statsmodels")
+    with pytest.raises(AssertionError, match=errors.INVALID_CV_INPUT):
+        aa.arid_linreg(path_frame, "y", cv=3, cv_groups="missing")
+
+
+@pytest.mark.parametrize("regularization", [None, "L1", "L2", "L1L2"])
+def test_linreg_float32(path_frame, regularization):
+    """
+    Test float32 sklearn fits drift only within their precision and the
+    statsmodel is still fitted in float64
+    """
+    exact = aa.arid_linreg(path_frame, "y", regularization=regularization,
+                           alpha=0.1, verbose=False)
+    low = aa.arid_linreg(path_frame, "y", regularization=regularization,
+                         alpha=0.1, verbose=False, dtype="float32")
+    if regularization is not None:  # OLS shares the float64 factorization
+        assert low.sklearn_model.coef_.dtype == np.float32
+    drift = np.abs(low.sklearn_model.coef_ - exact.sklearn_model.coef_)
+    assert drift.max() < 1e-4
+    assert low.statsmodel.model.exog.dtype == np.float64
+    np.testing.assert_allclose(low.statsmodel.params, exact.statsmodel.params,
+                               atol=1e-6)
+    with pytest.raises(AssertionError, match=errors.INVALID_DTYPE_INPUT):
+        aa.arid_linreg(path_frame, "y", dtype="float16")
+
+
+def test_linreg_accumulator_matches_full_fit(path_frame):
+    """
+    Test chunked and merged statistics reproduce a fit on the full data
+    """
+    tdf = path_frame.assign(const=1.0)
+    left = aa.LinregAccumulator("y")
+    right = aa.LinregAccumulator("y")
+    for start in range(0, 60, 25):
+        left.partial_fit(tdf.iloc[start:min(start + 25, 60)])
+    right.partial_fit(tdf.iloc[60:])
+    skl_model, sm_model = left.merge(right).finish()
+    expected_skl, expected_sm = aa.arid_linreg(tdf, "y")
+
+    np.testing.assert_allclose(skl_model.coef_, expected_skl.coef_)
+    np.testing.assert_allclose(skl_model.predict(tdf.drop(columns="y")),
+                               expected_skl.predict(tdf.drop(columns="y")))
+    for attribute in ["params", "bse", "rsquared", "rsquared_adj", "fvalue",
+                      "llf", "aic", "nobs", "df_resid", "df_model"]:
+        np.testing.assert_allclose(getattr(sm_model, attribute),
+                                   getattr(expected_sm, attribute))
+
+    # A chunk with a missing value is rejected and leaves the sums intact
+    n, xtx = left.n, left.xtx.copy()
+    with pytest.raises(AssertionError, match=errors.MISSING_VALUES):
+        left.partial_fit(tdf.iloc[:10].assign(x1=np.nan))
+    assert left.n == n and np.array_equal(left.xtx, xtx)
+
+
+def test_linreg_accumulator_ridge(path_frame, capsys):
+    """
+    Test the accumulator ridge fit matches arid_linreg and validates inputs
+    """
+    acc = aa.LinregAccumulator("y", regularization="L2", alpha=2)
+    acc.partial_fit(path_frame.iloc[:50]).partial_fit(path_frame.iloc[50:])
+    skl_model, sm_model = acc.finish()
+    expected_skl, expected_sm = aa.arid_linreg(path_frame, "y",
+                                               regularization="L2", alpha=2)
+    np.testing.assert_allclose(skl_model.coef_, expected_skl.coef_)
+    np.testing.assert_allclose(sm_model.params, expected_sm.params)
+    capsys.readouterr()
+    quiet_skl, _ = acc.finish(verbose=False)
+    assert capsys.readouterr().out == ""
+    np.testing.assert_allclose(quiet_skl.coef_, skl_model.coef_)
+
+    with pytest.raises(AssertionError,
+                       match=errors.INVALID_REGULARIZATION_INPUT):
+        aa.LinregAccumulator("y", regularization="L1")
+    with pytest.raises(AssertionError, match=errors.FEATURE_NOT_FOUND):
+        acc.partial_fit(path_frame.drop(columns="x1"))
+    with pytest.raises(AssertionError,
+                       match=errors.INCOMPATIBLE_ACCUMULATOR):
+        acc.merge(aa.LinregAccumulator("y", features=["x1"])
+                  .partial_fit(path_frame))
+
+
 @pytest.fixture
 def log_df():
     """
@@ -421,6 +733,46 @@ def test_logreg_model_outputs(log_df):
     )
 
 
+def test_logreg_engine(log_df):
+    """
+    Test the engine option only fits the requested model
+    """
+    with pytest.raises(AssertionError, match=errors.INVALID_ENGINE_INPUT):
+        aa.arid_logreg(log_df, "Target", engine="spark")
+    skl_model, sm_model = aa.arid_logreg(log_df, "Target", engine="sklearn")
+    assert sm_model is None
+    assert round(skl_model.coef_[0][0], 3) == 0.091
+    skl_model, sm_model = aa.arid_logreg(log_df, "Target",
+                                         engine="statsmodels")
+    assert skl_model is None
+    assert isinstance(sm_model,
+                      statsmodels.discrete.discrete_model.BinaryResultsWrapper)
+
+
+def test_logreg_compress():
+    """
+    Test compressed fits keep the coefficients of the uncompressed fits
+    """
+    rng = np.random.default_rng(12)
+    tdf = pd.DataFrame({"a": rng.integers(0, 4, 500),
+                        "b": rng.integers(0, 3, 500), "c": 1})
+    tdf["binary"] = (tdf["a"] - tdf["b"] + rng.logistic(size=500) > 0) * 1
+    tdf["classes"] = np.digitize(tdf["a"] + rng.logistic(size=500), [1, 3])
+    for kind, response, other in [("binomial", "binary", "classes"),
+                                  ("multinomial", "classes", "binary")]:
+        data = tdf.drop(columns=other)
+        skl_model, sm_model = aa.arid_logreg(data, response, type=kind)
+        skl_comp, sm_comp = aa.arid_logreg(data, response, type=kind,
+                                           compress=True)
+        np.testing.assert_allclose(skl_comp.coef_, skl_model.coef_,
+                                   rtol=1e-3)
+        np.testing.assert_allclose(np.asarray(sm_comp.params),
+                                   np.asarray(sm_model.params), rtol=1e-4)
+        np.testing.assert_allclose(np.asarray(sm_comp.bse),
+                                   np.asarray(sm_model.bse), rtol=1e-4)
+        assert sm_comp.nobs == sm_model.nobs == 500
+
+
 @pytest.fixture
 def health_df():
     """
@@ -574,3 +926,211 @@ def test_countreg_model_outputs(health_df):
         )
         == "<class 'statsmodels.genmod.generalized_linear_model.GLMResultsWrapper'>" # noqaE501
     )
+
+
+def test_countreg_engine(health_df):
+    """
+    Test the engine option only fits the requested model
+    """
+    with pytest.raises(AssertionError, match=errors.INVALID_ENGINE_INPUT):
+        aa.arid_countreg(health_df, "numvisit", engine="spark")
+    sk_model, glm_model = aa.arid_countreg(health_df, "numvisit",
+                                           model="interactive",
+                                           engine="sklearn")
+    assert glm_model is None
+    assert len(sk_model[1].coef_) == 2
+    sk_model, glm_model = aa.arid_countreg(health_df, "numvisit",
+                                           engine="statsmodels")
+    assert sk_model is None
+    assert len(glm_model.params) == 3
+
+
+@pytest.mark.parametrize("interval", ["percentile", "bca"])
+def test_bootstrap_intervals(health_df, interval):
+    """
+    Test bootstrap intervals are centred on the statsmodels coefficients
+    """
+    _, glm_count = aa.arid_countreg(health_df, "numvisit")
+    table = aa.arid_bootstrap(health_df, "numvisit", model="countreg",
+                              n_boot=200, interval=interval, seed=0,
+                              n_jobs=1)
+    assert table.columns.tolist() == ["coefficient", "std_error", "lower",
+                                      "upper"]
+    np.testing.assert_allclose(table["coefficient"], glm_count.params,
+                               rtol=1e-5)
+    assert (table["lower"] < table["coefficient"]).all()
+    assert (table["coefficient"] < table["upper"]).all()
+
+
+def test_bootstrap_inputs(path_frame):
+    """
+    Test bootstrap input validation
+    """
+    with pytest.raises(AssertionError, match=errors.INVALID_TYPE_INPUT):
+        aa.arid_bootstrap(path_frame, "y", model="probit")
+    with pytest.raises(AssertionError, match=errors.INVALID_BOOTSTRAP_INPUT):
+        aa.arid_bootstrap(path_frame, "y", n_boot=0)
+    with pytest.raises(AssertionError, match=errors.INVALID_BOOTSTRAP_INPUT):
+        aa.arid_bootstrap(path_frame, "y", interval="normal")
+    with pytest.raises(AssertionError,
+                       match=errors.INVALID_RESPONSE_DATATYPE):
+        aa.arid_bootstrap(path_frame, "y", model="logreg")
+
+
+def test_countreg_cross_validation(health_df):
+    """
+    Test the count regression pipeline can be cross-validated
+    """
+    sk_model, _ = aa.arid_countreg(health_df, "numvisit", cv=3,
+                                   engine="sklearn")
+    assert len(sk_model.cv_results_) == 3
+    assert sk_model.cv_results_["test_size"].sum() == len(health_df)
+
+
+@pytest.mark.parametrize("model", ["additive", "interactive"])
+def test_countreg_aggregate(health_df, model):
+    """
+    Test fits on aggregated covariate patterns keep the coefficients
+    """
+    sk_model, glm_model = aa.arid_countreg(health_df, "numvisit",
+                                           model=model)
+    sk_agg, glm_agg = aa.arid_countreg(health_df, "numvisit", model=model,
+                                       aggregate=True)
+    assert glm_agg.nobs < glm_model.nobs
+    np.testing.assert_allclose(glm_agg.params, glm_model.params, rtol=1e-6)
+    np.testing.assert_allclose(glm_agg.bse, glm_model.bse, rtol=1e-6)
+    np.testing.assert_allclose(sk_agg[-1].coef_, sk_model[-1].coef_,
+                               rtol=1e-6, atol=1e-10)
+    assert sk_agg[-1].intercept_ == pytest.approx(sk_model[-1].intercept_)
+
+
+def test_regressor_cache(health_df, capsys):
+    """
+    Test repeated fits are returned from the cache without refitting
+    """
+    cache = caching.ResultCache()
+    first = aa.arid_countreg(health_df, "numvisit", cache=cache)
+    capsys.readouterr()
+    second = aa.arid_countreg(health_df, "numvisit", cache=cache)
+    assert second is first and cache.hits == 1
+    assert capsys.readouterr().out == ""
+    aa.arid_countreg(health_df, "numvisit", alpha=2, cache=cache)
+    assert cache.misses == 2
+
+    models = aa.arid_linreg(health_df, "numvisit", ["age"], cache=cache)
+    assert aa.arid_linreg(health_df, "numvisit", ["age"], n_jobs=2,
+                          cache=cache) is models
+    with pytest.raises(AssertionError):
+        aa.arid_linreg(health_df, "numvisit", cache="yes")
+
+
+def test_quiet_result(health_df, capsys):
+    """
+    Test verbose=False formats nothing and records the warnings
+    """
+    import pickle
+    import warnings
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        # The response is object or category depending on the pandas version
+        codes = pd.factorize(health_df["badh"], sort=True)[0]
+        result = aa.arid_logreg(health_df.assign(badh=codes), "badh",
+                                verbose=False)
+    assert capsys.readouterr().out == ""
+    assert result.features == ["numvisit", "age"]
+    assert len(result.warnings) == 0
+    assert result._summary is None
+    assert "coef" in str(result.summary())
+    skl_model, sm_model = result
+    assert result[0] is skl_model and result[1] is sm_model
+    assert list(result.coef_table.columns) == ["statsmodels", "sklearn"]
+
+    result = aa.arid_linreg(health_df, "numvisit", verbose=False)
+    assert capsys.readouterr().out == ""
+    assert "non-numeric" in str(result.warnings[0])
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored.features == result.features == ["age"]
+    with pytest.warns(UserWarning):
+        aa.arid_linreg(health_df, "numvisit")
+
+
+def test_countreg_sparse(health_df):
+    """
+    Test the sparse design fits the additive model of the dense path
+    """
+    _, glm_model = aa.arid_countreg(health_df, "numvisit",
+                                    engine="statsmodels")
+    sk_model, sparse_model = aa.arid_countreg(health_df, "numvisit",
+                                              sparse=True)
+    np.testing.assert_allclose(sparse_model.params, glm_model.params,
+                               rtol=1e-6)
+    np.testing.assert_allclose(sparse_model.bse, glm_model.bse, rtol=1e-6)
+    assert sk_model.predict(health_df).shape == (len(health_df),)
+    with pytest.raises(AssertionError):
+        aa.arid_countreg(health_df, "numvisit", model="interactive",
+                         sparse=True)
+
+    # Both paths take the first observed level as the reference
+    tdf = health_df.assign(badh=pd.Categorical(
+        health_df["badh"], categories=["unseen", "bad", "good"]
+    ))
+    _, glm_model = aa.arid_countreg(tdf, "numvisit", engine="statsmodels",
+                                    verbose=False)
+    _, sparse_model = aa.arid_countreg(tdf, "numvisit", sparse=True,
+                                       verbose=False)
+    assert list(sparse_model.params.index) == list(glm_model.params.index)
+    assert "C(badh)[T.good]" in glm_model.params.index
+    # The unobserved level is NaN in the sparse fit and zero in the GLM
+    observed = sparse_model.params.dropna()
+    assert list(observed.index) != list(glm_model.params.index)
+    np.testing.assert_allclose(observed, glm_model.params[observed.index],
+                               rtol=1e-6)
+
+
+@pytest.mark.parametrize("model", ["additive", "interactive"])
+def test_countreg_categorical_only(model):
+    """
+    Test a frame with only a categorical feature fits the formula model
+    """
+    import statsmodels.api as sm
+    import statsmodels.formula.api as smf
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"c": rng.choice(["x", "y", "z"], 300)})
+    df["y"] = rng.poisson(np.where(df["c"] == "x", 2, 5))
+    _, glm_model = aa.arid_countreg(df, "y", model=model, verbose=False)
+    expected = smf.glm("y ~ C(c)", data=df,
+                       family=sm.families.Poisson()).fit()
+    pd.testing.assert_series_equal(glm_model.params, expected.params)
+
+
+def test_slim_result(health_df):
+    """
+    Test slim=True drops the training data but keeps inference, prediction
+    and the summary, also after pickling
+    """
+    import pickle
+
+    full = aa.arid_countreg(health_df, "numvisit", verbose=False)
+    slim = aa.arid_countreg(health_df, "numvisit", verbose=False, slim=True)
+    assert slim.statsmodel.model.data.frame is not health_df
+    size = len(pickle.dumps(slim))
+    assert size < len(pickle.dumps(full))
+    restored = pickle.loads(pickle.dumps(slim))
+    np.testing.assert_allclose(restored[1].bse, full[1].bse)
+    np.testing.assert_allclose(restored[1].predict(health_df),
+                               full[1].predict(health_df))
+    # The header of a summary holds the time it was rendered
+    assert str(restored.summary().tables[1]) == \
+        str(full.summary().tables[1])
+
+    for result in [
+        aa.arid_linreg(health_df, "numvisit", verbose=False, slim=True),
+        aa.arid_logreg(health_df.assign(
+            badh=pd.factorize(health_df["badh"], sort=True)[0]
+        ), "badh", verbose=False, slim=True),
+    ]:
+        assert result.statsmodel.model.exog is None
+        assert result.statsmodel.model.endog is None
+        assert "coef" in str(pickle.loads(pickle.dumps(result)).summary())
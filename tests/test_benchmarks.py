@@ -0,0 +1,40 @@
+import inspect
+
+import pytest
+
+from benchmarks import (bench_countreg, bench_eda, bench_linreg,
+                        bench_logreg, data)
+
+SUITES = [bench_countreg.CountregSuite,
+          bench_countreg.CountregInteractionSuite, bench_eda.EdaSuite,
+          bench_eda.EdaSampleSuite, bench_linreg.LinregSuite,
+          bench_logreg.LogregSuite]
+
+
+@pytest.mark.parametrize("suite", SUITES, ids=lambda suite: suite.__name__)
+def test_benchmarks_run(suite):
+    """
+    Test every benchmark runs on the smallest parameters
+    """
+    params = [values[0] for values in suite.params]
+    benchmark = suite()
+    benchmark.setup(*params)
+    for name, method in inspect.getmembers(benchmark, inspect.ismethod):
+        if name.startswith(("time_", "peakmem_")):
+            method(*params)
+        elif name.startswith("track_"):
+            assert method(*params) > 0
+
+
+def test_frame_generator():
+    """
+    Test the synthetic frames and the cell budget
+    """
+    df = data.make_frame(100, 3, 2, 7)
+    assert df.columns.tolist() == ["x0", "x1", "x2", "c0", "c1", "y",
+                                   "binary", "label", "count"]
+    assert df["c0"].cat.categories.size == 7
+    assert set(df["label"]) <= {0, 1, 2}
+    assert df.equals(data.make_frame(100, 3, 2, 7, seed=0))
+    with pytest.raises(NotImplementedError):
+        data.check_size(10 ** 7, 10 ** 4)
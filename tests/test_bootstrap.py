@@ -0,0 +1,71 @@
+from aridanalysis import bootstrap, solvers
+import numpy as np
+import statsmodels.api as sm
+
+
+def test_resample_weights():
+    """
+    Test every resample draws exactly n rows
+    """
+    weights = bootstrap.resample_weights(np.random.default_rng(0), 50, 7)
+    assert weights.shape == (7, 50)
+    np.testing.assert_array_equal(weights.sum(axis=1), 50)
+    jackknife = bootstrap.jackknife_weights(10, 5)
+    np.testing.assert_array_equal(jackknife.sum(axis=1), 8)
+
+
+def test_irls_batch_matches_statsmodels():
+    """
+    Test the batched solver reproduces weighted statsmodels fits
+    """
+    rng = np.random.default_rng(2)
+    X = np.column_stack([np.ones(300), rng.normal(size=(300, 2))])
+    counts = rng.poisson(np.exp(X @ [0.5, 0.3, -0.2]))
+    binary = (X @ [0.2, 1.0, -1.0] + rng.logistic(size=300) > 0) * 1.0
+    weights = bootstrap.resample_weights(rng, 300, 3)
+
+    for family, y, sm_family in [
+        ("gaussian", counts * 1.0, sm.families.Gaussian()),
+        ("poisson", counts, sm.families.Poisson()),
+        ("binomial", binary, sm.families.Binomial()),
+    ]:
+        params = solvers.glm_irls_batch(X, y, weights, family)
+        for b in range(3):
+            expected = sm.GLM(y, X, family=sm_family,
+                              freq_weights=weights[b]).fit().params
+            np.testing.assert_allclose(params[b], expected, rtol=1e-6,
+                                       atol=1e-8)
+
+
+def test_bootstrap_reproducible_across_workers():
+    """
+    Test replicates only depend on the seed, not on the number of workers
+    """
+    rng = np.random.default_rng(4)
+    X = np.column_stack([np.ones(100), rng.normal(size=100)])
+    y = X @ [1.0, 2.0] + rng.normal(size=100)
+    _, serial = bootstrap.bootstrap_params(X, y, "gaussian", n_boot=40,
+                                           seed=3, n_jobs=1)
+    _, pooled = bootstrap.bootstrap_params(X, y, "gaussian", n_boot=40,
+                                           seed=3, n_jobs=2)
+    np.testing.assert_array_equal(serial, pooled)
+
+
+def test_bootstrap_without_threadpoolctl(monkeypatch):
+    """
+    Test the serial path runs with the no-op thread limit used when
+    threadpoolctl is missing
+    """
+    from contextlib import nullcontext
+
+    rng = np.random.default_rng(4)
+    X = np.column_stack([np.ones(100), rng.normal(size=100)])
+    y = X @ [1.0, 2.0] + rng.normal(size=100)
+    _, expected = bootstrap.bootstrap_params(X, y, "gaussian", n_boot=20,
+                                             seed=3, n_jobs=1)
+    monkeypatch.setattr(bootstrap, "limit_threads",
+                        lambda threads: nullcontext())
+    _, replicates = bootstrap.bootstrap_params(X, y, "gaussian", n_boot=20,
+                                               seed=3, n_jobs=1)
+    np.testing.assert_array_equal(replicates, expected)
+    assert bootstrap._shared == {}
@@ -0,0 +1,48 @@
+from aridanalysis import caching
+import numpy as np
+import pandas as pd
+
+
+def test_fingerprint():
+    """
+    Test fingerprints follow the selected columns and the arguments
+    """
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": ["x", "y", "z"],
+                       "c": [1, 2, 3]})
+    key = caching.fingerprint(df, ["a", "b"], {"alpha": 1})
+    assert key == caching.fingerprint(df.copy(), ["a", "b"], {"alpha": 1})
+    assert key != caching.fingerprint(df, ["a", "b"], {"alpha": 2})
+    assert key != caching.fingerprint(df.iloc[::-1], ["a", "b"], {"alpha": 1})
+    changed = df.assign(b=["x", "y", "w"])
+    assert key != caching.fingerprint(changed, ["a", "b"], {"alpha": 1})
+    # Unselected columns do not matter
+    assert key == caching.fingerprint(df.assign(c=0), ["a", "b"],
+                                      {"alpha": 1})
+
+
+def test_fingerprint_versions(monkeypatch):
+    """
+    Test fingerprints change with the package version
+    """
+    import aridanalysis
+
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    key = caching.fingerprint(df, ["a"], {"alpha": 1})
+    monkeypatch.setattr(aridanalysis, "__version__", "0.0.0")
+    assert key != caching.fingerprint(df, ["a"], {"alpha": 1})
+
+
+def test_result_cache_eviction(tmp_path):
+    """
+    Test the memory store evicts by size and the disk store persists
+    """
+    cache = caching.ResultCache(max_bytes=2500, directory=str(tmp_path))
+    for key in ["a", "b", "c"]:
+        cache.put(key, np.zeros(100))
+    assert len(cache) == 2 and cache.nbytes <= 2500
+    assert cache.get("b") is not None and cache.hits == 1
+
+    # The evicted entry is reloaded from disk
+    fresh = caching.ResultCache(directory=str(tmp_path))
+    np.testing.assert_array_equal(fresh.get("a"), np.zeros(100))
+    assert fresh.get("d") is None and fresh.misses == 1
@@ -0,0 +1,42 @@
+from aridanalysis import compression
+import numpy as np
+import pandas as pd
+import statsmodels.api as sm
+
+
+def test_compress_rows():
+    """
+    Test duplicate rows collapse into counts in order of first appearance
+    """
+    X = pd.DataFrame({"a": [1, 1, 2, 1, 2], "b": ["x", "x", "y", "x", "y"]})
+    y = pd.Series([0, 0, 1, 1, 1])
+    X_c, y_c, counts = compression.compress_rows(X, y)
+    assert X_c.index.tolist() == [0, 2, 3]
+    assert y_c.tolist() == [0, 1, 1]
+    np.testing.assert_array_equal(counts, [2, 2, 1])
+
+
+def test_weighted_models_match_expanded_data():
+    """
+    Test frequency-weighted fits reproduce fits on the repeated rows
+    """
+    rng = np.random.default_rng(6)
+    X = pd.DataFrame({"const": 1.0, "a": rng.integers(0, 4, 400) * 1.0})
+    binary = pd.Series((X["a"] - 1.5 + rng.logistic(size=400) > 0) * 1,
+                       name="y")
+    classes = pd.Series(np.digitize(X["a"] + rng.logistic(size=400),
+                                    [1, 2.5]), name="y")
+
+    for model, weighted, y in [
+        (sm.Logit, compression.WeightedLogit, binary),
+        (sm.MNLogit, compression.WeightedMNLogit, classes),
+    ]:
+        expected = model(y, X).fit(disp=0)
+        X_c, y_c, counts = compression.compress_rows(X, y)
+        result = weighted(y_c, X_c, freq_weights=counts).fit(disp=0)
+        np.testing.assert_allclose(result.params, expected.params,
+                                   rtol=1e-6)
+        np.testing.assert_allclose(result.bse, expected.bse, rtol=1e-6)
+        for attribute in ["llf", "llnull", "nobs", "df_resid", "bic"]:
+            np.testing.assert_allclose(getattr(result, attribute),
+                                       getattr(expected, attribute))
@@ -0,0 +1,63 @@
+from aridanalysis import crossval
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import KFold, cross_val_score
+from sklearn.pipeline import make_pipeline
+
+
+def test_as_slice():
+    """
+    Test only consecutive runs of indices become slices
+    """
+    assert crossval.as_slice(np.arange(3, 7)) == slice(3, 7)
+    assert crossval.as_slice(np.array([5])) == slice(5, 6)
+    assert crossval.as_slice(np.array([1, 2, 4])) is None
+    assert crossval.as_slice(np.array([], dtype=int)) is None
+
+
+def test_weight_masked_folds_match_sklearn():
+    """
+    Test masked and sliced training sets score like copied subsets
+    """
+    rng = np.random.default_rng(8)
+    X = rng.normal(size=(120, 3))
+    y = X @ [1.0, 0.5, -1.0] + rng.normal(size=120)
+    for cv in [4, KFold(4, shuffle=True, random_state=1)]:
+        results = crossval.cross_validate(Ridge(1.0), X, y, cv, n_jobs=2)
+        expected = cross_val_score(Ridge(1.0), X, y, cv=cv)
+        np.testing.assert_allclose(results["score"], expected)
+        assert results.columns.tolist() == ["train_size", "test_size",
+                                            "score", "fit_time",
+                                            "score_time"]
+
+
+class _RecordingTransformer(BaseEstimator, TransformerMixin):
+    """
+    Pass features through, recording the number of rows of every fit.
+    """
+    fitted_rows = []
+
+    def fit(self, X, y=None):
+        _RecordingTransformer.fitted_rows.append(len(X))
+        return self
+
+    def transform(self, X):
+        return X
+
+
+def test_masked_folds_fit_transformers_on_training_rows():
+    """
+    Test pipeline transformers never see the test rows of a masked fold
+    """
+    rng = np.random.default_rng(9)
+    X = rng.normal(size=(90, 2))
+    y = X @ [1.0, -1.0] + rng.normal(size=90)
+    pipeline = make_pipeline(_RecordingTransformer(), Ridge(1.0))
+    cv = KFold(3, shuffle=True, random_state=2)
+    _RecordingTransformer.fitted_rows.clear()
+    results = crossval.cross_validate(pipeline, X, y, cv, n_jobs=1,
+                                      weight_param="ridge__sample_weight")
+    assert _RecordingTransformer.fitted_rows == [60, 60, 60]
+    np.testing.assert_allclose(results["score"],
+                               cross_val_score(pipeline, X, y, cv=cv))
@@ -0,0 +1,132 @@
+from aridanalysis import design, solvers
+import numpy as np
+import pandas as pd
+import patsy
+import pytest
+import statsmodels.api as sm
+import statsmodels.formula.api as smf
+
+
+def count_frame():
+    """
+    Create count data with a many-level and a categorical-dtype feature
+    """
+    rng = np.random.default_rng(5)
+    n = 600
+    df = pd.DataFrame({
+        "a": rng.normal(size=n),
+        "g": rng.choice([f"l{i}" for i in range(40)], n),
+        "h": pd.Categorical(rng.choice(["p", "q", "r"], n),
+                            categories=["r", "q", "p"]),
+    })
+    df["y"] = rng.poisson(np.exp(0.3 * df["a"] + (df["h"] == "p")))
+    return df
+
+
+def test_sparse_design_matches_patsy():
+    """
+    Test the sparse design reproduces patsy's additive design
+    """
+    df = count_frame()
+    builder = design.SparseDesign(["a"], ["g", "h"]).fit(df)
+    expected = patsy.dmatrix("a + C(g) + C(h)", df, return_type="dataframe")
+    X = builder.transform(df)
+    assert X.format == "csr"
+    assert builder.feature_names_ == expected.columns.tolist()
+    np.testing.assert_array_equal(X.toarray(), expected.to_numpy())
+    assert builder.without_intercept().transform(df).shape[1] == \
+        X.shape[1] - 1
+
+
+def test_sparse_poisson_matches_glm():
+    """
+    Test sparse IRLS reproduces the statsmodels Poisson GLM
+    """
+    df = count_frame()
+    builder = design.SparseDesign(["a"], ["g", "h"]).fit(df)
+    results = solvers.poisson_irls_sparse(builder.transform(df), df["y"],
+                                          builder.feature_names_,
+                                          design=builder)
+    expected = smf.glm("y ~ a + C(g) + C(h)", data=df,
+                       family=sm.families.Poisson()).fit()
+    np.testing.assert_allclose(results.params, expected.params, rtol=1e-6,
+                               atol=1e-8)
+    np.testing.assert_allclose(results.bse, expected.bse, rtol=1e-6)
+    assert results.llf == pytest.approx(expected.llf)
+    assert results.df_resid == expected.df_resid
+    np.testing.assert_allclose(results.predict(df), expected.predict(df),
+                               rtol=1e-6)
+
+
+def test_sparse_poisson_many_levels():
+    """
+    Test sparse IRLS with an unobserved reference level, single-row levels
+    and levels without counts
+    """
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"a": rng.normal(size=3000),
+                       "g": rng.integers(1, 2000, 3000)})
+    df["y"] = rng.poisson(np.exp(0.2 * df["a"]))
+    df["g"] = pd.Categorical(df["g"], categories=range(2000))
+    builder = design.SparseDesign(["a"], ["g"]).fit(df)
+    assert builder.levels_["g"][0] == df["g"].cat.codes.min()
+    X = builder.transform(df)
+    results = solvers.poisson_irls_sparse(X, df["y"], builder.feature_names_)
+    X = X[:, X.getnnz(axis=0) > 0]
+    np.testing.assert_allclose(solvers.sparse_solve(X.T @ X, X.T @ df["y"]),
+                               np.linalg.solve((X.T @ X).toarray(),
+                                               X.T @ df["y"]))
+    assert np.isfinite(results.params["a"])
+    assert results.params["a"] == pytest.approx(0.2, abs=0.05)
+
+
+@pytest.mark.parametrize("model", ["additive", "interactive"])
+def test_countreg_design_matches_formula(model):
+    """
+    Test the compiled design reproduces the formula fit and is reused
+    """
+    df = count_frame()
+    df.loc[3, "a"] = np.nan
+    spec = design.countreg_design(df, "y", ["a"], ["g", "h"], model)
+    assert design.countreg_design(df.iloc[::-1], "y", ["a"], ["g", "h"],
+                                  model) is spec
+    results = spec.glm(df, sm.families.Poisson()).fit()
+    expected = smf.glm(spec.formula, data=df,
+                       family=sm.families.Poisson()).fit()
+    assert results.nobs == expected.nobs == len(df) - 1
+    pd.testing.assert_series_equal(results.params, expected.params)
+    np.testing.assert_allclose(results.predict(df.head()),
+                               expected.predict(df.head()))
+
+
+@pytest.mark.parametrize("model", ["additive", "interactive"])
+def test_numpy_design_matches_patsy(model):
+    """
+    Test the NumPy design builder reproduces patsy's matrices
+    """
+    df = count_frame()
+    df["b"] = np.random.default_rng(6).normal(size=len(df))
+    df.loc[3, "a"] = np.nan
+    df.loc[7, "g"] = None
+    spec = design.countreg_design(df, "y", ["a", "b"], ["g", "h"], model)
+    y, X, missing = spec.matrices(df)
+    y_patsy, X_patsy, missing_patsy = spec.matrices(df, engine="patsy")
+    pd.testing.assert_frame_equal(y, y_patsy)
+    pd.testing.assert_frame_equal(X, X_patsy)
+    np.testing.assert_array_equal(missing, missing_patsy)
+
+
+def test_wide_interactive_design():
+    """
+    Test wide interactive formulas compile without patsy's parser
+    """
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(rng.normal(size=(50, 30)),
+                      columns=[f"x{i}" for i in range(30)])
+    df["g"] = rng.choice(["a", "b"], 50)
+    df["y"] = rng.poisson(1, 50)
+    spec = design.countreg_design(df, "y", [f"x{i}" for i in range(30)],
+                                  ["g"], "interactive")
+    assert len(spec.column_names) == 1 + 30 + 1 + 30 + 435
+    assert "x0:C(g)[T.b]" in spec.column_names
+    assert spec.matrices(df)[1].shape == (50, len(spec.column_names))
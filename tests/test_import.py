@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+
+def loaded_modules(code):
+    """
+    Run code in a fresh interpreter and return the top-level modules loaded
+    """
+    script = code + "\nimport sys\nprint(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", script],
+                         capture_output=True, text=True, check=True)
+    return {name.split(".")[0] for name in out.stdout.split()}
+
+
+def test_import_is_lazy():
+    """
+    Test importing the package does not load plotting or modelling libraries
+    """
+    modules = loaded_modules("import aridanalysis\n"
+                             "from aridanalysis import aridanalysis")
+    assert "altair" not in modules
+    assert "statsmodels" not in modules
+    assert "sklearn" not in modules
+
+
+def test_regression_does_not_load_altair():
+    """
+    Test regression-only usage never imports altair
+    """
+    modules = loaded_modules(
+        "import pandas as pd\n"
+        "import aridanalysis as aa\n"
+        "df = pd.DataFrame({'x': [1.0, 2.0, 4.0], 'y': [1.0, 3.0, 2.0]})\n"
+        "aa.arid_linreg(df, 'y')"
+    )
+    assert "statsmodels" in modules
+    assert "altair" not in modules
+
+
+def test_eda_does_not_load_statsmodels():
+    """
+    Test EDA-only usage never imports statsmodels or sklearn
+    """
+    modules = loaded_modules(
+        "import pandas as pd\n"
+        "import aridanalysis as aa\n"
+        "df = pd.DataFrame({'x': [1.0, 2.0, 4.0], 'z': [2.0, 1.0, 0.0],\n"
+        "                   'y': ['a', 'b', 'a']})\n"
+        "aa.arid_eda(df, 'y', 'categorical', ['x', 'z'])"
+    )
+    assert "altair" in modules
+    assert "statsmodels" not in modules
+    assert "sklearn" not in modules
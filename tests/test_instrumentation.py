@@ -0,0 +1,76 @@
+from aridanalysis import aridanalysis as aa
+from aridanalysis import instrumentation
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def count_df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.normal(size=200), "b": rng.normal(size=200),
+                       "g": rng.choice(["x", "y", "z"], 200)})
+    df["y"] = rng.poisson(np.exp(0.3 * df["a"]))
+    df["label"] = (df["a"] + rng.normal(size=200) > 0).astype(int)
+    return df
+
+
+def test_disabled_spans_are_shared():
+    """
+    Test spans are no-ops without listeners
+    """
+    assert instrumentation.span("a", rows=1) is instrumentation.span("b")
+    received = []
+    with instrumentation.listening(received.append):
+        with instrumentation.span("stage", rows=3) as stage:
+            stage.record(columns=2)
+    assert len(received) == 1
+    assert received[0].name == "stage"
+    assert received[0].sizes == {"rows": 3, "columns": 2}
+    assert received[0].duration >= 0
+    assert instrumentation._listeners == ()
+
+
+def test_entry_point_stages(count_df):
+    """
+    Test every entry point emits its stages, with sizes
+    """
+    received = []
+    with instrumentation.listening(received.append):
+        aa.arid_linreg(count_df, "y", ["a", "b"], verbose=False)
+        aa.arid_logreg(count_df, "label", ["a", "b"], verbose=False)
+        aa.arid_countreg(count_df, "y", ["a"], ["g"], verbose=False)
+        aa.arid_eda(count_df, "y", "continuous", ["a", "b"])
+    spans = {span.name: span for span in received}
+    for name in ["arid_linreg", "arid_linreg.validate",
+                 "arid_linreg.features", "arid_linreg.design",
+                 "arid_linreg.ols_fit", "arid_logreg.sklearn_fit",
+                 "arid_logreg.statsmodels_fit", "arid_countreg.design",
+                 "arid_countreg.sklearn_fit",
+                 "arid_countreg.statsmodels_fit", "arid_eda.summary",
+                 "arid_eda.charts", "arid_eda.correlation", "arid_eda"]:
+        assert name in spans
+    assert spans["arid_linreg.design"].sizes == {"rows": 200, "columns": 2}
+    assert spans["arid_countreg.design"].sizes["design_columns"] == 4
+    # Stages finish before the call that contains them
+    assert received.index(spans["arid_linreg.ols_fit"]) < \
+        received.index(spans["arid_linreg"])
+
+
+def test_span_stats(count_df):
+    """
+    Test the aggregator reports percentiles across calls
+    """
+    with instrumentation.listening() as stats:
+        for _ in range(5):
+            aa.arid_linreg(count_df, "y", ["a", "b"], verbose=False)
+    report = stats.report()
+    assert report.loc["arid_linreg", "count"] == 5
+    assert report.columns.tolist() == ["count", "total", "p50", "p95"]
+    assert (report["p50"] <= report["p95"]).all()
+    np.testing.assert_allclose(
+        report.loc["arid_linreg.ols_fit", "p50"],
+        np.median(stats.durations["arid_linreg.ols_fit"])
+    )
+    stats.clear()
+    assert len(stats.report()) == 0
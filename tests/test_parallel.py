@@ -0,0 +1,70 @@
+from aridanalysis import parallel
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.mark.skipif(parallel.shared_memory is None,
+                    reason="shared memory needs Python 3.8")
+def test_shared_frame_round_trip():
+    """
+    Test every column type survives the trip through shared memory
+    """
+    df = pd.DataFrame(
+        {
+            "num": [1.5, np.nan, 3.0, 4.0],
+            "int": [1, 2, 3, 4],
+            "flag": [True, False, True, False],
+            "text": ["a", None, "b", "a"],
+            "cat": pd.Categorical(["x", "y", "x", None],
+                                  categories=["x", "y", "z"]),
+            "nullable": pd.array([1, None, 3, 4], dtype="Int64"),
+        },
+        index=[10, 20, 30, 40],
+    )
+    order = np.array([3, 1, 0, 2])
+    shm, layout = parallel.share_frame(df, order)
+    try:
+        out = parallel.read_frame(shm.buf, layout, len(order), 1, 4)
+    finally:
+        shm.close()
+        shm.unlink()
+    pd.testing.assert_frame_equal(out, df.take(order[1:4]))
+
+
+def test_fit_groups_in_process_and_pool():
+    """
+    Test per-group fits agree between the worker pool and the current process
+    """
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({"g": rng.choice(["b", "a", "c"], 300),
+                       "x1": rng.normal(size=300),
+                       "x2": rng.normal(size=300)})
+    df["y"] = df["x1"] - 2 * df["x2"] + rng.normal(size=300)
+    kwargs = dict(response="y", features=[], regularization=None, alpha=1,
+                  engine="both")
+    serial, serial_table = parallel.fit_groups("arid_linreg", df, "g",
+                                               kwargs, n_jobs=1)
+    pooled, pooled_table = parallel.fit_groups("arid_linreg", df, "g",
+                                               kwargs, n_jobs=2)
+    assert list(serial) == list(pooled) == ["a", "b", "c"]
+    pd.testing.assert_frame_equal(serial_table, pooled_table)
+    assert serial_table.index.names == ["g", "engine"]
+    assert serial_table.columns.tolist() == ["x1", "x2"]
+
+
+def test_transformed_names_fallback():
+    """
+    Test feature names resolve without get_feature_names_out, as on
+    scikit-learn < 1.0
+    """
+    class Encoder:
+        def get_feature_names(self):
+            return ["a_x", "a_y"]
+
+    class OldPipeline:
+        steps = [("encoder", Encoder())]
+
+    assert parallel._transformed_names(OldPipeline()) == ["a_x", "a_y"]
+    OldPipeline.steps = [("scaler", object())]
+    assert parallel._transformed_names(OldPipeline()) is None
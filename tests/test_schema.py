@@ -0,0 +1,87 @@
+import tracemalloc
+
+from aridanalysis import schema
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def mixed_df():
+    n = 50000
+    return pd.DataFrame({
+        "y": np.arange(n, dtype=np.float64),
+        "a": np.arange(n),
+        "b": np.linspace(0, 1, n),
+        "flag": np.ones(n, dtype=bool),
+        "name": ["x"] * n,
+        "group": pd.Categorical(["p", "q"] * (n // 2)),
+        "count": pd.array(np.arange(n), dtype="Int64"),
+    })
+
+
+def test_feature_resolution_matches_select_dtypes(mixed_df):
+    """
+    Test the schema-only selection matches selecting on the dropped frame
+    """
+    expected = mixed_df.drop(columns="y").select_dtypes("number")
+    with pytest.warns(UserWarning, match="non-numeric"):
+        assert schema.numeric_features(mixed_df, "y", []) == \
+            expected.columns.tolist()
+    with pytest.warns(UserWarning, match="not present"):
+        assert schema.numeric_features(mixed_df, ["y", "a"],
+                                       ["b", "name"]) == ["b"]
+    assert schema.countreg_features(mixed_df, "a", [], []) == (
+        ["y", "b", "count"], ["name", "group"]
+    )
+
+
+def test_feature_resolution_copies_nothing(mixed_df):
+    """
+    Test resolving features allocates a small fraction of the frame
+    """
+    tracemalloc.start()
+    with pytest.warns(UserWarning):
+        schema.numeric_features(mixed_df, "y", [])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 0.05 * mixed_df.memory_usage().sum()
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_float_frame(mixed_df, order):
+    """
+    Test the feature block is built once in the requested layout
+    """
+    columns = ["a", "b", "count"]
+    mixed_df.loc[3, "count"] = pd.NA
+    tracemalloc.start()
+    X = schema.float_frame(mixed_df, columns, order=order)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    values = X.to_numpy()
+    assert values.flags[f"{order}_CONTIGUOUS"]
+    assert values.dtype == np.float64
+    # The frame shares the array, which is the only full-size allocation
+    assert np.shares_memory(values, X.to_numpy())
+    assert peak < 1.5 * values.nbytes
+    expected = mixed_df[columns].astype(np.float64)
+    np.testing.assert_array_equal(values, expected.to_numpy())
+    assert np.isnan(values[3, 2])
+
+
+def test_float32_frames(mixed_df):
+    """
+    Test float32 blocks are cast column by column and upcast only once
+    """
+    columns = ["name", "a", "b"]
+    frame = schema.cast_frame(mixed_df, columns, np.float32)
+    assert frame.columns.tolist() == columns
+    assert frame["name"].equals(mixed_df["name"])
+    assert (frame.dtypes[["a", "b"]] == np.float32).all()
+
+    X = schema.float_frame(mixed_df, ["a", "b"], order="F", dtype="float32")
+    X64 = schema.float64_frame(X)
+    assert X64.to_numpy().flags["F_CONTIGUOUS"]
+    np.testing.assert_allclose(X64, mixed_df[["a", "b"]], rtol=1e-6)
+    assert schema.float64_frame(X64) is X64
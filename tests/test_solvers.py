@@ -0,0 +1,64 @@
+from aridanalysis import solvers
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+from sklearn.linear_model import LinearRegression
+
+
+@pytest.fixture
+def design():
+    """
+    Create a regression design with dummy columns summing to a constant
+    """
+    rng = np.random.default_rng(3)
+    X = pd.DataFrame(rng.normal(size=(200, 3)), columns=["a", "b", "c"])
+    X["d1"] = (rng.random(200) > 0.5).astype(float)
+    X["d2"] = 1 - X["d1"]
+    y = pd.Series(X @ [1.0, -2.0, 0.5, 3.0, 1.0] + rng.normal(size=200))
+    return X, y
+
+
+def test_fit_ols_matches_separate_fits(design):
+    """
+    Test the shared factorization reproduces both libraries' results
+    """
+    X, y = design
+    skl_model, sm_model = solvers.fit_ols(X, y)
+    expected_skl = LinearRegression(fit_intercept=False).fit(X, y)
+    expected_sm = sm.OLS(y, X).fit()
+
+    np.testing.assert_allclose(skl_model.coef_, expected_skl.coef_)
+    np.testing.assert_allclose(skl_model.predict(X), expected_skl.predict(X))
+    assert skl_model.rank_ == expected_skl.rank_
+    np.testing.assert_allclose(sm_model.params, expected_sm.params)
+    np.testing.assert_allclose(sm_model.bse, expected_sm.bse)
+    assert sm_model.df_model == expected_sm.df_model
+    assert sm_model.rsquared == pytest.approx(expected_sm.rsquared)
+    assert sm_model.model.k_constant == expected_sm.model.k_constant == 1
+
+
+def test_factorization_without_constant(design):
+    """
+    Test designs without a constant in their span are detected
+    """
+    X, y = design
+    factorization = solvers.OLSFactorization(X[["a", "b"]])
+    expected = sm.OLS(y, X[["a", "b"]]).fit()
+    assert not factorization.has_constant
+    assert expected.model.k_constant == 0
+    np.testing.assert_allclose(factorization.solve(y), expected.params)
+
+
+def test_factorization_large_features():
+    """
+    Test constant detection does not depend on the scale of the features
+    """
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(10000, 2)) * 1e9, columns=["a", "b"])
+    y = X @ [1.0, 2.0] + rng.normal(size=10000) * 1e9
+    _, sm_model = solvers.fit_ols(X, y)
+    expected = sm.OLS(y, X).fit()
+    assert sm_model.model.k_constant == expected.model.k_constant == 0
+    assert sm_model.rsquared == pytest.approx(expected.rsquared)
+    assert sm_model.fvalue == pytest.approx(expected.fvalue)
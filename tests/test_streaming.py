@@ -0,0 +1,171 @@
+from aridanalysis import aridanalysis as aa
+from aridanalysis import streaming
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def chunked_frame():
+    """
+    Create a numeric dataframe with a categorical response
+    """
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame({"x1": rng.normal(10, 3, size=5000),
+                       "x2": rng.exponential(2, size=5000),
+                       "y": rng.choice(["a", "b", "c"], size=5000)})
+    df.loc[::17, "x2"] = np.nan
+    return df
+
+
+def test_moment_accumulator_merge(chunked_frame):
+    """
+    Test chunked and merged moments match the full-data statistics
+    """
+    values = chunked_frame[["x1", "x2"]].to_numpy()
+    left = streaming.MomentAccumulator(2)
+    right = streaming.MomentAccumulator(2)
+    for chunk in np.array_split(values[:3000], 7):
+        left.update(chunk)
+    right.update(values[3000:])
+    left.merge(right)
+
+    expected = chunked_frame[["x1", "x2"]]
+    np.testing.assert_allclose(left.count, expected.count())
+    np.testing.assert_allclose(left.mean, expected.mean())
+    np.testing.assert_allclose(left.std, expected.std())
+    np.testing.assert_allclose(left.min, expected.min())
+    np.testing.assert_allclose(left.max, expected.max())
+
+
+def test_quantile_sketch_accuracy(chunked_frame):
+    """
+    Test sketch quantiles are exact before compression and close after
+    """
+    small = streaming.QuantileSketch(capacity=1000)
+    small.update(chunked_frame["x1"][:500])
+    np.testing.assert_allclose(small.quantile([0.25, 0.5, 0.75]),
+                               chunked_frame["x1"][:500].quantile(
+                                   [0.25, 0.5, 0.75]))
+
+    sketch = streaming.QuantileSketch(capacity=200)
+    for chunk in np.array_split(chunked_frame["x1"].to_numpy(), 10):
+        sketch.update(chunk)
+    assert len(sketch.means) <= 400
+    expected = chunked_frame["x1"].quantile([0.1, 0.5, 0.9]).to_numpy()
+    np.testing.assert_allclose(sketch.quantile([0.1, 0.5, 0.9]), expected,
+                               rtol=0.02)
+
+
+def test_histogram_accumulator_grows_range():
+    """
+    Test the histogram widens its range without losing counts
+    """
+    hist = streaming.HistogramAccumulator(bins=64)
+    hist.update(np.linspace(0, 1, 100))
+    hist.update(np.linspace(-50, 200, 100))
+    assert hist.counts.sum() == 200
+    assert hist.start <= -50 and hist.stop > 200
+    assert len(hist.counts) == 64
+
+
+def test_arideda_chunked_input(chunked_frame):
+    """
+    Test arid_eda accepts an iterator of chunks and summarizes in one pass
+    """
+    chunks = (chunked_frame.iloc[i:i + 700]
+              for i in range(0, len(chunked_frame), 700))
+    out, plots = aa.arid_eda(chunks, "y", "categorical", ["x1", "x2"])
+    expected = chunked_frame[["x1", "x2"]].describe()
+    assert list(out.index) == list(expected.index)
+    np.testing.assert_allclose(out.loc[["count", "mean", "std", "min",
+                                        "max"]],
+                               expected.loc[["count", "mean", "std", "min",
+                                             "max"]])
+    np.testing.assert_allclose(out.loc[["25%", "50%", "75%"]],
+                               expected.loc[["25%", "50%", "75%"]],
+                               rtol=0.05)
+    density_df = plots.hconcat[0].data
+    assert set(density_df["y"]) == {"a", "b", "c"}
+
+
+def test_stratified_reservoir(chunked_frame):
+    """
+    Test rare classes are kept whole and the budget is shared by the rest
+    """
+    df = chunked_frame.assign(y=np.where(np.arange(5000) < 40, "rare",
+                                         chunked_frame["y"]))
+    reservoir = streaming.StratifiedReservoir(300, "y", seed=0)
+    for start in range(0, len(df), 700):
+        reservoir.update(df.iloc[start:start + 700])
+    sample = reservoir.sample
+    counts = sample["y"].value_counts()
+    assert len(sample) == 300 and reservoir.seen == 5000
+    assert counts["rare"] == 40
+    assert counts.drop("rare").max() - counts.drop("rare").min() <= 1
+    # Every sampled row is an original row
+    pd.testing.assert_frame_equal(sample, df.loc[sample.index])
+
+
+def test_stratified_reservoir_many_classes():
+    """
+    Test missing responses form a stratum and many classes stay bounded
+    """
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({"x": rng.normal(size=20000),
+                       "y": rng.integers(0, 3000, 20000).astype(float)})
+    df.loc[:99, "y"] = np.nan
+    reservoir = streaming.StratifiedReservoir(4000, "y", seed=0)
+    for start in range(0, len(df), 3000):
+        reservoir.update(df.iloc[start:start + 3000])
+        # No class holds more rows than the largest quota it could get
+        assert len(reservoir.rows) <= 4000 + len(reservoir.labels)
+    sample = reservoir.sample
+    assert len(sample) == 4000
+    assert sample["y"].isna().sum() == reservoir.quotas()[None] > 0
+
+
+def test_sample_frame(chunked_frame):
+    """
+    Test one-pass uniform samples keep the budget and small frames whole
+    """
+    sample = streaming.sample_frame(chunked_frame, ["x1", "y"], 500, seed=1)
+    assert len(sample) == 500 and list(sample.columns) == ["x1", "y"]
+    assert sample.index.is_unique
+    assert abs(sample["x1"].mean() - chunked_frame["x1"].mean()) < 0.5
+    whole = streaming.sample_frame(chunked_frame, ["x1"], 5000)
+    assert len(whole) == 5000
+
+
+def test_density_frames_all_missing_feature(chunked_frame):
+    """
+    Test a feature without any observed value gets an empty density table
+    """
+    df = chunked_frame.assign(x2=np.nan)
+    chunks = (df.iloc[i:i + 700] for i in range(0, len(df), 700))
+    out, plots = aa.arid_eda(chunks, "y", "categorical", ["x1", "x2"])
+    assert out.loc["count", "x2"] == 0
+    summary = streaming.summarize_chunks(
+        (df.iloc[i:i + 700] for i in range(0, len(df), 700)),
+        "y", "categorical", ["x1", "x2"])
+    frames = streaming.density_frames(summary, ["x1", "x2"], "y")
+    assert len(frames["x2"]) == 0
+    assert list(frames["x2"].columns) == ["y", "x2", "density"]
+    assert np.isfinite(frames["x1"]["x1"]).all()
+
+
+def test_arideda_chunked_infinite_values(chunked_frame):
+    """
+    Test infinite feature values are ignored by the chunked summaries
+    """
+    df = chunked_frame.copy()
+    df.loc[3, "x1"] = np.inf
+    df.loc[1000, "x1"] = -np.inf
+    acc = streaming.HistogramAccumulator(16).update([1, 2, np.inf])
+    assert acc.counts.sum() == 2
+    out, _ = aa.arid_eda(iter([df.iloc[:3], df.iloc[3:]]), "y",
+                         "categorical", ["x1", "x2"])
+    finite = df["x1"].replace([np.inf, -np.inf], np.nan)
+    assert out.loc["count", "x1"] == len(df) - 2
+    np.testing.assert_allclose(out.loc[["mean", "min", "max"], "x1"],
+                               [finite.mean(), finite.min(), finite.max()])